@@ -9,7 +9,9 @@ from alembic import context
 from app.database import Base
 from app.models import (
     Store, Table, TableSession, Category, Menu, 
-    Order, OrderItem, Admin, OrderHistory
+    Order, OrderItem, Admin, OrderHistory, OrderSequence,
+    ArchivedOrder, ArchivedOrderItem, ArchivedOrderHistory,
+    DailySales, DailyMenuSales, OrderChange, BrokerEvent
 )
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,29 @@
+"""add order pagination indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Composite indexes for keyset pagination on (created_at, id)
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False)
+    op.create_index('ix_orders_status_created_at_id', 'orders', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_session_id_created_at_id', 'orders', ['session_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_orders_session_id_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_status_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
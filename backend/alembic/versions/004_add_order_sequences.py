@@ -0,0 +1,64 @@
+"""add order sequences
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from datetime import datetime, timedelta
+from alembic import op
+import sqlalchemy as sa
+from app.utils.business_day import business_day_bounds, get_business_date
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Per-store daily order number counters
+    order_sequences = op.create_table(
+        'order_sequences',
+        sa.Column('store_id', sa.Integer(), nullable=False),
+        sa.Column('business_date', sa.Date(), nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ),
+        sa.PrimaryKeyConstraint('store_id', 'business_date')
+    )
+
+    # Continue today's numbering so new orders don't repeat numbers already
+    # issued. Orders used to be numbered per UTC day, so look at both today's
+    # UTC day and business day.
+    now = datetime.utcnow()
+    business_date = get_business_date(now)
+    start, end = business_day_bounds(business_date)
+    utc_start = datetime(now.year, now.month, now.day)
+    start, end = min(start, utc_start), max(end, utc_start + timedelta(days=1))
+
+    rows = op.get_bind().execute(sa.text("""
+        SELECT tables.store_id, orders.order_number
+        FROM orders
+        JOIN table_sessions ON table_sessions.id = orders.session_id
+        JOIN tables ON tables.id = table_sessions.table_id
+        WHERE orders.created_at >= :start AND orders.created_at < :end
+    """), {"start": start, "end": end}).all()
+
+    # Order numbers look like "#001" and may exceed three digits, so compare numerically
+    last_values = {}
+    for store_id, order_number in rows:
+        digits = order_number.lstrip('#')
+        if digits.isdigit():
+            last_values[store_id] = max(last_values.get(store_id, 0), int(digits))
+
+    if last_values:
+        op.bulk_insert(order_sequences, [
+            {'store_id': store_id, 'business_date': business_date, 'last_value': last_value}
+            for store_id, last_value in last_values.items()
+        ])
+
+
+def downgrade():
+    op.drop_table('order_sequences')
@@ -0,0 +1,53 @@
+"""add store scoping
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Denormalize the store onto orders so per-store queries need no joins
+    op.add_column('orders', sa.Column('store_id', sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE orders SET store_id = (
+            SELECT tables.store_id
+            FROM table_sessions JOIN tables ON tables.id = table_sessions.table_id
+            WHERE table_sessions.id = orders.session_id
+        )
+        """
+    )
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.alter_column('store_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_orders_store_id_stores', 'stores', ['store_id'], ['id'])
+
+    # Store-prefixed composite indexes replace the global pagination indexes
+    op.drop_index('ix_orders_status_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
+    op.create_index('ix_orders_store_id_created_at_id', 'orders', ['store_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_store_id_status_created_at_id', 'orders', ['store_id', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_categories_store_id_display_order', 'categories', ['store_id', 'display_order'], unique=False)
+    op.create_index('ix_tables_store_id_table_number', 'tables', ['store_id', 'table_number'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tables_store_id_table_number', table_name='tables')
+    op.drop_index('ix_categories_store_id_display_order', table_name='categories')
+    op.drop_index('ix_orders_store_id_status_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_store_id_created_at_id', table_name='orders')
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False)
+    op.create_index('ix_orders_status_created_at_id', 'orders', ['status', 'created_at', 'id'], unique=False)
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.drop_constraint('fk_orders_store_id_stores', type_='foreignkey')
+        batch_op.drop_column('store_id')
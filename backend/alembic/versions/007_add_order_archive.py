@@ -0,0 +1,79 @@
+"""add order archive
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Cold storage for orders of long-ended sessions, keyed by the original IDs
+    op.create_table(
+        'archived_orders',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('store_id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.Integer(), nullable=False),
+        sa.Column('order_number', sa.String(length=20), nullable=False),
+        sa.Column('subtotal_amount', sa.Integer(), nullable=False),
+        sa.Column('tip_rate', sa.Integer(), nullable=False),
+        sa.Column('tip_amount', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Integer(), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'PREPARING', 'READY', 'SERVED', 'CANCELLED', name='orderstatus'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_orders_store_id_created_at_id', 'archived_orders', ['store_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_archived_orders_session_id_created_at_id', 'archived_orders', ['session_id', 'created_at', 'id'], unique=False)
+
+    op.create_table(
+        'archived_order_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('menu_id', sa.Integer(), nullable=False),
+        sa.Column('menu_name', sa.String(length=100), nullable=False),
+        sa.Column('menu_price', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('subtotal', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['archived_orders.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_archived_order_items_order_id'), 'archived_order_items', ['order_id'], unique=False)
+
+    op.create_table(
+        'archived_order_history',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('old_status', sa.String(length=20), nullable=False),
+        sa.Column('new_status', sa.String(length=20), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['archived_orders.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_archived_order_history_order_id'), 'archived_order_history', ['order_id'], unique=False)
+
+    # The archiver looks for sessions that ended before the retention cutoff
+    op.create_index(op.f('ix_table_sessions_ended_at'), 'table_sessions', ['ended_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_table_sessions_ended_at'), table_name='table_sessions')
+    op.drop_index(op.f('ix_archived_order_history_order_id'), table_name='archived_order_history')
+    op.drop_table('archived_order_history')
+    op.drop_index(op.f('ix_archived_order_items_order_id'), table_name='archived_order_items')
+    op.drop_table('archived_order_items')
+    op.drop_index('ix_archived_orders_session_id_created_at_id', table_name='archived_orders')
+    op.drop_index('ix_archived_orders_store_id_created_at_id', table_name='archived_orders')
+    op.drop_table('archived_orders')
@@ -0,0 +1,48 @@
+"""add sales rollups
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Incremental reporting rollups; backfill with rebuild_sales_rollups.py
+    op.create_table(
+        'daily_sales',
+        sa.Column('store_id', sa.Integer(), nullable=False),
+        sa.Column('business_date', sa.Date(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('subtotal_amount', sa.Integer(), nullable=False),
+        sa.Column('tip_amount', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ),
+        sa.PrimaryKeyConstraint('store_id', 'business_date')
+    )
+    op.create_table(
+        'daily_menu_sales',
+        sa.Column('store_id', sa.Integer(), nullable=False),
+        sa.Column('business_date', sa.Date(), nullable=False),
+        sa.Column('menu_id', sa.Integer(), nullable=False),
+        sa.Column('menu_name', sa.String(length=100), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('subtotal_amount', sa.Integer(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ),
+        sa.PrimaryKeyConstraint('store_id', 'business_date', 'menu_id')
+    )
+
+
+def downgrade():
+    op.drop_table('daily_menu_sales')
+    op.drop_table('daily_sales')
@@ -0,0 +1,38 @@
+"""add order changes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Change log behind the admin "changes since" sync endpoint
+    op.create_table(
+        'order_changes',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('store_id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sqlite_autoincrement=True
+    )
+    op.create_index('ix_order_changes_store_id_id', 'order_changes', ['store_id', 'id'], unique=False)
+    op.create_index(op.f('ix_order_changes_order_id'), 'order_changes', ['order_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_order_changes_order_id'), table_name='order_changes')
+    op.drop_index('ix_order_changes_store_id_id', table_name='order_changes')
+    op.drop_table('order_changes')
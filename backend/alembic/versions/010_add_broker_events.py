@@ -0,0 +1,37 @@
+"""add broker events
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Relay table of the cross-process event broker (EVENT_BROKER=database)
+    op.create_table(
+        'broker_events',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('origin', sa.String(length=32), nullable=False),
+        sa.Column('store_id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('data', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sqlite_autoincrement=True
+    )
+    op.create_index(op.f('ix_broker_events_created_at'), 'broker_events', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_broker_events_created_at'), table_name='broker_events')
+    op.drop_table('broker_events')
@@ -0,0 +1,28 @@
+"""add menu image variants
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Resized image variants and inline placeholder of menu images
+    op.add_column('menus', sa.Column('image_variants', sa.JSON(), nullable=True))
+    op.add_column('menus', sa.Column('image_placeholder', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('menus') as batch_op:
+        batch_op.drop_column('image_placeholder')
+        batch_op.drop_column('image_variants')
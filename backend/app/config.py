@@ -5,6 +5,17 @@ from pydantic import ConfigDict
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./table_order.db"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a pooled connection
+    
+    # SQLite connection pragmas
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 20000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256MB
+    SQLITE_FOREIGN_KEYS: bool = True
     
     # JWT
     JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -14,11 +25,69 @@ class Settings(BaseSettings):
     # Admin JWT
     ADMIN_JWT_EXPIRE_MINUTES: int = 480  # 8 hours
     
+    # Password Hashing
+    BCRYPT_ROUNDS: int = 12  # Existing hashes are upgraded on next login when this changes
+    PASSWORD_HASH_WORKERS: int = 2  # Dedicated threads for bcrypt
+    PASSWORD_HASH_MAX_PENDING: int = 16  # Queued + running hash jobs before logins are rejected
+    
+    # Admin Token Version Cache
+    ADMIN_TOKEN_CACHE_TTL_SECONDS: int = 30  # Max delay before a revocation in another process takes effect
+    ADMIN_TOKEN_CACHE_MAX_SIZE: int = 1000
+    
+    # Session Token Cache
+    SESSION_CACHE_TTL_SECONDS: int = 30  # Bounds staleness across worker processes
+    SESSION_CACHE_MAX_SIZE: int = 10000
+    
+    # Login Rate Limiting
+    LOGIN_MAX_FAILED_ATTEMPTS: int = 5  # Per username within the window
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 300
+    
+    # Order Archive
+    ORDER_ARCHIVE_RETENTION_DAYS: int = 30  # Orders stay hot this long after their session ends
+    ORDER_ARCHIVE_BATCH_SIZE: int = 500  # Orders moved per transaction
+    ORDER_ARCHIVE_INTERVAL_SECONDS: int = 3600  # 0 disables the background archiver
+    
+    # Order Export
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor batch (and per streamed chunk)
+    
+    # Business Day
+    STORE_TIMEZONE: str = "Asia/Seoul"
+    BUSINESS_DAY_CUTOFF_HOUR: int = 0  # Orders before this local hour count toward the previous day
+    
     # File Upload
     UPLOAD_DIR: str = "uploads"
+    UPLOAD_TMP_DIR: str = "uploads_tmp"  # Partial uploads; must be on the same filesystem as UPLOAD_DIR
+    UPLOAD_MANIFEST_DIR: str = "uploads_manifests"  # Render results of originals; kept out of the served UPLOAD_DIR
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CACHE_MAX_AGE: int = 365 * 24 * 3600  # Content-hashed upload URLs are immutable
+    UPLOAD_PRECOMPRESSED: bool = True  # Serve .br/.gz sidecars of text-like uploads when accepted
     ALLOWED_EXTENSIONS: set = {"jpg", "jpeg", "png", "webp"}
     
+    # Menu Images
+    IMAGE_VARIANTS: dict = {"thumb": 200, "card": 480, "detail": 1200}  # Longest edge in pixels
+    IMAGE_PLACEHOLDER_SIZE: int = 16  # Longest edge of the inline blur-up placeholder
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_JPEG_QUALITY: int = 82
+    IMAGE_MAX_PIXELS: int = 50_000_000  # Larger images are rejected before decoding
+    IMAGE_PROCESS_WORKERS: int = 2  # Worker processes decoding and resizing uploads
+    IMAGE_PROCESS_MAX_PENDING: int = 8  # Queued + running jobs before uploads are rejected
+    
+    # WebSocket
+    WS_SEND_QUEUE_SIZE: int = 100  # Per-connection backlog before a slow client is disconnected
+    WS_REPLAY_BUFFER_SIZE: int = 500  # Recent admin events kept per store for resuming clients
+    
+    # Event Broker
+    EVENT_BROKER: str = "memory"  # "database" relays order events between worker processes (SQLite only)
+    EVENT_BROKER_POLL_INTERVAL_MS: int = 200  # Max delay of events from other workers
+    EVENT_BROKER_RETENTION_SECONDS: int = 300  # Relayed events are pruned after this long
+    
+    # Response Compression
+    COMPRESSION_ENCODINGS: list = ["br", "zstd", "gzip"]  # Preference order; br/zstd only if their package is installed
+    COMPRESSION_MIN_SIZE: int = 1024  # Smaller bodies are sent uncompressed
+    COMPRESSION_THREADPOOL_SIZE: int = 64 * 1024  # Larger bodies/chunks are compressed off the event loop
+    COMPRESSION_LEVELS: dict = {"br": 4, "zstd": 3, "gzip": 6}  # Per-request compression
+    COMPRESSION_SNAPSHOT_LEVELS: dict = {"br": 11, "zstd": 19, "gzip": 9}  # Cached bodies, compressed once
+    
     # CORS
     CORS_ORIGINS: list = ["*"]
     
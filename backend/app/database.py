@@ -1,17 +1,132 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .config import settings
 
-# Create SQLite engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection for concurrent access"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")  # Negative = KiB
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA foreign_keys={'ON' if settings.SQLITE_FOREIGN_KEYS else 'OFF'}")
+    cursor.close()
+
+
+def create_db_engine(database_url: str) -> Engine:
+    """
+    Create a database engine with the configured pool and SQLite profile.
+    
+    Args:
+        database_url: SQLAlchemy database URL
+        
+    Returns:
+        SQLAlchemy Engine
+    """
+    if not database_url.startswith("sqlite"):
+        return create_engine(
+            database_url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=True
+        )
+    
+    in_memory = ":memory:" in database_url or database_url.rstrip("/") == "sqlite:"
+    pool_args = {} if in_memory else {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    
+    sqlite_engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},  # Needed for SQLite
+        **pool_args
+    )
+    event.listen(sqlite_engine, "connect", apply_sqlite_pragmas)
+    
+    return sqlite_engine
+
+
+# Async drivers for the sync drivers configured in DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Convert a database URL to its async driver equivalent.
+    
+    Args:
+        database_url: SQLAlchemy database URL (e.g. sqlite:///./table_order.db)
+        
+    Returns:
+        Async database URL (e.g. sqlite+aiosqlite:///./table_order.db)
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    
+    if backend in ASYNC_DRIVERS and url.get_driver_name() != ASYNC_DRIVERS[backend]:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    
+    return url.render_as_string(hide_password=False)
+
+
+def create_async_db_engine(database_url: str) -> AsyncEngine:
+    """
+    Create an async database engine with the same pool and SQLite profile.
+    
+    Args:
+        database_url: SQLAlchemy database URL (sync or async driver)
+        
+    Returns:
+        SQLAlchemy AsyncEngine
+    """
+    async_url = get_async_database_url(database_url)
+    
+    if not async_url.startswith("sqlite"):
+        return create_async_engine(
+            async_url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=True
+        )
+    
+    in_memory = ":memory:" in async_url or async_url.rstrip("/").endswith("aiosqlite:")
+    pool_args = {} if in_memory else {
+        # aiosqlite defaults to NullPool; keep connections (and their pragmas) warm
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    
+    sqlite_engine = create_async_engine(async_url, **pool_args)
+    event.listen(sqlite_engine.sync_engine, "connect", apply_sqlite_pragmas)
+    
+    return sqlite_engine
+
+
+# Create database engine
+engine = create_db_engine(settings.DATABASE_URL)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async engine and AsyncSessionLocal class
+async_engine = create_async_db_engine(settings.DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -23,3 +138,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
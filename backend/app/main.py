@@ -1,8 +1,7 @@
 """FastAPI Application Entry Point"""
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 import os
 from .config import settings
 from .database import Base, engine
@@ -17,6 +16,7 @@ from .routers import (
     admin_table,
     admin_menu,
     admin_category,
+    admin_analytics,
     websocket
 )
 
@@ -32,8 +32,21 @@ from .utils.errors import (
     MenuNotAvailableError,
     InvalidQuantityError,
     OrderNotFoundError,
-    InvalidStatusError
+    InvalidStatusError,
+    InvalidCursorError,
+    PasswordHashingBusyError,
+    LoginRateLimitedError,
+    InvalidImageError,
+    FileTooLargeError,
+    ImageProcessingBusyError
 )
+from .utils.password_hasher import password_hasher
+from .utils.image_processor import image_processor
+from .utils.static_files import UploadStaticFiles
+from .utils.compression import CompressionMiddleware
+from .utils.order_archiver import order_archiver
+from .utils.events import order_events
+from .utils.event_broker import create_event_broker
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -42,7 +55,8 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="Table Order API",
     description="Backend API for Table Order Service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -54,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression
+app.add_middleware(CompressionMiddleware)
+
 # Global exception handlers
 @app.exception_handler(TokenExpiredError)
 async def token_expired_handler(request: Request, exc: TokenExpiredError):
@@ -143,6 +160,94 @@ async def invalid_status_handler(request: Request, exc: InvalidStatusError):
     )
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(PasswordHashingBusyError)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(LoginRateLimitedError)
+async def login_rate_limited_handler(request: Request, exc: LoginRateLimitedError):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
+@app.exception_handler(InvalidImageError)
+async def invalid_image_handler(request: Request, exc: InvalidImageError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(FileTooLargeError)
+async def file_too_large_handler(request: Request, exc: FileTooLargeError):
+    return JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(ImageProcessingBusyError)
+async def image_processing_busy_handler(request: Request, exc: ImageProcessingBusyError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "5"}
+    )
+
+
+@app.on_event("startup")
+async def start_event_broker():
+    """Connect the order event bus to the configured broker"""
+    order_events.use_broker(create_event_broker())
+    await order_events.broker.start()
+
+
+@app.on_event("shutdown")
+async def stop_event_broker():
+    """Stop the event broker"""
+    await order_events.broker.stop()
+
+
+@app.on_event("startup")
+async def start_order_archiver():
+    """Start moving orders of long-ended sessions to the archive"""
+    order_archiver.start()
+
+
+@app.on_event("shutdown")
+async def stop_order_archiver():
+    """Stop the order archiver"""
+    await order_archiver.stop()
+
+
+@app.on_event("shutdown")
+def shutdown_password_hasher():
+    """Stop the password hashing threads"""
+    password_hasher.shutdown()
+
+
+@app.on_event("shutdown")
+def shutdown_image_processor():
+    """Stop the image processing workers"""
+    image_processor.shutdown()
+
+
 # Register routers
 app.include_router(customer_auth.router)
 app.include_router(customer_menu.router)
@@ -152,11 +257,12 @@ app.include_router(admin_order.router)
 app.include_router(admin_table.router)
 app.include_router(admin_menu.router)
 app.include_router(admin_category.router)
+app.include_router(admin_analytics.router)
 app.include_router(websocket.router)
 
 # Static files for uploads
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+app.mount("/uploads", UploadStaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 
 @app.get("/")
@@ -7,6 +7,11 @@ from .order import Order
 from .order_item import OrderItem
 from .admin import Admin
 from .order_history import OrderHistory
+from .order_sequence import OrderSequence
+from .archived_order import ArchivedOrder, ArchivedOrderItem, ArchivedOrderHistory
+from .sales_rollup import DailySales, DailyMenuSales
+from .order_change import OrderChange
+from .broker_event import BrokerEvent
 
 __all__ = [
     "Store",
@@ -18,4 +23,12 @@ __all__ = [
     "OrderItem",
     "Admin",
     "OrderHistory",
+    "OrderSequence",
+    "ArchivedOrder",
+    "ArchivedOrderItem",
+    "ArchivedOrderHistory",
+    "DailySales",
+    "DailyMenuSales",
+    "OrderChange",
+    "BrokerEvent",
 ]
@@ -11,6 +11,7 @@ class Admin(Base):
     store_id = Column(Integer, ForeignKey("stores.id"), nullable=False, index=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)  # Bump to revoke issued JWTs
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+from ..database import Base
+from .order import OrderStatus
+
+
+class ArchivedOrder(Base):
+    """Order of a long-ended session, moved out of `orders` by OrderArchiveService"""
+    __tablename__ = "archived_orders"
+    __table_args__ = (
+        Index("ix_archived_orders_store_id_created_at_id", "store_id", "created_at", "id"),
+        Index("ix_archived_orders_session_id_created_at_id", "session_id", "created_at", "id"),
+    )
+
+    # Same columns and IDs as the original order
+    id = Column(Integer, primary_key=True)
+    store_id = Column(Integer, nullable=False)
+    session_id = Column(Integer, nullable=False)
+    order_number = Column(String(20), nullable=False)
+    subtotal_amount = Column(Integer, nullable=False)
+    tip_rate = Column(Integer, nullable=False)
+    tip_amount = Column(Integer, nullable=False)
+    total_amount = Column(Integer, nullable=False)
+    status = Column(SQLEnum(OrderStatus), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+
+    # Relationships
+    items = relationship("ArchivedOrderItem", back_populates="order", cascade="all, delete-orphan")
+    history = relationship("ArchivedOrderHistory", back_populates="order", cascade="all, delete-orphan")
+
+
+class ArchivedOrderItem(Base):
+    __tablename__ = "archived_order_items"
+
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("archived_orders.id"), nullable=False, index=True)
+    menu_id = Column(Integer, nullable=False)  # Menus may be deleted after archiving
+    menu_name = Column(String(100), nullable=False)
+    menu_price = Column(Integer, nullable=False)
+    quantity = Column(Integer, nullable=False)
+    subtotal = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    # Relationships
+    order = relationship("ArchivedOrder", back_populates="items")
+
+
+class ArchivedOrderHistory(Base):
+    __tablename__ = "archived_order_history"
+
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("archived_orders.id"), nullable=False, index=True)
+    old_status = Column(String(20), nullable=False)
+    new_status = Column(String(20), nullable=False)
+    changed_at = Column(DateTime, nullable=False)
+
+    # Relationships
+    order = relationship("ArchivedOrder", back_populates="history")
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from datetime import datetime
+from ..database import Base
+
+
+class BrokerEvent(Base):
+    """Order event relayed between worker processes by DatabaseEventBroker; pruned after a short retention"""
+    __tablename__ = "broker_events"
+    __table_args__ = {"sqlite_autoincrement": True}  # Never reuse IDs of pruned entries
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    origin = Column(String(32), nullable=False)  # Publishing process, which has already delivered the event
+    store_id = Column(Integer, nullable=False)
+    type = Column(String(50), nullable=False)
+    data = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
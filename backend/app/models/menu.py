@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -13,6 +13,8 @@ class Menu(Base):
     description = Column(Text, nullable=True)
     price = Column(Integer, nullable=False)
     image_url = Column(String(255), nullable=True)
+    image_variants = Column(JSON, nullable=True)  # Variant name -> width, height, webp and jpeg URLs
+    image_placeholder = Column(Text, nullable=True)  # Tiny JPEG data URI shown while the image loads
     allergens = Column(String(255), nullable=True)  # Comma-separated allergen list
     is_available = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from enum import Enum
@@ -15,8 +15,16 @@ class OrderStatus(str, Enum):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset pagination on (created_at, id) within a store, optionally narrowed by status;
+        # session-scoped lookups are already confined to one store
+        Index("ix_orders_store_id_created_at_id", "store_id", "created_at", "id"),
+        Index("ix_orders_store_id_status_created_at_id", "store_id", "status", "created_at", "id"),
+        Index("ix_orders_session_id_created_at_id", "session_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
+    store_id = Column(Integer, ForeignKey("stores.id"), nullable=False)  # Denormalized from the session's table
     session_id = Column(Integer, ForeignKey("table_sessions.id"), nullable=False, index=True)
     order_number = Column(String(20), nullable=False, index=True)
     subtotal_amount = Column(Integer, nullable=False)
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
+from datetime import datetime
+from ..database import Base
+
+
+class OrderChange(Base):
+    """Append-only log of order creations and updates; the ID is the sync cursor"""
+    __tablename__ = "order_changes"
+    __table_args__ = (
+        Index("ix_order_changes_store_id_id", "store_id", "id"),
+        {"sqlite_autoincrement": True},  # Never reuse IDs of pruned entries
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    store_id = Column(Integer, ForeignKey("stores.id"), nullable=False)
+    order_id = Column(Integer, nullable=False, index=True)  # No FK; entries are pruned when orders are archived
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
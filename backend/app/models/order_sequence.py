@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from ..database import Base
+
+
+class OrderSequence(Base):
+    __tablename__ = "order_sequences"
+
+    store_id = Column(Integer, ForeignKey("stores.id"), primary_key=True)
+    business_date = Column(Date, primary_key=True)
+    last_value = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from ..database import Base
+
+
+class DailySales(Base):
+    """Per-store, per-business-day totals of non-cancelled orders"""
+    __tablename__ = "daily_sales"
+
+    store_id = Column(Integer, ForeignKey("stores.id"), primary_key=True)
+    business_date = Column(Date, primary_key=True)
+    order_count = Column(Integer, default=0, nullable=False)
+    subtotal_amount = Column(Integer, default=0, nullable=False)
+    tip_amount = Column(Integer, default=0, nullable=False)
+    total_amount = Column(Integer, default=0, nullable=False)
+
+
+class DailyMenuSales(Base):
+    """Per-store, per-business-day, per-menu totals of non-cancelled orders"""
+    __tablename__ = "daily_menu_sales"
+
+    store_id = Column(Integer, ForeignKey("stores.id"), primary_key=True)
+    business_date = Column(Date, primary_key=True)
+    menu_id = Column(Integer, primary_key=True)  # No FK; rollups outlive deleted menus
+    menu_name = Column(String(100), nullable=False)  # Latest name seen that day
+    quantity = Column(Integer, default=0, nullable=False)
+    subtotal_amount = Column(Integer, default=0, nullable=False)
+    order_count = Column(Integer, default=0, nullable=False)
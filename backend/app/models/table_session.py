@@ -11,7 +11,7 @@ class TableSession(Base):
     table_id = Column(Integer, ForeignKey("tables.id"), nullable=False, index=True)
     session_token = Column(String(255), unique=True, nullable=False, index=True)
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    ended_at = Column(DateTime, nullable=True)
+    ended_at = Column(DateTime, nullable=True, index=True)  # Archival scans for long-ended sessions
 
     # Relationships
     table = relationship("Table", back_populates="sessions")
@@ -0,0 +1,72 @@
+"""Admin Analytics Router"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+from datetime import date, timedelta
+from ..database import get_async_db
+from ..schemas.analytics import (
+    DailySalesListResponse, TopMenusResponse, daily_sales_serializer, top_menus_serializer
+)
+from ..services.analytics_service import AnalyticsService
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.business_day import get_business_date
+from ..utils.dependencies import get_current_admin
+
+router = APIRouter(prefix="/api/admin/analytics", tags=["Admin Analytics"])
+
+
+def resolve_date_range(date_from: Optional[date], date_to: Optional[date]) -> Tuple[date, date]:
+    """
+    Default to the last 7 business days ending today.
+    
+    Raises:
+        HTTPException: If date_from is after date_to
+    """
+    date_to = date_to or get_business_date()
+    date_from = date_from or date_to - timedelta(days=6)
+    
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must not be after date_to")
+    
+    return date_from, date_to
+
+
+@router.get("/daily-sales", response_model=DailySalesListResponse)
+async def get_daily_sales(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get revenue per business day, excluding cancelled orders.
+    """
+    date_from, date_to = resolve_date_range(date_from, date_to)
+    days = await AnalyticsService(db).daily_sales(admin.store_id, date_from, date_to)
+    
+    return daily_sales_serializer.response({
+        "date_from": date_from,
+        "date_to": date_to,
+        "days": days,
+        "order_count": sum(d.order_count for d in days),
+        "subtotal_amount": sum(d.subtotal_amount for d in days),
+        "tip_amount": sum(d.tip_amount for d in days),
+        "total_amount": sum(d.total_amount for d in days)
+    })
+
+
+@router.get("/top-menus", response_model=TopMenusResponse)
+async def get_top_menus(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = Query(10, ge=1, le=100),
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the best-selling menus by quantity, excluding cancelled orders.
+    """
+    date_from, date_to = resolve_date_range(date_from, date_to)
+    menus = await AnalyticsService(db).top_menus(admin.store_id, date_from, date_to, limit)
+    
+    return top_menus_serializer.response({"date_from": date_from, "date_to": date_to, "menus": menus})
@@ -1,41 +1,60 @@
 """Admin Authentication Router"""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from ..database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
 from ..schemas.auth import AdminLoginRequest, AdminLoginResponse
 from ..models.admin import Admin
 from ..services.auth_service import AuthService
+from ..services.admin_token_service import AdminTokenService
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.dependencies import get_current_admin
+from ..utils.password_hasher import password_hasher
+from ..utils.rate_limit import login_rate_limiter
 from ..config import settings
 
 router = APIRouter(prefix="/api/admin/auth", tags=["Admin Auth"])
 
 
 @router.post("/login", response_model=AdminLoginResponse)
-def admin_login(
+async def admin_login(
     request: AdminLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Admin login with username and password.
     Returns JWT token.
+    Password checks run on the dedicated hashing pool and are rate limited per username.
     """
+    login_rate_limiter.check(request.username)
+    
     # Find admin
-    admin = db.query(Admin).filter_by(username=request.username).first()
+    admin = await db.scalar(select(Admin).filter_by(username=request.username))
     
     if not admin:
+        login_rate_limiter.record_failure(request.username)
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Verify password
     auth_service = AuthService()
     
-    if not auth_service.verify_password(request.password, admin.password_hash):
+    if not await password_hasher.verify_password(request.password, admin.password_hash):
+        login_rate_limiter.record_failure(request.username)
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    login_rate_limiter.reset(request.username)
+    
+    # Upgrade the stored hash if the configured cost factor changed
+    if auth_service.needs_rehash(admin.password_hash):
+        admin.password_hash = await password_hasher.hash_password(request.password)
+        await db.commit()
+    
     # Create JWT token
     payload = {
         "admin_id": admin.id,
         "username": admin.username,
-        "store_id": admin.store_id
+        "store_id": admin.store_id,
+        "token_version": admin.token_version
     }
     
     token = auth_service.create_jwt_token(
@@ -44,3 +63,16 @@ def admin_login(
     )
     
     return AdminLoginResponse(access_token=token)
+
+
+@router.post("/revoke")
+async def revoke_admin_tokens(
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Revoke every token issued to the current admin (log out all devices).
+    """
+    await AdminTokenService(db).revoke_tokens(admin.admin_id)
+    
+    return {"message": "Tokens revoked successfully"}
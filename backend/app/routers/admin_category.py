@@ -1,33 +1,43 @@
 """Admin Category Management Router"""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from ..database import get_db
-from ..schemas.menu import CategoryResponse, CategoryCreate, CategoryUpdate
+from ..database import get_async_db
+from ..schemas.menu import CategoryResponse, CategoryCreate, CategoryUpdate, categories_serializer
 from ..models.category import Category
 from ..models.menu import Menu
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.dependencies import get_current_admin
+from ..utils.menu_cache import menu_cache
 
 router = APIRouter(prefix="/api/admin/category", tags=["Admin Category"])
 
 
 @router.get("/list", response_model=List[CategoryResponse])
-def get_all_categories(db: Session = Depends(get_db)):
+async def get_all_categories(
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Get all categories.
+    Get all categories of the admin's store.
     """
-    categories = db.query(Category).order_by(Category.display_order).all()
-    return [CategoryResponse.from_orm(c) for c in categories]
+    categories = (await db.scalars(
+        select(Category).filter_by(store_id=admin.store_id).order_by(Category.display_order)
+    )).all()
+    return categories_serializer.response(categories)
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
-def get_category_detail(
+async def get_category_detail(
     category_id: int,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get category detail by ID.
     """
-    category = db.query(Category).filter_by(id=category_id).first()
+    category = await db.scalar(select(Category).filter_by(id=category_id, store_id=admin.store_id))
     
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -36,36 +46,38 @@ def get_category_detail(
 
 
 @router.post("/create", response_model=CategoryResponse)
-def create_category(
+async def create_category(
     category_data: CategoryCreate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Create a new category.
+    Create a new category in the admin's store.
     """
-    # Assuming store_id=1 for now
     category = Category(
-        store_id=1,
+        store_id=admin.store_id,
         **category_data.dict()
     )
     
     db.add(category)
-    db.commit()
-    db.refresh(category)
+    await db.commit()
+    await db.refresh(category)
+    menu_cache.invalidate(category.store_id)
     
     return CategoryResponse.from_orm(category)
 
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
-def update_category(
+async def update_category(
     category_id: int,
     category_data: CategoryUpdate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update category information.
     """
-    category = db.query(Category).filter_by(id=category_id).first()
+    category = await db.scalar(select(Category).filter_by(id=category_id, store_id=admin.store_id))
     
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -75,33 +87,48 @@ def update_category(
     for field, value in update_data.items():
         setattr(category, field, value)
     
-    db.commit()
-    db.refresh(category)
+    await db.commit()
+    await db.refresh(category)
+    menu_cache.invalidate(category.store_id)
     
     return CategoryResponse.from_orm(category)
 
 
 @router.delete("/{category_id}")
-def delete_category(
+async def delete_category(
     category_id: int,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete category.
-    Moves all menus to "Uncategorized" category (id=1).
+    Moves its menus to the store's first remaining category.
     """
-    category = db.query(Category).filter_by(id=category_id).first()
+    category = await db.scalar(select(Category).filter_by(id=category_id, store_id=admin.store_id))
     
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    # Move menus to uncategorized (assuming category_id=1 is uncategorized)
-    menus = db.query(Menu).filter_by(category_id=category_id).all()
-    for menu in menus:
-        menu.category_id = 1  # Move to uncategorized
+    # Move menus to the first remaining category of the same store
+    fallback_id = await db.scalar(
+        select(Category.id)
+        .filter(Category.store_id == admin.store_id, Category.id != category_id)
+        .order_by(Category.display_order, Category.id)
+        .limit(1)
+    )
+    has_menus = await db.scalar(select(Menu.id).filter_by(category_id=category_id).limit(1))
+    
+    if has_menus and fallback_id is None:
+        raise HTTPException(status_code=400, detail="Cannot delete the only category while it has menus")
+    
+    await db.execute(
+        update(Menu).filter_by(category_id=category_id).values(category_id=fallback_id)
+    )
     
     # Delete category
-    db.delete(category)
-    db.commit()
+    store_id = category.store_id
+    await db.delete(category)
+    await db.commit()
+    menu_cache.invalidate(store_id)
     
     return {"message": "Category deleted successfully"}
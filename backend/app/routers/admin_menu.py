@@ -1,35 +1,78 @@
 """Admin Menu Management Router"""
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List
+import json
 import os
-import shutil
-from ..database import get_db
-from ..schemas.menu import MenuResponse, MenuCreate, MenuUpdate
+import aiofiles
+import aiofiles.os
+from ..database import get_async_db
+from ..schemas.menu import MenuResponse, MenuCreate, MenuUpdate, menus_serializer
+from ..models.category import Category
 from ..models.menu import Menu
 from ..config import settings
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.dependencies import get_current_admin
+from ..utils.errors import FileTooLargeError, InvalidImageError
+from ..utils.image_processor import image_processor
+from ..utils.menu_cache import menu_cache
+from ..utils.uploads import StoredUpload, iter_upload_file, store_image_upload
 
 router = APIRouter(prefix="/api/admin/menu", tags=["Admin Menu"])
 
 
+def store_menus(store_id: int):
+    """
+    Build a query for menus belonging to a store.
+    
+    Args:
+        store_id: Store ID
+    
+    Returns:
+        Select statement over Menu joined to its category
+    """
+    return select(Menu).join(Category, Menu.category_id == Category.id).filter(Category.store_id == store_id)
+
+
+async def ensure_store_category(db: AsyncSession, category_id: int, store_id: int):
+    """
+    Check that a category belongs to the store.
+    
+    Args:
+        db: Async database session
+        category_id: Category ID
+        store_id: Store ID
+    
+    Raises:
+        HTTPException: If the category is not in the store
+    """
+    if await db.scalar(select(Category.id).filter_by(id=category_id, store_id=store_id)) is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+
+
 @router.get("/list", response_model=List[MenuResponse])
-def get_all_menus(db: Session = Depends(get_db)):
+async def get_all_menus(
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Get all menus.
+    Get all menus of the admin's store.
     """
-    menus = db.query(Menu).all()
-    return [MenuResponse.from_orm(m) for m in menus]
+    menus = (await db.scalars(store_menus(admin.store_id))).all()
+    return menus_serializer.response(menus)
 
 
 @router.get("/{menu_id}", response_model=MenuResponse)
-def get_menu_detail(
+async def get_menu_detail(
     menu_id: int,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get menu detail by ID.
     """
-    menu = db.query(Menu).filter_by(id=menu_id).first()
+    menu = await db.scalar(store_menus(admin.store_id).filter(Menu.id == menu_id))
     
     if not menu:
         raise HTTPException(status_code=404, detail="Menu not found")
@@ -38,99 +81,199 @@ def get_menu_detail(
 
 
 @router.post("/create", response_model=MenuResponse)
-def create_menu(
+async def create_menu(
     menu_data: MenuCreate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Create a new menu.
+    Create a new menu in one of the admin's categories.
     """
+    await ensure_store_category(db, menu_data.category_id, admin.store_id)
+    
     menu = Menu(**menu_data.dict())
     
     db.add(menu)
-    db.commit()
-    db.refresh(menu)
+    await db.commit()
+    await db.refresh(menu)
+    menu_cache.invalidate(admin.store_id)
     
     return MenuResponse.from_orm(menu)
 
 
 @router.patch("/{menu_id}", response_model=MenuResponse)
-def update_menu(
+async def update_menu(
     menu_id: int,
     menu_data: MenuUpdate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update menu information.
     """
-    menu = db.query(Menu).filter_by(id=menu_id).first()
+    menu = await db.scalar(store_menus(admin.store_id).filter(Menu.id == menu_id))
     
     if not menu:
         raise HTTPException(status_code=404, detail="Menu not found")
     
     # Update fields
     update_data = menu_data.dict(exclude_unset=True)
+    
+    if update_data.get("category_id") is not None:
+        await ensure_store_category(db, update_data["category_id"], admin.store_id)
+    
     for field, value in update_data.items():
         setattr(menu, field, value)
     
-    db.commit()
-    db.refresh(menu)
+    await db.commit()
+    await db.refresh(menu)
+    menu_cache.invalidate(admin.store_id)
     
     return MenuResponse.from_orm(menu)
 
 
+def upload_url(file_name: str) -> str:
+    """Get the public URL of a file in the upload directory"""
+    return f"/uploads/{file_name}"
+
+
+async def render_menu_image(upload: StoredUpload) -> dict:
+    """
+    Get the variants of a stored original, rendering them on first use.
+    
+    The result is kept as `{sha256}.json` in UPLOAD_MANIFEST_DIR, outside
+    the publicly served upload directory, so uploading an identical image
+    again skips decoding entirely.
+    
+    Args:
+        upload: Stored original
+    
+    Returns:
+        Result of render_variants
+    """
+    manifest_path = os.path.join(settings.UPLOAD_MANIFEST_DIR, f"{upload.digest}.json")
+    
+    if upload.duplicate and await aiofiles.os.path.exists(manifest_path):
+        async with aiofiles.open(manifest_path) as manifest:
+            return json.loads(await manifest.read())
+    
+    try:
+        result = await image_processor.process(
+            upload.path, settings.UPLOAD_DIR, upload.digest[:16], settings.UPLOAD_TMP_DIR
+        )
+    except InvalidImageError:
+        # A duplicate's original was stored by an earlier request; leave it
+        if not upload.duplicate:
+            await aiofiles.os.remove(upload.path)
+        raise
+    
+    await aiofiles.os.makedirs(settings.UPLOAD_MANIFEST_DIR, exist_ok=True)
+    temp_path = os.path.join(settings.UPLOAD_TMP_DIR, f"{upload.digest}.json.part")
+    async with aiofiles.open(temp_path, "w") as manifest:
+        await manifest.write(json.dumps(result))
+    await aiofiles.os.replace(temp_path, manifest_path)
+    
+    return result
+
+
+async def save_menu_image(db: AsyncSession, menu: Menu, store_id: int, chunks: AsyncIterator[bytes]) -> dict:
+    """
+    Store an uploaded image and point the menu at its variants.
+    
+    Args:
+        db: Async database session
+        menu: Menu to update
+        store_id: Store ID (for menu cache invalidation)
+        chunks: Async iterator of upload bytes
+    
+    Returns:
+        Upload response body
+    """
+    upload = await store_image_upload(chunks)
+    result = await render_menu_image(upload)
+    
+    variants = {
+        name: {**variant, "webp": upload_url(variant["webp"]), "jpeg": upload_url(variant["jpeg"])}
+        for name, variant in result["variants"].items()
+    }
+    largest = max(variants.values(), key=lambda variant: variant["width"] * variant["height"])
+    
+    # Update menu images
+    menu.image_url = largest["jpeg"]
+    menu.image_variants = variants
+    menu.image_placeholder = result["placeholder"]
+    await db.commit()
+    menu_cache.invalidate(store_id)
+    
+    return {
+        "message": "Image uploaded successfully",
+        "image_url": menu.image_url,
+        "image_variants": menu.image_variants
+    }
+
+
 @router.post("/{menu_id}/upload-image")
-def upload_menu_image(
+async def upload_menu_image(
     menu_id: int,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Upload menu image.
+    Upload menu image (multipart form).
+    The file is streamed to disk in chunks (up to MAX_FILE_SIZE), stored
+    under its content hash, then resized into the IMAGE_VARIANTS (WebP and
+    JPEG) and an inline placeholder on the image process pool. image_url
+    points at the largest JPEG variant.
     """
-    menu = db.query(Menu).filter_by(id=menu_id).first()
+    menu = await db.scalar(store_menus(admin.store_id).filter(Menu.id == menu_id))
     
     if not menu:
         raise HTTPException(status_code=404, detail="Menu not found")
     
-    # Validate file extension
-    file_ext = file.filename.split(".")[-1].lower()
-    if file_ext not in settings.ALLOWED_EXTENSIONS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File type not allowed. Allowed: {settings.ALLOWED_EXTENSIONS}"
-        )
-    
-    # Create upload directory if not exists
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    
-    # Save file
-    file_path = f"{settings.UPLOAD_DIR}/{menu_id}.{file_ext}"
+    return await save_menu_image(db, menu, admin.store_id, iter_upload_file(file))
+
+
+@router.put("/{menu_id}/image")
+async def put_menu_image(
+    menu_id: int,
+    request: Request,
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Upload menu image as the raw request body.
+    Streams straight from the socket without multipart spooling, and
+    rejects a Content-Length above MAX_FILE_SIZE before reading anything.
+    """
+    menu = await db.scalar(store_menus(admin.store_id).filter(Menu.id == menu_id))
     
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
     
-    # Update menu image URL
-    menu.image_url = f"/uploads/{menu_id}.{file_ext}"
-    db.commit()
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.MAX_FILE_SIZE:
+        raise FileTooLargeError(f"File too large. Maximum size: {settings.MAX_FILE_SIZE} bytes")
     
-    return {"message": "Image uploaded successfully", "image_url": menu.image_url}
+    return await save_menu_image(db, menu, admin.store_id, request.stream())
 
 
 @router.delete("/{menu_id}")
-def delete_menu(
+async def delete_menu(
     menu_id: int,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete menu (soft delete - set is_available to False).
     """
-    menu = db.query(Menu).filter_by(id=menu_id).first()
+    menu = await db.scalar(store_menus(admin.store_id).filter(Menu.id == menu_id))
     
     if not menu:
         raise HTTPException(status_code=404, detail="Menu not found")
     
     menu.is_available = False
-    db.commit()
+    await db.commit()
+    menu_cache.invalidate(admin.store_id)
     
     return {"message": "Menu deleted successfully"}
@@ -1,45 +1,164 @@
 """Admin Order Management Router"""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
-from ..schemas.order import OrderResponse, OrderListResponse, OrderStatusUpdate
-from ..services.order_service import OrderService
-from ..models.order import Order
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import datetime
+from ..database import AsyncSessionLocal, get_async_db
+from ..models.order import OrderStatus
+from ..schemas.order import (
+    OrderResponse, OrderListResponse, OrderChangesResponse, OrderStatusUpdate,
+    order_list_serializer, order_changes_serializer
+)
+from ..services.async_order_service import AsyncOrderService
+from ..services.async_order_query_service import AsyncOrderQueryService
+from ..services.order_export_service import OrderExportService, ORDER_EXPORT_COLUMNS, ITEM_EXPORT_COLUMNS
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.business_day import business_day_bounds, get_business_date
+from ..utils.dependencies import get_current_admin
+from ..utils.export import stream_csv, stream_ndjson
 from ..utils.errors import OrderNotFoundError, InvalidStatusError
 
 router = APIRouter(prefix="/api/admin/order", tags=["Admin Order"])
 
 
 @router.get("/list", response_model=OrderListResponse)
-def get_all_orders(
+async def get_all_orders(
     status: str = None,
-    db: Session = Depends(get_db)
+    table_id: Optional[int] = None,
+    session_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    archived: bool = False,
+    include_total: bool = False,
+    today: bool = False,
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all orders, optionally filtered by status.
+    Get orders newest first, one page at a time.
+    Pass the returned `next_cursor` as `cursor` to fetch the next page.
+    Set `archived=true` to page through orders moved to the archive.
+    `total` counts every matching order and is only returned with `include_total=true`.
+    `today=true` limits the list to the current business day (the dashboard's initial load).
+    `changes_cursor` is taken before the page is read; pass it to /changes
+    to receive everything that changes afterwards.
     """
-    query = db.query(Order)
+    if today:
+        day_start, _ = business_day_bounds(get_business_date())
+        date_from = max(date_from, day_start) if date_from else day_start
     
+    query_service = AsyncOrderQueryService(db)
+    changes_cursor = await query_service.latest_change_cursor(admin.store_id)
+    
+    page = await query_service.paginate_orders(
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        session_id=session_id,
+        table_id=table_id,
+        created_from=date_from,
+        created_to=date_to,
+        store_id=admin.store_id,
+        archived=archived,
+        include_total=include_total
+    )
+    
+    return order_list_serializer.response({
+        "orders": page.orders,
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+        "changes_cursor": changes_cursor
+    })
+
+
+@router.get("/changes", response_model=OrderChangesResponse)
+async def get_order_changes(
+    since: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=1000),
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get orders created or updated since a change cursor.
+    Use the `changes_cursor` of /list (or the `cursor` of a previous call) as `since`;
+    without `since`, only the current cursor is returned.
+    """
+    page = await AsyncOrderQueryService(db).get_changes(admin.store_id, since, limit)
+    
+    return order_changes_serializer.response({
+        "orders": page.orders,
+        "cursor": page.cursor,
+        "has_more": page.has_more
+    })
+
+
+@router.get("/export")
+async def export_orders(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    items: bool = False,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    include_archived: bool = True,
+    admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Stream the store's orders, oldest first, as CSV or NDJSON.
+    Set `items=true` to export one row per order line with its order metadata.
+    """
     if status:
-        query = query.filter_by(status=status)
+        try:
+            OrderStatus(status)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
     
-    orders = query.order_by(Order.created_at.desc()).all()
+    async def generate():
+        # The stream outlives the request's dependencies, so it owns its session
+        async with AsyncSessionLocal() as db:
+            service = OrderExportService(db)
+            iterate = service.iter_items if items else service.iter_orders
+            batches = iterate(
+                store_id=admin.store_id,
+                status=status,
+                created_from=date_from,
+                created_to=date_to,
+                include_archived=include_archived
+            )
+            
+            if format == "csv":
+                chunks = stream_csv(ITEM_EXPORT_COLUMNS if items else ORDER_EXPORT_COLUMNS, batches)
+            else:
+                chunks = stream_ndjson(batches)
+            
+            async for chunk in chunks:
+                yield chunk
     
-    return OrderListResponse(
-        orders=[OrderResponse.from_orm(o) for o in orders]
+    filename = f"orders{'-items' if items else ''}.{format}"
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
     )
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
-def get_order_detail(
+async def get_order_detail(
     order_id: int,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get order detail by ID.
+    Get order detail by ID, including archived orders.
     """
-    order = db.query(Order).filter_by(id=order_id).first()
+    order = await AsyncOrderQueryService(db).get_order(
+        order_id,
+        store_id=admin.store_id,
+        include_archived=True
+    )
     
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -48,20 +167,22 @@ def get_order_detail(
 
 
 @router.patch("/{order_id}/status", response_model=OrderResponse)
-def update_order_status(
+async def update_order_status(
     order_id: int,
     status_update: OrderStatusUpdate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update order status.
     """
-    order_service = OrderService(db)
+    order_service = AsyncOrderService(db)
     
     try:
-        order = order_service.update_order_status(
+        order = await order_service.update_order_status(
             order_id=order_id,
-            new_status=status_update.status
+            new_status=status_update.status,
+            store_id=admin.store_id
         )
     except OrderNotFoundError:
         raise HTTPException(status_code=404, detail="Order not found")
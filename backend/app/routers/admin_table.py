@@ -1,32 +1,41 @@
 """Admin Table Management Router"""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from ..database import get_db
-from ..schemas.table import TableResponse, TableCreate, TableUpdate
+from ..database import get_async_db
+from ..schemas.table import TableResponse, TableCreate, TableUpdate, tables_serializer
 from ..models.table import Table
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.dependencies import get_current_admin
 
 router = APIRouter(prefix="/api/admin/table", tags=["Admin Table"])
 
 
 @router.get("/list", response_model=List[TableResponse])
-def get_all_tables(db: Session = Depends(get_db)):
+async def get_all_tables(
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Get all tables.
+    Get all tables of the admin's store.
     """
-    tables = db.query(Table).all()
-    return [TableResponse.from_orm(t) for t in tables]
+    tables = (await db.scalars(
+        select(Table).filter_by(store_id=admin.store_id).order_by(Table.table_number)
+    )).all()
+    return tables_serializer.response(tables)
 
 
 @router.get("/{table_id}", response_model=TableResponse)
-def get_table_detail(
+async def get_table_detail(
     table_id: int,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get table detail by ID.
     """
-    table = db.query(Table).filter_by(id=table_id).first()
+    table = await db.scalar(select(Table).filter_by(id=table_id, store_id=admin.store_id))
     
     if not table:
         raise HTTPException(status_code=404, detail="Table not found")
@@ -35,44 +44,46 @@ def get_table_detail(
 
 
 @router.post("/create", response_model=TableResponse)
-def create_table(
+async def create_table(
     table_data: TableCreate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new table.
     """
     # Check if QR code already exists
-    existing = db.query(Table).filter_by(qr_code=table_data.qr_code).first()
+    existing = await db.scalar(select(Table).filter_by(qr_code=table_data.qr_code))
     
     if existing:
         raise HTTPException(status_code=400, detail="QR code already exists")
     
-    # Create table (assuming store_id=1 for now)
+    # Create table in the admin's store
     table = Table(
-        store_id=1,
+        store_id=admin.store_id,
         table_number=table_data.table_number,
         qr_code=table_data.qr_code,
         is_active=True
     )
     
     db.add(table)
-    db.commit()
-    db.refresh(table)
+    await db.commit()
+    await db.refresh(table)
     
     return TableResponse.from_orm(table)
 
 
 @router.patch("/{table_id}", response_model=TableResponse)
-def update_table(
+async def update_table(
     table_id: int,
     table_data: TableUpdate,
-    db: Session = Depends(get_db)
+    admin: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update table information.
     """
-    table = db.query(Table).filter_by(id=table_id).first()
+    table = await db.scalar(select(Table).filter_by(id=table_id, store_id=admin.store_id))
     
     if not table:
         raise HTTPException(status_code=404, detail="Table not found")
@@ -84,7 +95,7 @@ def update_table(
     if table_data.is_active is not None:
         table.is_active = table_data.is_active
     
-    db.commit()
-    db.refresh(table)
+    await db.commit()
+    await db.refresh(table)
     
     return TableResponse.from_orm(table)
@@ -1,36 +1,94 @@
 """Customer Menu Router"""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
-from ..schemas.menu import MenuResponse, CategoryResponse, MenuListResponse
-from ..models import Menu, Category
+from typing import Optional
+from ..database import AsyncSessionLocal, get_async_db
+from ..schemas.menu import MenuResponse, MenuListResponse, menu_list_serializer
+from ..models import Menu, Category, Store
+from ..services.session_resolver import SessionResolver
+from ..utils.compression import encoded_etag, negotiate_encoding
+from ..utils.menu_cache import menu_cache, etag_matches
 
 router = APIRouter(prefix="/api/customer/menu", tags=["Customer Menu"])
 
 
+def build_menu_list(db: Session, store_id: Optional[int]) -> bytes:
+    """
+    Query and serialize the menu list.
+
+    Args:
+        db: Database session
+        store_id: Store ID (None for all stores)
+
+    Returns:
+        JSON-encoded MenuListResponse
+    """
+    categories = db.query(Category)
+    menus = db.query(Menu)
+
+    if store_id is not None:
+        categories = categories.filter(Category.store_id == store_id)
+        menus = menus.join(Category).filter(Category.store_id == store_id)
+
+    return menu_list_serializer.dump({
+        "categories": categories.order_by(Category.display_order).all(),
+        "menus": menus.all()
+    })
+
+
 @router.get("/list", response_model=MenuListResponse)
-def get_menu_list(db: Session = Depends(get_db)):
+async def get_menu_list(
+    store_id: Optional[int] = None,
+    session_token: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get all categories and menus.
+    With a session_token, the menu is scoped to the table's store; an
+    unknown store_id is a 404 and is never cached. Served from a snapshot cached per menu version, precompressed in the
+    client's preferred encoding; supports If-None-Match.
     """
-    categories = db.query(Category).order_by(Category.display_order).all()
-    menus = db.query(Menu).all()
+    if session_token:
+        session = await SessionResolver(db).resolve(session_token)
+        
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+        
+        store_id = session.store_id
+    
+    async def build() -> bytes:
+        # Own session: the build may outlive this request (see MenuCache.get_async)
+        async with AsyncSessionLocal() as build_db:
+            # Checked only on a miss; a failed build leaves no cache entry
+            if store_id is not None and await build_db.get(Store, store_id) is None:
+                raise HTTPException(status_code=404, detail="Store not found")
+            return await build_db.run_sync(build_menu_list, store_id)
+    
+    snapshot = await menu_cache.get_async(store_id, build)
+    
+    encoding = negotiate_encoding(accept_encoding, snapshot.encodings)
+    etag = encoded_etag(snapshot.etag, encoding)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
     
-    return MenuListResponse(
-        categories=[CategoryResponse.from_orm(c) for c in categories],
-        menus=[MenuResponse.from_orm(m) for m in menus]
-    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=snapshot.encodings[encoding], media_type="application/json", headers=headers)
+    
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @router.get("/{menu_id}", response_model=MenuResponse)
-def get_menu_detail(menu_id: int, db: Session = Depends(get_db)):
+async def get_menu_detail(menu_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get menu detail by ID.
     """
-    from fastapi import HTTPException
-    
-    menu = db.query(Menu).filter_by(id=menu_id).first()
+    menu = await db.get(Menu, menu_id)
     
     if not menu:
         raise HTTPException(status_code=404, detail="Menu not found")
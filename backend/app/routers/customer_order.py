@@ -1,11 +1,13 @@
 """Customer Order Router"""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from ..database import get_db
-from ..schemas.order import OrderCreate, OrderResponse, OrderListResponse
-from ..services.order_service import OrderService, OrderItemData
-from ..models.table_session import TableSession
+from ..database import get_async_db
+from ..schemas.order import OrderCreate, OrderResponse, OrderListResponse, order_list_serializer
+from ..services.order_service import OrderItemData
+from ..services.async_order_service import AsyncOrderService
+from ..services.async_order_query_service import AsyncOrderQueryService
+from ..services.session_resolver import SessionResolver
 from ..utils.errors import (
     SessionNotActiveError, MenuNotAvailableError,
     InvalidQuantityError, InvalidTipRateError
@@ -15,27 +17,30 @@ router = APIRouter(prefix="/api/customer/order", tags=["Customer Order"])
 
 
 @router.post("/create", response_model=OrderResponse)
-def create_order(
+async def create_order(
     order_data: OrderCreate,
     session_token: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new order for the current session.
     """
     # Find session
-    session = db.query(TableSession).filter_by(session_token=session_token).first()
+    session = await SessionResolver(db).resolve(session_token)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
+    if not session.active:
+        raise HTTPException(status_code=400, detail="Session is not active")
+    
     # Create order
-    order_service = OrderService(db)
+    order_service = AsyncOrderService(db)
     items = [OrderItemData(**item.dict()) for item in order_data.items]
     
     try:
-        order = order_service.create_order(
-            session_id=session.id,
+        order = await order_service.create_order(
+            session_id=session.session_id,
             items=items,
             tip_rate=order_data.tip_rate
         )
@@ -52,48 +57,42 @@ def create_order(
 
 
 @router.get("/list", response_model=OrderListResponse)
-def get_order_list(
+async def get_order_list(
     session_token: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all orders for the current session.
     """
-    from ..models.order import Order
-    
     # Find session
-    session = db.query(TableSession).filter_by(session_token=session_token).first()
+    session = await SessionResolver(db).resolve(session_token)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Get orders
-    orders = db.query(Order).filter_by(session_id=session.id).all()
+    orders = await AsyncOrderQueryService(db).list_orders(session_id=session.session_id)
     
-    return OrderListResponse(
-        orders=[OrderResponse.from_orm(o) for o in orders]
-    )
+    return order_list_serializer.response({"orders": orders, "total": len(orders)})
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
-def get_order_detail(
+async def get_order_detail(
     order_id: int,
     session_token: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get order detail by ID.
     """
-    from ..models.order import Order
-    
     # Find session
-    session = db.query(TableSession).filter_by(session_token=session_token).first()
+    session = await SessionResolver(db).resolve(session_token)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Get order
-    order = db.query(Order).filter_by(id=order_id, session_id=session.id).first()
+    order = await AsyncOrderQueryService(db).get_order(order_id, session_id=session.session_id)
     
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -1,25 +1,156 @@
 """WebSocket Router for real-time updates"""
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from sqlalchemy.orm import Session
-from ..database import get_db
-from ..utils.websocket import manager
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+import asyncio
+import json
+from typing import Dict, List, Optional, Tuple
+from ..database import AsyncSessionLocal
+from ..services.session_resolver import SessionResolver
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.dependencies import get_current_admin
+from ..utils.websocket import manager, customer_manager, replay_buffer
+from ..utils.events import OrderEvent, OrderEventHandler, OrderEventType, order_events
 
 router = APIRouter(tags=["WebSocket"])
 
+# Event bus handlers for stores that have had a connected admin
+store_handlers: Dict[int, OrderEventHandler] = {}
+
+# Event loop owning each store's admin connections
+store_loops: Dict[int, asyncio.AbstractEventLoop] = {}
+
+# Event bus handlers for table sessions with at least one connected tablet
+session_handlers: Dict[int, Tuple[int, OrderEventHandler]] = {}
+
+
+def subscribe_store(store_id: int):
+    """
+    Record a store's order events and forward them to its WebSocket connections.
+
+    Every event is numbered in the replay buffer, even while no admin is
+    connected, so a dashboard reconnecting after a drop can be sent what it
+    missed; the handler therefore stays subscribed after the last disconnect.
+    Events are published from worker threads, so each one is scheduled onto
+    the event loop that owns the connections, under the buffer lock to keep
+    the broadcast order equal to the sequence order.
+
+    Args:
+        store_id: Store ID
+    """
+    store_loops[store_id] = asyncio.get_running_loop()
+
+    if store_id in store_handlers:
+        return
+
+    def handler(event: OrderEvent):
+        if event.type == OrderEventType.MENU_CHANGED:
+            return
+
+        with replay_buffer.lock:
+            text = replay_buffer.record(event.store_id, event.to_message())
+            loop = store_loops.get(event.store_id)
+
+            if loop and not loop.is_closed() and manager.active_connections.get(event.store_id):
+                asyncio.run_coroutine_threadsafe(manager.broadcast_text(event.store_id, text), loop)
+
+    store_handlers[store_id] = handler
+    order_events.subscribe(store_id, handler)
+
+
+def resume_messages(
+    store_id: int,
+    stream: Optional[str],
+    last_seq: Optional[int],
+    max_replay: Optional[int] = None
+) -> List[str]:
+    """
+    Build the messages a (re)connecting admin gets before live events.
+
+    The first is a `hello` carrying the stream ID and current sequence
+    number. If the client sent the `last_seq` it saw on this stream and the
+    events after it are still buffered (and no more than `max_replay`), they
+    follow; otherwise `resync` is true and the client must catch up through
+    the order changes feed. Call with the replay buffer lock held.
+
+    Args:
+        store_id: Store ID
+        stream: Stream ID the client last saw
+        last_seq: Last sequence number the client received
+        max_replay: Most missed events to replay (the rest of the send queue)
+
+    Returns:
+        Serialized messages
+    """
+    missed = None
+    if last_seq is not None and stream == replay_buffer.stream_id:
+        missed = replay_buffer.since(store_id, last_seq)
+
+    if missed is not None and max_replay is not None and len(missed) > max_replay:
+        missed = None
+
+    hello = {
+        "type": "hello",
+        "stream": replay_buffer.stream_id,
+        "seq": replay_buffer.last_seq(store_id),
+        "resync": last_seq is not None and missed is None
+    }
+
+    return [json.dumps(hello)] + (missed or [])
+
+
+async def authorize_admin(token: str, store_id: int) -> bool:
+    """
+    Check that an admin JWT is valid, unrevoked and issued for the store.
+    
+    Args:
+        token: Admin JWT
+        store_id: Store the connection asks for
+    
+    Returns:
+        True if the token may subscribe to the store
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            admin = await get_current_admin(authorization=f"Bearer {token}", db=db)
+    except HTTPException:
+        return False
+    
+    return admin.store_id == store_id
+
 
 @router.websocket("/ws/admin/{store_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
-    store_id: int
+    store_id: int,
+    token: str,
+    last_seq: Optional[int] = None,
+    stream: Optional[str] = None
 ):
     """
     WebSocket endpoint for admin real-time order updates.
     
+    Every pushed event carries a per-store `seq`. A reconnecting dashboard
+    passes the `stream` and `last_seq` from before the drop and is sent only
+    the events it missed (see resume_messages).
+    
     Args:
         websocket: WebSocket connection
         store_id: Store ID for filtering orders
+        token: Admin JWT (must belong to the store)
+        last_seq: Last sequence number received before reconnecting
+        stream: Stream ID from the previous connection's hello message
     """
-    await manager.connect(websocket, store_id)
+    if not await authorize_admin(token, store_id):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await websocket.accept()
+    subscribe_store(store_id)
+    
+    # Replay and register atomically so no event is missed or sent twice;
+    # the hello and replayed events must fit in the connection's send queue
+    with replay_buffer.lock:
+        initial_messages = resume_messages(store_id, stream, last_seq, max_replay=manager.max_queue_size - 1)
+        manager.register(websocket, store_id, initial_messages)
     
     try:
         while True:
@@ -27,7 +158,122 @@ async def websocket_endpoint(
             data = await websocket.receive_text()
             
             # Echo back for heartbeat
-            await websocket.send_json({"type": "pong", "message": "Connection alive"})
+            await manager.send_personal(websocket, store_id, {"type": "pong", "message": "Connection alive"})
     
     except WebSocketDisconnect:
+        pass
+    
+    finally:
         manager.disconnect(websocket, store_id)
+
+
+async def resolve_session(session_token: str) -> Optional[Tuple[int, int]]:
+    """
+    Look up an active table session by token.
+
+    Args:
+        session_token: Session token
+
+    Returns:
+        Tuple of (session_id, store_id), or None if not found or ended
+    """
+    async with AsyncSessionLocal() as db:
+        session = await SessionResolver(db).resolve(session_token)
+    
+    if not session or not session.active:
+        return None
+    return session.session_id, session.store_id
+
+
+def subscribe_session(session_id: int, store_id: int):
+    """
+    Forward a session's order events to its tablet connections.
+
+    Args:
+        session_id: Table session ID
+        store_id: Store ID the session belongs to
+    """
+    if session_id in session_handlers:
+        return
+
+    loop = asyncio.get_running_loop()
+
+    def handler(event: OrderEvent):
+        if event.data.get("session_id") != session_id:
+            return
+        asyncio.run_coroutine_threadsafe(
+            customer_manager.broadcast_to_store(session_id, event.to_message()),
+            loop
+        )
+
+    session_handlers[session_id] = (store_id, handler)
+    order_events.subscribe(store_id, handler)
+
+
+def unsubscribe_session(session_id: int):
+    """
+    Stop forwarding a session's events once its last tablet is gone.
+
+    Args:
+        session_id: Table session ID
+    """
+    if session_id in customer_manager.active_connections:
+        return
+
+    entry = session_handlers.pop(session_id, None)
+    if entry:
+        store_id, handler = entry
+        order_events.unsubscribe(store_id, handler)
+
+
+@router.websocket("/ws/customer")
+async def customer_websocket_endpoint(
+    websocket: WebSocket,
+    session_token: str
+):
+    """
+    WebSocket endpoint for customer order status updates.
+    Streams new_order, order_update and session_ended events for the session.
+    
+    Args:
+        websocket: WebSocket connection
+        session_token: Table session token
+    """
+    resolved = await resolve_session(session_token)
+    
+    if resolved is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    session_id, store_id = resolved
+    await customer_manager.connect(websocket, session_id, tenant_id=store_id)
+    subscribe_session(session_id, store_id)
+    
+    try:
+        while True:
+            # Keep connection alive and receive messages
+            data = await websocket.receive_text()
+            
+            # Echo back for heartbeat
+            await customer_manager.send_personal(websocket, session_id, {"type": "pong", "message": "Connection alive"})
+    
+    except WebSocketDisconnect:
+        pass
+    
+    finally:
+        customer_manager.disconnect(websocket, session_id)
+        unsubscribe_session(session_id)
+
+
+@router.get("/api/admin/ws/metrics")
+def get_websocket_metrics(admin: AdminPrincipal = Depends(get_current_admin)):
+    """
+    Get per-connection send queue depth and lag metrics for the admin's store.
+    All counts are limited to the store; other stores' traffic is not shown.
+    """
+    return {
+        "connections": manager.get_metrics(admin.store_id),
+        "slow_consumer_disconnects": manager.slow_consumer_count(admin.store_id),
+        "customer_connections": customer_manager.connection_count(admin.store_id),
+        "customer_slow_consumer_disconnects": customer_manager.slow_consumer_count(admin.store_id)
+    }
@@ -2,3 +2,4 @@ from .auth import *
 from .menu import *
 from .order import *
 from .table import *
+from .analytics import *
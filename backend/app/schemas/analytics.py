@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import date
+from ..utils.serialization import JSONSerializer
+
+
+class DailySalesResponse(BaseModel):
+    business_date: date
+    order_count: int
+    subtotal_amount: int
+    tip_amount: int
+    total_amount: int
+
+    class Config:
+        from_attributes = True
+
+
+class DailySalesListResponse(BaseModel):
+    date_from: date
+    date_to: date
+    days: List[DailySalesResponse]
+    order_count: int  # Totals over the range
+    subtotal_amount: int
+    tip_amount: int
+    total_amount: int
+
+
+class MenuSalesResponse(BaseModel):
+    menu_id: int
+    menu_name: str
+    quantity: int
+    subtotal_amount: int
+    order_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class TopMenusResponse(BaseModel):
+    date_from: date
+    date_to: date
+    menus: List[MenuSalesResponse]
+
+
+# Prebuilt serializers for the analytics routes
+daily_sales_serializer = JSONSerializer(DailySalesListResponse)
+top_menus_serializer = JSONSerializer(TopMenusResponse)
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
+from ..utils.serialization import JSONSerializer
 
 
 class CategoryBase(BaseModel):
@@ -45,10 +46,19 @@ class MenuUpdate(BaseModel):
     is_available: Optional[bool] = None
 
 
+class ImageVariant(BaseModel):
+    width: int
+    height: int
+    webp: str
+    jpeg: str
+
+
 class MenuResponse(MenuBase):
     id: int
     category_id: int
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, ImageVariant]] = None  # thumb, card, detail
+    image_placeholder: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -57,3 +67,9 @@ class MenuResponse(MenuBase):
 class MenuListResponse(BaseModel):
     categories: List[CategoryResponse]
     menus: List[MenuResponse]
+
+
+# Prebuilt serializers for the list routes
+categories_serializer = JSONSerializer(List[CategoryResponse])
+menus_serializer = JSONSerializer(List[MenuResponse])
+menu_list_serializer = JSONSerializer(MenuListResponse)
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
+from ..utils.serialization import JSONSerializer
 
 
 class OrderItemCreate(BaseModel):
@@ -46,6 +47,15 @@ class OrderStatusUpdate(BaseModel):
 
 class OrderListResponse(BaseModel):
     orders: List[OrderResponse]
+    total: Optional[int] = None  # Number of orders matching the filters
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
+    changes_cursor: Optional[str] = None  # Pass as `since` to /changes to receive later updates
+
+
+class OrderChangesResponse(BaseModel):
+    orders: List[OrderResponse]  # Orders created or updated since the cursor
+    cursor: str  # Pass as `since` on the next call
+    has_more: bool  # More changes are pending; call again right away
 
 
 class OrderHistoryResponse(BaseModel):
@@ -57,3 +67,8 @@ class OrderHistoryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Prebuilt serializers for the list routes
+order_list_serializer = JSONSerializer(OrderListResponse)
+order_changes_serializer = JSONSerializer(OrderChangesResponse)
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from ..utils.serialization import JSONSerializer
 
 
 class TableBase(BaseModel):
@@ -37,3 +38,7 @@ class TableSessionResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Prebuilt serializer for the list route
+tables_serializer = JSONSerializer(List[TableResponse])
@@ -1,9 +1,29 @@
 from .auth_service import AuthService
 from .table_session_service import TableSessionService
 from .order_service import OrderService
+from .order_query_service import OrderQueryService
+from .async_order_service import AsyncOrderService
+from .async_order_query_service import AsyncOrderQueryService
+from .async_table_session_service import AsyncTableSessionService
+from .session_resolver import SessionResolver
+from .admin_token_service import AdminTokenService
+from .order_archive_service import OrderArchiveService
+from .sales_rollup_service import SalesRollupService
+from .analytics_service import AnalyticsService
+from .order_export_service import OrderExportService
 
 __all__ = [
     "AuthService",
     "TableSessionService",
     "OrderService",
+    "OrderQueryService",
+    "AsyncOrderService",
+    "AsyncOrderQueryService",
+    "AsyncTableSessionService",
+    "SessionResolver",
+    "AdminTokenService",
+    "OrderArchiveService",
+    "SalesRollupService",
+    "AnalyticsService",
+    "OrderExportService",
 ]
@@ -0,0 +1,56 @@
+"""Admin Token Service - Token version checks and revocation for admin JWTs"""
+from typing import Optional
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.admin import Admin
+from ..utils.admin_token_cache import AdminTokenVersionCache, admin_token_cache
+
+
+class AdminTokenService:
+    """Service for validating and revoking admin tokens without a per-request admin lookup"""
+
+    def __init__(self, db: AsyncSession, cache: Optional[AdminTokenVersionCache] = None):
+        self.db = db
+        self.cache = cache or admin_token_cache
+
+    async def get_token_version(self, admin_id: int) -> Optional[int]:
+        """
+        Get an admin's current token version, querying only on a cache miss.
+
+        Args:
+            admin_id: Admin ID
+
+        Returns:
+            Current token version, or None if the admin does not exist
+        """
+        version = self.cache.get(admin_id)
+        if version is not None:
+            return version
+
+        generation = self.cache.generation
+        version = await self.db.scalar(select(Admin.token_version).filter_by(id=admin_id))
+
+        if version is not None:
+            self.cache.put(admin_id, version, generation)
+
+        return version
+
+    async def revoke_tokens(self, admin_id: int) -> int:
+        """
+        Revoke every token issued to an admin so far.
+
+        Args:
+            admin_id: Admin ID
+
+        Returns:
+            New token version
+        """
+        await self.db.execute(
+            update(Admin)
+            .filter_by(id=admin_id)
+            .values(token_version=Admin.token_version + 1)
+        )
+        await self.db.commit()
+        self.cache.invalidate(admin_id)
+
+        return await self.get_token_version(admin_id)
@@ -0,0 +1,76 @@
+"""Analytics Service - Sales reports read from the daily rollups"""
+from typing import List
+from datetime import date
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.sales_rollup import DailySales, DailyMenuSales
+
+
+class AnalyticsService:
+    """
+    Service for sales reports.
+
+    Reads only daily_sales and daily_menu_sales, so a report costs one row
+    per day (and menu) in the range no matter how many orders it covers.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def daily_sales(self, store_id: int, date_from: date, date_to: date) -> List[DailySales]:
+        """
+        Get per-day sales totals.
+
+        Args:
+            store_id: Store ID
+            date_from: First business date (inclusive)
+            date_to: Last business date (inclusive)
+
+        Returns:
+            DailySales rows ordered by date; days without orders are omitted
+        """
+        return (await self.db.scalars(
+            select(DailySales)
+            .where(
+                DailySales.store_id == store_id,
+                DailySales.business_date >= date_from,
+                DailySales.business_date <= date_to,
+                DailySales.order_count > 0
+            )
+            .order_by(DailySales.business_date)
+        )).all()
+
+    async def top_menus(self, store_id: int, date_from: date, date_to: date, limit: int) -> List:
+        """
+        Get the best-selling menus over a date range.
+
+        Args:
+            store_id: Store ID
+            date_from: First business date (inclusive)
+            date_to: Last business date (inclusive)
+            limit: Maximum number of menus
+
+        Returns:
+            Rows of (menu_id, menu_name, quantity, subtotal_amount, order_count),
+            highest quantity first
+        """
+        quantity = func.sum(DailyMenuSales.quantity).label("quantity")
+
+        return (await self.db.execute(
+            select(
+                DailyMenuSales.menu_id,
+                func.max(DailyMenuSales.menu_name).label("menu_name"),
+                quantity,
+                func.sum(DailyMenuSales.subtotal_amount).label("subtotal_amount"),
+                func.sum(DailyMenuSales.order_count).label("order_count")
+            )
+            .where(
+                DailyMenuSales.store_id == store_id,
+                DailyMenuSales.business_date >= date_from,
+                DailyMenuSales.business_date <= date_to
+            )
+            .group_by(DailyMenuSales.menu_id)
+            .having(quantity > 0)
+            .order_by(quantity.desc(), DailyMenuSales.menu_id)
+            .limit(limit)
+        )).all()
@@ -0,0 +1,79 @@
+"""Async Order Query Service - OrderQueryService for AsyncSession callers"""
+from typing import List, Optional, Union
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.order import Order
+from ..models.archived_order import ArchivedOrder
+from .order_query_service import OrderQueryService, OrderPage, OrderChangePage
+
+
+class AsyncOrderQueryService:
+    """
+    Async facade over OrderQueryService.
+
+    Queries run through `AsyncSession.run_sync`; results are returned with
+    their relationships already eager-loaded.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_orders(
+        self,
+        status: Optional[str] = None,
+        session_id: Optional[int] = None,
+        include_history: bool = False,
+        store_id: Optional[int] = None
+    ) -> List[Order]:
+        """Get orders, newest first. See OrderQueryService.list_orders."""
+        return await self.db.run_sync(
+            lambda session: OrderQueryService(session).list_orders(status, session_id, include_history, store_id)
+        )
+
+    async def paginate_orders(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        session_id: Optional[int] = None,
+        table_id: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        store_id: Optional[int] = None,
+        archived: bool = False,
+        include_total: bool = False
+    ) -> OrderPage:
+        """Get one page of orders. See OrderQueryService.paginate_orders."""
+        return await self.db.run_sync(
+            lambda session: OrderQueryService(session).paginate_orders(
+                limit, cursor, status, session_id, table_id, created_from, created_to, store_id, archived,
+                include_total
+            )
+        )
+
+    async def get_order(
+        self,
+        order_id: int,
+        session_id: Optional[int] = None,
+        include_history: bool = False,
+        store_id: Optional[int] = None,
+        include_archived: bool = False
+    ) -> Optional[Union[Order, ArchivedOrder]]:
+        """Get a single order by ID. See OrderQueryService.get_order."""
+        return await self.db.run_sync(
+            lambda session: OrderQueryService(session).get_order(
+                order_id, session_id, include_history, store_id, include_archived
+            )
+        )
+
+    async def latest_change_cursor(self, store_id: int) -> str:
+        """Get the store's latest change cursor. See OrderQueryService.latest_change_cursor."""
+        return await self.db.run_sync(
+            lambda session: OrderQueryService(session).latest_change_cursor(store_id)
+        )
+
+    async def get_changes(self, store_id: int, since: Optional[str] = None, limit: int = 200) -> OrderChangePage:
+        """Get orders changed since a cursor. See OrderQueryService.get_changes."""
+        return await self.db.run_sync(
+            lambda session: OrderQueryService(session).get_changes(store_id, since, limit)
+        )
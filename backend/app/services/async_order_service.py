@@ -0,0 +1,72 @@
+"""Async Order Service - OrderService for AsyncSession callers"""
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.order import Order
+from ..utils.events import OrderEventBus
+from .order_service import OrderService, OrderItemData
+
+
+class AsyncOrderService:
+    """
+    Async facade over OrderService.
+
+    Each call runs the sync business logic through `AsyncSession.run_sync`,
+    so SQL goes through the async driver without blocking the event loop
+    and the rules stay defined in one place.
+    """
+
+    def __init__(self, db: AsyncSession, event_bus: Optional[OrderEventBus] = None):
+        self.db = db
+        self.event_bus = event_bus
+
+    async def create_order(
+        self,
+        session_id: int,
+        items: List[OrderItemData],
+        tip_rate: int
+    ) -> Order:
+        """
+        Create a new order.
+        
+        Args:
+            session_id: Session ID
+            items: List of order items (menu_id, quantity)
+            tip_rate: Tip rate
+            
+        Returns:
+            Created Order object with items loaded
+            
+        Raises:
+            SessionNotActiveError: If session is not active
+            MenuNotAvailableError: If menu is not available
+            InvalidQuantityError: If quantity is <= 0
+        """
+        def create(session):
+            order = OrderService(session, self.event_bus).create_order(session_id, items, tip_rate)
+            order.items  # Load before leaving the sync context
+            return order
+        
+        return await self.db.run_sync(create)
+
+    async def update_order_status(self, order_id: int, new_status: str, store_id: Optional[int] = None) -> Order:
+        """
+        Update order status.
+        
+        Args:
+            order_id: Order ID
+            new_status: New status value
+            store_id: Restrict the update to this store's orders
+            
+        Returns:
+            Updated Order object with items loaded
+            
+        Raises:
+            OrderNotFoundError: If order does not exist
+            InvalidStatusError: If status value is invalid
+        """
+        def update(session):
+            order = OrderService(session, self.event_bus).update_order_status(order_id, new_status, store_id)
+            order.items  # Load before leaving the sync context
+            return order
+        
+        return await self.db.run_sync(update)
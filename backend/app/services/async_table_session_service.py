@@ -0,0 +1,36 @@
+"""Async Table Session Service - TableSessionService for AsyncSession callers"""
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.table_session import TableSession
+from ..utils.events import OrderEventBus
+from .table_session_service import TableSessionService
+
+
+class AsyncTableSessionService:
+    """
+    Async facade over TableSessionService.
+
+    Each call runs the sync lifecycle logic through `AsyncSession.run_sync`.
+    """
+
+    def __init__(self, db: AsyncSession, event_bus: Optional[OrderEventBus] = None):
+        self.db = db
+        self.event_bus = event_bus
+
+    async def create_session(self, table_id: int) -> TableSession:
+        """Create a new table session. See TableSessionService.create_session."""
+        return await self.db.run_sync(
+            lambda session: TableSessionService(session, self.event_bus).create_session(table_id)
+        )
+
+    async def get_active_session(self, table_id: int) -> Optional[TableSession]:
+        """Get active session for a table. See TableSessionService.get_active_session."""
+        return await self.db.run_sync(
+            lambda session: TableSessionService(session, self.event_bus).get_active_session(table_id)
+        )
+
+    async def end_session(self, session_id: int) -> bool:
+        """End a session. See TableSessionService.end_session."""
+        return await self.db.run_sync(
+            lambda session: TableSessionService(session, self.event_bus).end_session(session_id)
+        )
@@ -21,7 +21,7 @@ class AuthService:
         """
         # Bcrypt has a 72 byte limit
         password_bytes = password.encode('utf-8')[:72]
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
 
@@ -41,6 +41,22 @@ class AuthService:
         hashed_bytes = hashed_password.encode('utf-8')
         return bcrypt.checkpw(password_bytes, hashed_bytes)
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check whether a hash was made with a different cost factor.
+        
+        Args:
+            hashed_password: Bcrypt hash ($2b$<cost>$...)
+            
+        Returns:
+            True if the hash cost differs from BCRYPT_ROUNDS
+        """
+        try:
+            cost = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return True
+        return cost != settings.BCRYPT_ROUNDS
+
     def create_jwt_token(self, payload: Dict, expires_hours: int = 16) -> str:
         """
         Create a JWT token.
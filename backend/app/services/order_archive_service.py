@@ -0,0 +1,129 @@
+"""Order Archive Service - Moves orders of long-ended sessions into the archive tables"""
+from typing import List, Optional
+from datetime import datetime, timedelta
+from sqlalchemy import DateTime, delete, insert, literal, select
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models.order import Order
+from ..models.order_item import OrderItem
+from ..models.order_history import OrderHistory
+from ..models.order_change import OrderChange
+from ..models.table_session import TableSession
+from ..models.archived_order import ArchivedOrder, ArchivedOrderItem, ArchivedOrderHistory
+
+
+class OrderArchiveService:
+    """
+    Service for archiving orders.
+
+    Orders whose session ended more than `retention_days` ago are copied to
+    `archived_orders` (with their items and history) and deleted from the hot
+    tables, keeping their IDs; their order_changes entries are pruned. Each
+    batch is one transaction, so the write lock is held briefly and an
+    interrupted run loses nothing.
+    OrderQueryService reads the archive when asked for historical orders.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        retention_days: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
+        self.db = db
+        self.retention_days = settings.ORDER_ARCHIVE_RETENTION_DAYS if retention_days is None else retention_days
+        self.batch_size = batch_size or settings.ORDER_ARCHIVE_BATCH_SIZE
+
+    def archive_orders(self, now: Optional[datetime] = None, max_batches: Optional[int] = None) -> int:
+        """
+        Archive orders of sessions that ended before the retention cutoff.
+
+        Args:
+            now: Current time (defaults to utcnow)
+            max_batches: Stop after this many batches
+
+        Returns:
+            Number of orders archived
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=self.retention_days)
+        archived = 0
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            order_ids = self._next_batch(cutoff)
+            if not order_ids:
+                break
+
+            self._move_batch(order_ids, now)
+            archived += len(order_ids)
+            batches += 1
+
+            if len(order_ids) < self.batch_size:
+                break
+
+        return archived
+
+    def _next_batch(self, cutoff: datetime) -> List[int]:
+        """
+        Get the IDs of the next batch of orders to archive.
+
+        Args:
+            cutoff: Sessions ended before this time are archived
+
+        Returns:
+            Up to batch_size order IDs
+        """
+        return self.db.execute(
+            select(Order.id)
+            .join(TableSession, Order.session_id == TableSession.id)
+            .where(TableSession.ended_at < cutoff)
+            .order_by(Order.id)
+            .limit(self.batch_size)
+        ).scalars().all()
+
+    def _move_batch(self, order_ids: List[int], archived_at: datetime):
+        """
+        Copy a batch of orders to the archive and delete the originals in one transaction.
+
+        Args:
+            order_ids: Order IDs to move
+            archived_at: Archive timestamp
+        """
+        order_columns = [column.name for column in Order.__table__.columns]
+
+        try:
+            self.db.execute(
+                insert(ArchivedOrder).from_select(
+                    order_columns + ["archived_at"],
+                    select(*Order.__table__.columns, literal(archived_at, DateTime))
+                    .where(Order.id.in_(order_ids))
+                )
+            )
+            self.db.execute(
+                insert(ArchivedOrderItem).from_select(
+                    [column.name for column in OrderItem.__table__.columns],
+                    select(OrderItem.__table__).where(OrderItem.order_id.in_(order_ids))
+                )
+            )
+            self.db.execute(
+                insert(ArchivedOrderHistory).from_select(
+                    [column.name for column in OrderHistory.__table__.columns],
+                    select(OrderHistory.__table__).where(OrderHistory.order_id.in_(order_ids))
+                )
+            )
+
+            for model in (OrderHistory, OrderItem, OrderChange):
+                self.db.execute(
+                    delete(model).where(model.order_id.in_(order_ids)),
+                    execution_options={"synchronize_session": False}
+                )
+            self.db.execute(
+                delete(Order).where(Order.id.in_(order_ids)),
+                execution_options={"synchronize_session": False}
+            )
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
@@ -0,0 +1,175 @@
+"""Order Export Service - Streams orders and order lines for accounting exports"""
+from typing import AsyncIterator, Dict, List, Optional
+from datetime import datetime
+from sqlalchemy import Select, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import settings
+from ..models.order import Order
+from ..models.order_item import OrderItem
+from ..models.archived_order import ArchivedOrder, ArchivedOrderItem
+from ..models.table import Table
+from ..models.table_session import TableSession
+
+ORDER_EXPORT_COLUMNS = [
+    "order_id", "order_number", "table_number", "session_id", "status",
+    "subtotal_amount", "tip_rate", "tip_amount", "total_amount", "created_at", "archived",
+]
+
+ITEM_EXPORT_COLUMNS = [
+    "order_id", "order_number", "table_number", "session_id", "status", "created_at", "archived",
+    "item_id", "menu_id", "menu_name", "menu_price", "quantity", "subtotal",
+]
+
+
+class OrderExportService:
+    """
+    Service for exporting a store's orders.
+
+    Rows are selected as plain columns (no ORM objects) and streamed with
+    `yield_per`, so the database driver fetches them in batches through a
+    server-side cursor and memory stays constant however many orders match.
+    Live orders are exported first, then archived ones.
+    """
+
+    def __init__(self, db: AsyncSession, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+
+    def _order_columns(self, model, archived: bool) -> List:
+        """Order metadata columns shared by both export shapes"""
+        return [
+            model.id.label("order_id"),
+            model.order_number,
+            Table.table_number,
+            model.session_id,
+            model.status,
+            model.created_at,
+            literal(archived).label("archived"),
+        ]
+
+    def _filter(
+        self,
+        query: Select,
+        model,
+        store_id: int,
+        status: Optional[str],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime]
+    ) -> Select:
+        """
+        Join the table and apply the store, status and date filters.
+
+        Returns:
+            Filtered query
+        """
+        query = (
+            query.join(TableSession, model.session_id == TableSession.id)
+            .join(Table, TableSession.table_id == Table.id)
+            .where(model.store_id == store_id)
+        )
+
+        if status:
+            query = query.where(model.status == status)
+
+        if created_from is not None:
+            query = query.where(model.created_at >= created_from)
+
+        if created_to is not None:
+            query = query.where(model.created_at < created_to)
+
+        return query
+
+    async def _stream(self, queries: List[Select]) -> AsyncIterator[List[Dict]]:
+        """
+        Run queries one after another, yielding rows in batches.
+
+        Args:
+            queries: Select statements to stream
+
+        Yields:
+            Lists of up to batch_size row dicts
+        """
+        for query in queries:
+            result = await self.db.stream(query.execution_options(yield_per=self.batch_size))
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+    def iter_orders(
+        self,
+        store_id: int,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        include_archived: bool = True
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Stream a store's orders, oldest first.
+
+        Args:
+            store_id: Store ID
+            status: Filter by order status
+            created_from: Only orders created at or after this time
+            created_to: Only orders created before this time
+            include_archived: Also export archived orders
+
+        Returns:
+            Async iterator of row batches keyed by ORDER_EXPORT_COLUMNS
+        """
+        models = [(Order, False)]
+        if include_archived:
+            models.append((ArchivedOrder, True))
+        queries = []
+
+        for model, archived in models:
+            query = select(
+                *self._order_columns(model, archived),
+                model.subtotal_amount,
+                model.tip_rate,
+                model.tip_amount,
+                model.total_amount
+            )
+            query = self._filter(query, model, store_id, status, created_from, created_to)
+            queries.append(query.order_by(model.created_at, model.id))
+
+        return self._stream(queries)
+
+    def iter_items(
+        self,
+        store_id: int,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        include_archived: bool = True
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Stream a store's order lines flattened with their order metadata, oldest order first.
+
+        Args:
+            store_id: Store ID
+            status: Filter by order status
+            created_from: Only orders created at or after this time
+            created_to: Only orders created before this time
+            include_archived: Also export lines of archived orders
+
+        Returns:
+            Async iterator of row batches keyed by ITEM_EXPORT_COLUMNS
+        """
+        models = [(Order, OrderItem, False)]
+        if include_archived:
+            models.append((ArchivedOrder, ArchivedOrderItem, True))
+        queries = []
+
+        for model, item_model, archived in models:
+            query = select(
+                *self._order_columns(model, archived),
+                item_model.id.label("item_id"),
+                item_model.menu_id,
+                item_model.menu_name,
+                item_model.menu_price,
+                item_model.quantity,
+                item_model.subtotal
+            ).select_from(item_model).join(model, item_model.order_id == model.id)
+            query = self._filter(query, model, store_id, status, created_from, created_to)
+            queries.append(query.order_by(model.created_at, model.id, item_model.id))
+
+        return self._stream(queries)
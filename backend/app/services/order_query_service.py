@@ -0,0 +1,330 @@
+"""Order Query Service - Read-side access to orders with eager-loaded relationships"""
+from typing import List, NamedTuple, Optional, Tuple, Type, Union
+from datetime import datetime
+import base64
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, Query, selectinload
+from ..models.order import Order
+from ..models.archived_order import ArchivedOrder
+from ..models.order_change import OrderChange
+from ..models.table_session import TableSession
+from ..utils.errors import InvalidCursorError
+
+
+class OrderPage(NamedTuple):
+    """One page of orders from keyset pagination"""
+    orders: List[Union[Order, ArchivedOrder]]
+    total: Optional[int]  # Only when requested with include_total
+    next_cursor: Optional[str]
+
+
+class OrderChangePage(NamedTuple):
+    """Orders changed since a change cursor"""
+    orders: List[Order]
+    cursor: str
+    has_more: bool
+
+
+def encode_cursor(created_at: datetime, order_id: int) -> str:
+    """
+    Encode an order's sort key as an opaque pagination cursor.
+
+    Args:
+        created_at: Order creation time
+        order_id: Order ID
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{order_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a pagination cursor into its (created_at, id) sort key.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at, order_id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, order_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(order_id)
+    except (ValueError, UnicodeError):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+
+def decode_change_cursor(cursor: str) -> int:
+    """
+    Decode a change cursor into the last seen order_changes ID.
+
+    Args:
+        cursor: Cursor from a previous changes response
+
+    Returns:
+        Change ID
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if not cursor.isdigit():
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return int(cursor)
+
+
+class OrderQueryService:
+    """
+    Service for reading orders.
+
+    Every query loads `Order.items` (and optionally `Order.history`) with
+    selectin loading, so serializing N orders costs a fixed number of SQL
+    statements instead of one lazy load per order.
+
+    Orders moved out by OrderArchiveService are read from `archived_orders`
+    when a caller asks for them; ArchivedOrder has the same attributes as
+    Order, so both serialize with OrderResponse.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _base_query(self, include_history: bool = False, model: Type = Order) -> Query:
+        """
+        Build the base order query with eager loading options.
+
+        Args:
+            include_history: Also eager-load status change history
+            model: Order or ArchivedOrder
+
+        Returns:
+            SQLAlchemy Query for the model
+        """
+        options = [selectinload(model.items)]
+        if include_history:
+            options.append(selectinload(model.history))
+        return self.db.query(model).options(*options)
+
+    def list_orders(
+        self,
+        status: Optional[str] = None,
+        session_id: Optional[int] = None,
+        include_history: bool = False,
+        store_id: Optional[int] = None
+    ) -> List[Order]:
+        """
+        Get orders, newest first.
+
+        Args:
+            status: Filter by order status
+            session_id: Filter by table session
+            include_history: Also eager-load status change history
+            store_id: Filter by store
+
+        Returns:
+            List of Order objects with items loaded
+        """
+        query = self._base_query(include_history)
+
+        if store_id is not None:
+            query = query.filter(Order.store_id == store_id)
+
+        if status:
+            query = query.filter(Order.status == status)
+
+        if session_id is not None:
+            query = query.filter(Order.session_id == session_id)
+
+        return query.order_by(Order.created_at.desc(), Order.id.desc()).all()
+
+    def paginate_orders(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        session_id: Optional[int] = None,
+        table_id: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        store_id: Optional[int] = None,
+        archived: bool = False,
+        include_total: bool = False
+    ) -> OrderPage:
+        """
+        Get one page of orders, newest first, using keyset pagination.
+
+        Pages are keyed on (created_at, id), so the cost of fetching a page
+        depends on the page size rather than on how many orders precede it.
+        Counting every matching order does not, so the total is opt-in.
+
+        Args:
+            limit: Maximum number of orders to return
+            cursor: Cursor returned with the previous page
+            status: Filter by order status
+            session_id: Filter by table session
+            table_id: Filter by table
+            created_from: Only orders created at or after this time
+            created_to: Only orders created before this time
+            store_id: Filter by store (uses the store-prefixed indexes)
+            archived: Page through archived orders instead of live ones
+            include_total: Also count all orders matching the filters
+
+        Returns:
+            OrderPage with orders, total matching count (or None) and next cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        model = ArchivedOrder if archived else Order
+        query = self.db.query(model)
+
+        if store_id is not None:
+            query = query.filter(model.store_id == store_id)
+
+        if status:
+            query = query.filter(model.status == status)
+
+        if session_id is not None:
+            query = query.filter(model.session_id == session_id)
+
+        if table_id is not None:
+            query = query.join(TableSession, model.session_id == TableSession.id).filter(
+                TableSession.table_id == table_id
+            )
+
+        if created_from is not None:
+            query = query.filter(model.created_at >= created_from)
+
+        if created_to is not None:
+            query = query.filter(model.created_at < created_to)
+
+        total = query.with_entities(func.count(model.id)).scalar() if include_total else None
+
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            query = query.filter(or_(
+                model.created_at < cursor_created_at,
+                and_(model.created_at == cursor_created_at, model.id < cursor_id)
+            ))
+
+        # Fetch one extra row to learn whether another page exists
+        orders = (
+            query.options(selectinload(model.items))
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = encode_cursor(orders[-1].created_at, orders[-1].id)
+
+        return OrderPage(orders=orders, total=total, next_cursor=next_cursor)
+
+    def get_order(
+        self,
+        order_id: int,
+        session_id: Optional[int] = None,
+        include_history: bool = False,
+        store_id: Optional[int] = None,
+        include_archived: bool = False
+    ) -> Optional[Union[Order, ArchivedOrder]]:
+        """
+        Get a single order by ID.
+
+        Args:
+            order_id: Order ID
+            session_id: Restrict lookup to this table session
+            include_history: Also eager-load status change history
+            store_id: Restrict lookup to this store
+            include_archived: Fall back to the archive if the order is not live
+
+        Returns:
+            Order (or ArchivedOrder) object with items loaded, or None
+        """
+        models = (Order, ArchivedOrder) if include_archived else (Order,)
+
+        for model in models:
+            query = self._base_query(include_history, model).filter(model.id == order_id)
+
+            if session_id is not None:
+                query = query.filter(model.session_id == session_id)
+
+            if store_id is not None:
+                query = query.filter(model.store_id == store_id)
+
+            order = query.first()
+            if order is not None:
+                return order
+
+        return None
+
+    def latest_change_cursor(self, store_id: int) -> str:
+        """
+        Get a change cursor pointing at the store's latest order change.
+
+        Args:
+            store_id: Store ID
+
+        Returns:
+            Change cursor; changes made after this call are returned by get_changes
+        """
+        latest = self.db.query(func.max(OrderChange.id)).filter(OrderChange.store_id == store_id).scalar()
+        return str(latest or 0)
+
+    def get_changes(self, store_id: int, since: Optional[str] = None, limit: int = 200) -> OrderChangePage:
+        """
+        Get orders created or updated after a change cursor.
+
+        Reads the order_changes log, whose IDs only grow, so no change is
+        skipped between calls. Without `since`, returns no orders and the
+        current cursor.
+
+        The cursor assumes changes become visible in ID order, which holds
+        on SQLite, where one writer commits at a time. With concurrent
+        writers (PostgreSQL), a transaction can commit a lower ID after a
+        reader has moved past it, and that change would be skipped for
+        good; like DatabaseEventBroker, the feed is SQLite only.
+
+        Args:
+            store_id: Store ID
+            since: Cursor from a previous changes response or order list
+            limit: Maximum number of changes to consume
+
+        Returns:
+            OrderChangePage with changed orders (in order of their latest change),
+            the next cursor and whether more changes are pending
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        if since is None:
+            return OrderChangePage(orders=[], cursor=self.latest_change_cursor(store_id), has_more=False)
+
+        changes = (
+            self.db.query(OrderChange.id, OrderChange.order_id)
+            .filter(OrderChange.store_id == store_id, OrderChange.id > decode_change_cursor(since))
+            .order_by(OrderChange.id)
+            .limit(limit + 1)
+            .all()
+        )
+
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        if not changes:
+            return OrderChangePage(orders=[], cursor=since, has_more=False)
+
+        # Latest change position per order
+        positions = {change.order_id: index for index, change in enumerate(changes)}
+        orders = self._base_query().filter(Order.id.in_(positions)).all()
+        orders.sort(key=lambda order: positions[order.id])
+
+        return OrderChangePage(orders=orders, cursor=str(changes[-1].id), has_more=has_more)
@@ -1,13 +1,20 @@
 """Order Service - Core business logic for order creation and management"""
-from typing import List
+from typing import List, Optional
 from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, insert, update
+from sqlalchemy.exc import IntegrityError
 from ..models.order import Order, OrderStatus
 from ..models.order_item import OrderItem
 from ..models.order_history import OrderHistory
 from ..models.table_session import TableSession
 from ..models.menu import Menu
+from ..models.order_sequence import OrderSequence
+from ..models.order_change import OrderChange
+from ..schemas.order import OrderResponse
+from .sales_rollup_service import SalesRollupService
+from ..utils.business_day import get_business_date
+from ..utils.events import OrderEventBus, OrderEvent, OrderEventType, order_events
 from ..utils.errors import (
     InvalidTipRateError, SessionNotActiveError,
     MenuNotAvailableError, InvalidQuantityError,
@@ -27,30 +34,70 @@ class OrderService:
 
     ALLOWED_TIP_RATES = [0, 5, 10, 15, 20]
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, event_bus: Optional[OrderEventBus] = None):
         self.db = db
+        self.event_bus = event_bus or order_events
+
+    def _publish(self, event_type: str, store_id: int, order: Order):
+        """
+        Publish an order event after commit.
+        
+        Args:
+            event_type: OrderEventType value
+            store_id: Store ID
+            order: Committed Order object
+        """
+        if not self.event_bus.has_subscribers(store_id):
+            return
+        
+        data = OrderResponse.model_validate(order).model_dump(mode="json")
+        data["session_id"] = order.session_id
+        self.event_bus.publish(OrderEvent(type=event_type, store_id=store_id, data=data))
+
+    def get_business_date(self, moment: Optional[datetime] = None) -> date:
+        """
+        Get the business date for a point in time.
+        
+        Args:
+            moment: Naive UTC datetime (default: now)
+            
+        Returns:
+            Business date (see utils.business_day)
+        """
+        return get_business_date(moment)
 
     def generate_order_number(self, store_id: int, order_date: date) -> str:
         """
-        Generate sequential order number per store per day.
+        Allocate the next sequential order number per store per day.
+        
+        Increments the (store_id, business_date) counter in the current
+        transaction, so concurrent orders get unique numbers and a rolled
+        back order does not leave a gap.
         
         Args:
             store_id: Store ID
-            order_date: Order date
+            order_date: Business date
             
         Returns:
             Order number (e.g., "#001")
         """
-        # Get today's orders count
-        start_of_day = datetime(order_date.year, order_date.month, order_date.day)
-        end_of_day = datetime(order_date.year, order_date.month, order_date.day, 23, 59, 59)
+        sequence = OrderSequence.__table__
+        key = (sequence.c.store_id == store_id) & (sequence.c.business_date == order_date)
+        increment = update(sequence).where(key).values(last_value=sequence.c.last_value + 1)
+        
+        result = self.db.execute(increment)
         
-        count = self.db.query(func.count(Order.id)).filter(
-            Order.created_at >= start_of_day,
-            Order.created_at <= end_of_day
-        ).scalar()
+        if result.rowcount == 0:
+            # First order of the day; another transaction may insert concurrently
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(
+                        insert(sequence).values(store_id=store_id, business_date=order_date, last_value=1)
+                    )
+            except IntegrityError:
+                self.db.execute(increment)
         
-        next_number = count + 1
+        next_number = self.db.execute(select(sequence.c.last_value).where(key)).scalar_one()
         return f"#{next_number:03d}"
 
     def calculate_tip(self, subtotal: int, tip_rate: int) -> int:
@@ -100,26 +147,39 @@ class OrderService:
         if not session or session.ended_at is not None:
             raise SessionNotActiveError(f"Session {session_id} is not active")
         
-        # Validate items
-        subtotal = 0
-        order_items = []
+        # Resolve all requested menus in one query
+        menu_ids = {item.menu_id for item in items}
+        menus = {
+            menu.id: menu
+            for menu in self.db.query(Menu).filter(Menu.id.in_(menu_ids)).all()
+        }
+        
+        # Validate items, merging duplicate menu lines in first-seen order
+        quantities = {}
         
         for item in items:
             if item.quantity <= 0:
                 raise InvalidQuantityError(f"Quantity must be greater than 0")
             
-            menu = self.db.query(Menu).filter_by(id=item.menu_id).first()
+            menu = menus.get(item.menu_id)
             if not menu or not menu.is_available:
                 raise MenuNotAvailableError(f"Menu {item.menu_id} is not available")
             
-            item_subtotal = menu.price * item.quantity
+            quantities[menu.id] = quantities.get(menu.id, 0) + item.quantity
+        
+        subtotal = 0
+        order_items = []
+        
+        for menu_id, quantity in quantities.items():
+            menu = menus[menu_id]
+            item_subtotal = menu.price * quantity
             subtotal += item_subtotal
             
             order_items.append({
                 "menu_id": menu.id,
                 "menu_name": menu.name,
                 "menu_price": menu.price,
-                "quantity": item.quantity,
+                "quantity": quantity,
                 "subtotal": item_subtotal
             })
         
@@ -127,52 +187,71 @@ class OrderService:
         tip_amount = self.calculate_tip(subtotal, tip_rate)
         total_amount = subtotal + tip_amount
         
+        store_id = session.table.store_id
+        created_at = datetime.utcnow()
+        business_date = self.get_business_date(created_at)
+        
         # Generate order number
-        order_number = self.generate_order_number(store_id=1, order_date=date.today())
+        order_number = self.generate_order_number(
+            store_id=store_id,
+            order_date=business_date
+        )
         
         # Create order
         order = Order(
+            store_id=store_id,
             session_id=session_id,
             order_number=order_number,
             subtotal_amount=subtotal,
             tip_rate=tip_rate,
             tip_amount=tip_amount,
             total_amount=total_amount,
-            status=OrderStatus.PENDING
+            status=OrderStatus.PENDING,
+            created_at=created_at
         )
         
         self.db.add(order)
         self.db.flush()
         
-        # Create order items
-        for item_data in order_items:
-            order_item = OrderItem(
-                order_id=order.id,
-                **item_data
+        # Create order items in a single bulk insert
+        if order_items:
+            self.db.execute(
+                insert(OrderItem),
+                [{"order_id": order.id, **item_data} for item_data in order_items]
             )
-            self.db.add(order_item)
+        
+        SalesRollupService(self.db).apply_order(order, order_items, business_date)
+        self.db.add(OrderChange(store_id=store_id, order_id=order.id))
         
         self.db.commit()
         self.db.refresh(order)
         
+        self._publish(OrderEventType.NEW_ORDER, store_id, order)
+        
         return order
 
-    def update_order_status(self, order_id: int, new_status: str) -> Order:
+    def update_order_status(self, order_id: int, new_status: str, store_id: Optional[int] = None) -> Order:
         """
         Update order status.
         
         Args:
             order_id: Order ID
             new_status: New status value
+            store_id: Restrict the update to this store's orders
             
         Returns:
             Updated Order object
             
         Raises:
-            OrderNotFoundError: If order does not exist
+            OrderNotFoundError: If order does not exist (in the given store)
             InvalidStatusError: If status value is invalid
         """
-        order = self.db.query(Order).filter_by(id=order_id).first()
+        query = self.db.query(Order).filter_by(id=order_id)
+        
+        if store_id is not None:
+            query = query.filter_by(store_id=store_id)
+        
+        order = query.first()
         
         if not order:
             raise OrderNotFoundError(f"Order {order_id} not found")
@@ -191,9 +270,31 @@ class OrderService:
         )
         self.db.add(history)
         
+        # Cancelling (or restoring) an order moves it out of (or back into) the rollups
+        was_cancelled = order.status == OrderStatus.CANCELLED
+        is_cancelled = status_enum == OrderStatus.CANCELLED
+        if was_cancelled != is_cancelled:
+            SalesRollupService(self.db).apply_order(
+                order,
+                [
+                    {
+                        "menu_id": item.menu_id,
+                        "menu_name": item.menu_name,
+                        "quantity": item.quantity,
+                        "subtotal": item.subtotal
+                    }
+                    for item in order.items
+                ],
+                self.get_business_date(order.created_at),
+                sign=-1 if is_cancelled else 1
+            )
+        
         # Update status
         order.status = status_enum
+        self.db.add(OrderChange(store_id=order.store_id, order_id=order.id))
         self.db.commit()
         self.db.refresh(order)
         
+        self._publish(OrderEventType.ORDER_UPDATE, order.store_id, order)
+        
         return order
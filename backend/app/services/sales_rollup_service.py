@@ -0,0 +1,162 @@
+"""Sales Rollup Service - Incremental daily sales and menu rollups"""
+from typing import Dict, List
+from datetime import date
+from sqlalchemy import and_, delete, distinct, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..models.order import Order, OrderStatus
+from ..models.order_item import OrderItem
+from ..models.archived_order import ArchivedOrder, ArchivedOrderItem
+from ..models.sales_rollup import DailySales, DailyMenuSales
+from ..utils.business_day import business_day_bounds
+
+
+class SalesRollupService:
+    """
+    Service for maintaining the daily_sales and daily_menu_sales rollups.
+
+    OrderService applies each order's amounts in the same transaction that
+    creates it, and subtracts them again when the order is cancelled. The
+    analytics endpoints therefore only read one row per day (and menu).
+    `rebuild_day` recomputes a day from orders and archived orders to
+    backfill or repair the rollups.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _increment(self, model, key: Dict, deltas: Dict, values: Dict = None):
+        """
+        Add deltas to a rollup row, creating it if needed (does not commit).
+
+        Args:
+            model: DailySales or DailyMenuSales
+            key: Primary key column values
+            deltas: Column increments
+            values: Columns to overwrite
+        """
+        table = model.__table__
+        values = values or {}
+        where = and_(*(table.c[column] == value for column, value in key.items()))
+        increment = update(table).where(where).values(
+            **{column: table.c[column] + delta for column, delta in deltas.items()},
+            **values
+        )
+
+        result = self.db.execute(increment)
+
+        if result.rowcount == 0:
+            # First order of the day (or menu); another transaction may insert concurrently
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(insert(table).values(**key, **deltas, **values))
+            except IntegrityError:
+                self.db.execute(increment)
+
+    def apply_order(self, order: Order, items: List[Dict], business_date: date, sign: int = 1):
+        """
+        Add (or with sign=-1 subtract) an order to its day's rollups.
+        The caller commits.
+
+        Args:
+            order: Order with its amounts set
+            items: Order lines as dicts with menu_id, menu_name, quantity, subtotal
+            business_date: Business date of the order
+            sign: 1 to add, -1 to subtract
+        """
+        self._increment(
+            DailySales,
+            {"store_id": order.store_id, "business_date": business_date},
+            {
+                "order_count": sign,
+                "subtotal_amount": sign * order.subtotal_amount,
+                "tip_amount": sign * order.tip_amount,
+                "total_amount": sign * order.total_amount
+            }
+        )
+
+        for item in items:
+            self._increment(
+                DailyMenuSales,
+                {"store_id": order.store_id, "business_date": business_date, "menu_id": item["menu_id"]},
+                {
+                    "quantity": sign * item["quantity"],
+                    "subtotal_amount": sign * item["subtotal"],
+                    "order_count": sign
+                },
+                {"menu_name": item["menu_name"]}
+            )
+
+    def rebuild_day(self, store_id: int, business_date: date):
+        """
+        Recompute one store's rollups for a business day from live and archived orders.
+
+        Args:
+            store_id: Store ID
+            business_date: Business date
+        """
+        start, end = business_day_bounds(business_date)
+        sales = {"order_count": 0, "subtotal_amount": 0, "tip_amount": 0, "total_amount": 0}
+        menus = {}
+
+        for order_model, item_model in ((Order, OrderItem), (ArchivedOrder, ArchivedOrderItem)):
+            filters = (
+                order_model.store_id == store_id,
+                order_model.created_at >= start,
+                order_model.created_at < end,
+                order_model.status != OrderStatus.CANCELLED
+            )
+
+            totals = self.db.execute(
+                select(
+                    func.count(order_model.id),
+                    func.coalesce(func.sum(order_model.subtotal_amount), 0),
+                    func.coalesce(func.sum(order_model.tip_amount), 0),
+                    func.coalesce(func.sum(order_model.total_amount), 0)
+                ).where(*filters)
+            ).one()
+            for column, value in zip(sales, totals):
+                sales[column] += value
+
+            rows = self.db.execute(
+                select(
+                    item_model.menu_id,
+                    func.max(item_model.menu_name),
+                    func.sum(item_model.quantity),
+                    func.sum(item_model.subtotal),
+                    func.count(distinct(item_model.order_id))
+                )
+                .join(order_model, item_model.order_id == order_model.id)
+                .where(*filters)
+                .group_by(item_model.menu_id)
+            ).all()
+            for menu_id, menu_name, quantity, subtotal, order_count in rows:
+                menu = menus.setdefault(
+                    menu_id,
+                    {"menu_name": menu_name, "quantity": 0, "subtotal_amount": 0, "order_count": 0}
+                )
+                menu["quantity"] += quantity
+                menu["subtotal_amount"] += subtotal
+                menu["order_count"] += order_count
+
+        try:
+            for model in (DailySales, DailyMenuSales):
+                self.db.execute(
+                    delete(model).where(model.store_id == store_id, model.business_date == business_date)
+                )
+
+            if sales["order_count"]:
+                self.db.execute(insert(DailySales).values(
+                    store_id=store_id, business_date=business_date, **sales
+                ))
+
+            if menus:
+                self.db.execute(insert(DailyMenuSales), [
+                    {"store_id": store_id, "business_date": business_date, "menu_id": menu_id, **menu}
+                    for menu_id, menu in menus.items()
+                ])
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
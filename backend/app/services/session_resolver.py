@@ -0,0 +1,49 @@
+"""Session Resolver - Cached session token lookup for customer requests"""
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.table import Table
+from ..models.table_session import TableSession
+from ..utils.session_cache import SessionInfo, SessionTokenCache, session_token_cache
+
+
+class SessionResolver:
+    """Resolves session tokens, hitting the database only on a cache miss"""
+
+    def __init__(self, db: AsyncSession, cache: Optional[SessionTokenCache] = None):
+        self.db = db
+        self.cache = cache or session_token_cache
+
+    async def resolve(self, session_token: str) -> Optional[SessionInfo]:
+        """
+        Resolve a session token.
+
+        Args:
+            session_token: Session token
+
+        Returns:
+            SessionInfo (active or ended), or None if the token is unknown
+        """
+        info = self.cache.get(session_token)
+        if info is not None:
+            return info
+
+        generation = self.cache.generation
+        row = (await self.db.execute(
+            select(TableSession.id, TableSession.table_id, TableSession.ended_at, Table.store_id)
+            .join(Table, TableSession.table_id == Table.id)
+            .filter(TableSession.session_token == session_token)
+        )).first()
+
+        if row is None:
+            return None
+
+        info = SessionInfo(
+            session_id=row.id,
+            table_id=row.table_id,
+            store_id=row.store_id,
+            active=row.ended_at is None
+        )
+        self.cache.put(session_token, info, generation)
+
+        return info
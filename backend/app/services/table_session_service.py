@@ -4,14 +4,36 @@ from datetime import datetime
 import secrets
 from sqlalchemy.orm import Session
 from ..models.table_session import TableSession
+from ..utils.events import OrderEventBus, OrderEvent, OrderEventType, order_events
+from ..utils.session_cache import SessionTokenCache, session_token_cache
 from ..utils.errors import ActiveSessionExistsError, SessionNotFoundError, SessionAlreadyEndedError
 
 
 class TableSessionService:
     """Service for handling table session lifecycle"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        event_bus: Optional[OrderEventBus] = None,
+        token_cache: Optional[SessionTokenCache] = None
+    ):
         self.db = db
+        self.event_bus = event_bus or order_events
+        self.token_cache = token_cache or session_token_cache
+
+    def _publish_session_ended(self, session: TableSession):
+        """
+        Publish a session ended event after commit.
+        
+        Args:
+            session: Ended TableSession object
+        """
+        self.event_bus.publish(OrderEvent(
+            type=OrderEventType.SESSION_ENDED,
+            store_id=session.table.store_id,
+            data={"session_id": session.id, "table_id": session.table_id}
+        ))
 
     def create_session(self, table_id: int) -> TableSession:
         """
@@ -30,6 +52,8 @@ class TableSessionService:
             # Automatically end the existing session
             active.ended_at = datetime.utcnow()
             self.db.commit()
+            self.token_cache.invalidate(active.session_token)
+            self._publish_session_ended(active)
         
         # Generate session token
         session_token = secrets.token_urlsafe(32)
@@ -64,7 +88,9 @@ class TableSessionService:
 
     def end_session(self, session_id: int) -> bool:
         """
-        End a session and archive orders.
+        End a session.
+        Its orders move to the archive tables once ORDER_ARCHIVE_RETENTION_DAYS
+        have passed (see OrderArchiveService).
         
         Args:
             session_id: Session ID
@@ -87,5 +113,8 @@ class TableSessionService:
         # End session
         session.ended_at = datetime.utcnow()
         self.db.commit()
+        self.token_cache.invalidate(session.session_token)
+        
+        self._publish_session_ended(session)
         
         return True
@@ -0,0 +1,39 @@
+"""Admin principal and token version cache for admin requests"""
+from typing import Callable, NamedTuple, Optional
+import time
+from ..config import settings
+from .ttl_cache import TTLCache
+
+
+class AdminPrincipal(NamedTuple):
+    """Authenticated admin, built from verified JWT claims"""
+    admin_id: int
+    username: str
+    store_id: int
+    token_version: int
+
+
+class AdminTokenVersionCache(TTLCache):
+    """
+    LRU cache of admin_id -> current token_version with a TTL.
+
+    A JWT is accepted only while its token_version matches the admin's
+    current one. Revoking in this process invalidates the entry at once;
+    the TTL bounds how long other worker processes accept revoked tokens.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__(
+            max_size=max_size or settings.ADMIN_TOKEN_CACHE_MAX_SIZE,
+            ttl_seconds=ttl_seconds or settings.ADMIN_TOKEN_CACHE_TTL_SECONDS,
+            clock=clock
+        )
+
+
+# Global admin token version cache instance
+admin_token_cache = AdminTokenVersionCache()
@@ -0,0 +1,48 @@
+"""Business day helpers based on the store timezone and cutoff hour"""
+from typing import Optional, Tuple
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+from ..config import settings
+
+
+def get_business_date(moment: Optional[datetime] = None) -> date:
+    """
+    Get the business date for a point in time.
+
+    Uses the configured store timezone; moments before the cutoff hour
+    count toward the previous business day.
+
+    Args:
+        moment: Naive UTC datetime (default: now)
+
+    Returns:
+        Business date
+    """
+    if moment is None:
+        moment = datetime.utcnow()
+
+    local = moment.replace(tzinfo=timezone.utc).astimezone(ZoneInfo(settings.STORE_TIMEZONE))
+    return (local - timedelta(hours=settings.BUSINESS_DAY_CUTOFF_HOUR)).date()
+
+
+def _business_day_start(business_date: date) -> datetime:
+    """Naive UTC start of a business day"""
+    local = datetime.combine(
+        business_date,
+        time(settings.BUSINESS_DAY_CUTOFF_HOUR),
+        tzinfo=ZoneInfo(settings.STORE_TIMEZONE)
+    )
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def business_day_bounds(business_date: date) -> Tuple[datetime, datetime]:
+    """
+    Get the naive UTC range [start, end) covered by a business day.
+
+    Args:
+        business_date: Business date
+
+    Returns:
+        Tuple of (start, end)
+    """
+    return _business_day_start(business_date), _business_day_start(business_date + timedelta(days=1))
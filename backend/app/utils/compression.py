@@ -0,0 +1,291 @@
+"""HTTP response compression (gzip, and brotli/zstd when installed)"""
+from typing import Dict, Iterable, Optional
+import zlib
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ..config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Media types worth compressing besides text/* (JPEG, PNG and WebP already are)
+COMPRESSIBLE_TYPES = {"application/json", "application/javascript", "image/svg+xml"}
+
+
+class _BrotliCompressor:
+    """Gives brotli.Compressor the compress/flush interface of zlib"""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _gzip_compressor(level: int):
+    return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _zstd_compressor(level: int):
+    return zstandard.ZstdCompressor(level=level).compressobj()
+
+
+# Streaming compressor factories by content coding
+COMPRESSORS = {"gzip": _gzip_compressor}
+if brotli is not None:
+    COMPRESSORS["br"] = _BrotliCompressor
+if zstandard is not None:
+    COMPRESSORS["zstd"] = _zstd_compressor
+
+
+def available_encodings() -> list:
+    """
+    Get the configured encodings that can be produced, in preference order.
+
+    Returns:
+        List of content codings
+    """
+    return [encoding for encoding in settings.COMPRESSION_ENCODINGS if encoding in COMPRESSORS]
+
+
+def is_compressible(media_type: Optional[str]) -> bool:
+    """
+    Check whether a media type benefits from compression.
+
+    Args:
+        media_type: Content-Type value (parameters are ignored)
+
+    Returns:
+        True for text-like types
+    """
+    if not media_type:
+        return False
+
+    media_type = media_type.split(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: Optional[Iterable[str]] = None) -> Optional[str]:
+    """
+    Pick the preferred encoding the client accepts.
+
+    The server's preference order wins over q-values; q=0 excludes an
+    encoding, and `*` covers encodings the client did not list.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        encodings: Candidate encodings in preference order (default: all available)
+
+    Returns:
+        Content coding, or None to send the body as is
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: Dict[str, float] = {}
+    for value in accept_encoding.split(","):
+        coding, _, params = value.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    for encoding in available_encodings() if encodings is None else encodings:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+
+    return None
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a complete body.
+
+    Args:
+        body: Uncompressed bytes
+        encoding: Content coding
+        level: Compression level (default: COMPRESSION_LEVELS)
+
+    Returns:
+        Compressed bytes
+    """
+    if level is None:
+        level = settings.COMPRESSION_LEVELS[encoding]
+
+    compressor = COMPRESSORS[encoding](level)
+    return compressor.compress(body) + compressor.flush()
+
+
+def precompress(body: bytes) -> Dict[str, bytes]:
+    """
+    Compress a body once with every available encoding, for caching.
+
+    Uses the higher COMPRESSION_SNAPSHOT_LEVELS since the cost is paid once.
+
+    Args:
+        body: Uncompressed bytes
+
+    Returns:
+        Compressed bodies by content coding, in preference order (empty if
+        the body is below COMPRESSION_MIN_SIZE)
+    """
+    if len(body) < settings.COMPRESSION_MIN_SIZE:
+        return {}
+
+    encoded = {}
+    for encoding in available_encodings():
+        compressed = compress(body, encoding, settings.COMPRESSION_SNAPSHOT_LEVELS[encoding])
+        if len(compressed) < len(body):
+            encoded[encoding] = compressed
+
+    return encoded
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    Derive the strong ETag of an encoded representation.
+
+    Args:
+        etag: Quoted ETag of the uncompressed body
+        encoding: Content coding (None for the body itself)
+
+    Returns:
+        Quoted ETag
+    """
+    if not encoding:
+        return etag
+
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class CompressionMiddleware:
+    """
+    Compresses text-like responses with the client's preferred encoding.
+
+    Complete bodies below `minimum_size` are sent as is; streamed bodies are
+    compressed chunk by chunk. Bodies and chunks of at least
+    COMPRESSION_THREADPOOL_SIZE are compressed in the threadpool so they
+    don't stall the event loop. Responses that already carry a
+    Content-Encoding (precompressed snapshots and upload sidecars), ranges
+    and HEAD requests are passed through. Strong ETags of compressed
+    responses are weakened, as the bytes differ from the uncompressed
+    representation.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper of CompressionMiddleware"""
+
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or "content-range" in headers
+                or not is_compressible(headers.get("content-type"))
+            ):
+                self.passthrough = True
+                await self._send(message)
+            else:
+                # Hold the headers until the first body chunk decides the encoding
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is not None:
+            data = await self._offload(self.compressor.compress, body)
+            if not more_body:
+                data += self.compressor.flush()
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if not more_body and len(body) < self.minimum_size:
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        # The representation depends on Accept-Encoding from here on
+        headers.add_vary_header("Accept-Encoding")
+
+        if self.encoding is None:
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        headers["content-encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+        if "accept-ranges" in headers:
+            del headers["accept-ranges"]
+
+        if more_body:
+            self.compressor = COMPRESSORS[self.encoding](settings.COMPRESSION_LEVELS[self.encoding])
+            if "content-length" in headers:
+                del headers["content-length"]
+            data = await self._offload(self.compressor.compress, body)
+        else:
+            data = await self._offload(compress, body, self.encoding)
+            headers["content-length"] = str(len(data))
+
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    @staticmethod
+    async def _offload(func, body: bytes, *args) -> bytes:
+        """Run a compression call inline, or in the threadpool for large bodies"""
+        if len(body) >= settings.COMPRESSION_THREADPOOL_SIZE:
+            return await run_in_threadpool(func, body, *args)
+
+        return func(body, *args)
@@ -1,13 +1,18 @@
 """Dependency injection functions for FastAPI"""
 from fastapi import Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from ..database import get_db
+from ..database import get_async_db
 from ..services.auth_service import AuthService
-from ..models.table_session import TableSession
-from ..models.admin import Admin
+from ..services.admin_token_service import AdminTokenService
+from ..services.session_resolver import SessionResolver
+from ..utils.admin_token_cache import AdminPrincipal
+from ..utils.session_cache import SessionInfo
 from ..utils.errors import TokenExpiredError, InvalidTokenError
 
+# AuthService is stateless; share one instance across requests
+auth_service = AuthService()
+
 
 def verify_token(token: str) -> dict:
     """
@@ -22,8 +27,6 @@ def verify_token(token: str) -> dict:
     Raises:
         HTTPException: If token is invalid or expired
     """
-    auth_service = AuthService()
-    
     try:
         payload = auth_service.verify_jwt_token(token)
         return payload
@@ -33,50 +36,53 @@ def verify_token(token: str) -> dict:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-def get_current_table(
+async def get_current_table(
     session_token: str = Header(...),
-    db: Session = Depends(get_db)
-) -> TableSession:
+    db: AsyncSession = Depends(get_async_db)
+) -> SessionInfo:
     """
     Get current table session from session token.
     
     Args:
         session_token: Session token from header
-        db: Database session
+        db: Async database session (used only on a cache miss)
         
     Returns:
-        TableSession object
+        SessionInfo for the active session
         
     Raises:
         HTTPException: If session not found or ended
     """
-    session = db.query(TableSession).filter_by(session_token=session_token).first()
+    session = await SessionResolver(db).resolve(session_token)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    if session.ended_at is not None:
+    if not session.active:
         raise HTTPException(status_code=400, detail="Session has ended")
     
     return session
 
 
-def get_current_admin(
+async def get_current_admin(
     authorization: str = Header(...),
-    db: Session = Depends(get_db)
-) -> Admin:
+    db: AsyncSession = Depends(get_async_db)
+) -> AdminPrincipal:
     """
     Get current admin from JWT token.
     
+    The principal comes from the verified claims; the only state checked is
+    the admin's token version, which is served from a short-lived cache.
+    
     Args:
         authorization: Authorization header (Bearer token)
-        db: Database session
+        db: Async database session (used only on a cache miss)
         
     Returns:
-        Admin object
+        AdminPrincipal for the token
         
     Raises:
-        HTTPException: If token invalid or admin not found
+        HTTPException: If token invalid or revoked, or admin not found
     """
     # Extract token from "Bearer <token>"
     if not authorization.startswith("Bearer "):
@@ -87,14 +93,25 @@ def get_current_admin(
     # Verify token
     payload = verify_token(token)
     
-    # Get admin
     admin_id = payload.get("admin_id")
-    if not admin_id:
+    store_id = payload.get("store_id")
+    if not admin_id or store_id is None:
         raise HTTPException(status_code=401, detail="Invalid token payload")
     
-    admin = db.query(Admin).filter_by(id=admin_id).first()
+    # Tokens issued before versioning carry no claim and match version 0
+    principal = AdminPrincipal(
+        admin_id=admin_id,
+        username=payload.get("username"),
+        store_id=store_id,
+        token_version=payload.get("token_version", 0)
+    )
     
-    if not admin:
+    current_version = await AdminTokenService(db).get_token_version(admin_id)
+    
+    if current_version is None:
         raise HTTPException(status_code=404, detail="Admin not found")
     
-    return admin
+    if principal.token_version != current_version:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    
+    return principal
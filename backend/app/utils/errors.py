@@ -54,3 +54,36 @@ class OrderNotFoundError(Exception):
 class InvalidStatusError(Exception):
     """Raised when order status value is invalid"""
     pass
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor is malformed"""
+    pass
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when the password hashing pool has too many pending jobs"""
+    pass
+
+
+class LoginRateLimitedError(Exception):
+    """Raised when a username has too many recent failed logins"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class InvalidImageError(Exception):
+    """Raised when an uploaded file is not a decodable image"""
+    pass
+
+
+class FileTooLargeError(Exception):
+    """Raised when an upload exceeds the maximum file size"""
+    pass
+
+
+class ImageProcessingBusyError(Exception):
+    """Raised when the image processing pool has too many pending jobs"""
+    pass
@@ -0,0 +1,194 @@
+"""Cross-process order event broker backed by the database"""
+from typing import Callable, Deque, List, Optional
+from collections import deque
+from datetime import datetime, timedelta
+import asyncio
+import json
+import logging
+import secrets
+import time
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import SessionLocal
+from ..models.broker_event import BrokerEvent
+from .events import EventBroker, InMemoryEventBroker, OrderEvent
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseEventBroker(EventBroker):
+    """
+    Relays order events between worker processes through `broker_events`.
+
+    Every worker sharing a SQLite DATABASE_URL sees every event, with no
+    extra service to run. An event is delivered in the publishing process at
+    once and queued; a background task writes the queue in one transaction
+    and reads the other processes' events on every poll interval, so remote
+    connections lag by about one interval. Readers follow the autoincrement
+    ID, which SQLite's single writer makes visible in order. Databases with
+    concurrent writers (PostgreSQL) can commit IDs out of order, and a reader
+    would skip the late ones for good, so they are not supported. Rows older
+    than the retention are pruned.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        poll_interval_ms: Optional[int] = None,
+        retention_seconds: Optional[int] = None
+    ):
+        super().__init__()
+        self.session_factory = session_factory
+        self.poll_interval = (poll_interval_ms or settings.EVENT_BROKER_POLL_INTERVAL_MS) / 1000
+        self.retention_seconds = retention_seconds or settings.EVENT_BROKER_RETENTION_SECONDS
+        self.origin = secrets.token_hex(8)
+        self._pending: Deque[OrderEvent] = deque()
+        self._last_id: Optional[int] = None
+        self._last_prune = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, event: OrderEvent):
+        self._deliver(event)
+        self._pending.append(event)
+
+    def run_once(self) -> int:
+        """
+        Write queued events, then deliver the other processes' new events.
+
+        Returns:
+            Number of events delivered
+        """
+        db = self.session_factory()
+        try:
+            events = self._exchange(db)
+        finally:
+            db.close()
+
+        for event in events:
+            self._deliver(event)
+
+        return len(events)
+
+    def _exchange(self, db: Session) -> List[OrderEvent]:
+        """
+        Run one write and read round trip.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Events published by other processes since the last round trip
+        """
+        if self._last_id is None:
+            # Start from the current end; earlier events are already stale
+            self._last_id = db.execute(select(func.max(BrokerEvent.id))).scalar() or 0
+
+        outgoing = []
+        while self._pending:
+            outgoing.append(self._pending.popleft())
+
+        now = datetime.utcnow()
+        prune = time.monotonic() - self._last_prune >= self.retention_seconds
+
+        if outgoing or prune:
+            try:
+                if outgoing:
+                    db.execute(insert(BrokerEvent), [
+                        {
+                            "origin": self.origin,
+                            "store_id": event.store_id,
+                            "type": event.type,
+                            "data": json.dumps(event.data),
+                            "created_at": now
+                        }
+                        for event in outgoing
+                    ])
+                if prune:
+                    db.execute(delete(BrokerEvent).where(
+                        BrokerEvent.created_at < now - timedelta(seconds=self.retention_seconds)
+                    ))
+                db.commit()
+            except Exception:
+                db.rollback()
+                self._pending.extendleft(reversed(outgoing))  # Retry on the next round trip
+                raise
+
+            if prune:
+                self._last_prune = time.monotonic()
+
+        rows = db.execute(
+            select(BrokerEvent.id, BrokerEvent.origin, BrokerEvent.store_id, BrokerEvent.type, BrokerEvent.data)
+            .where(BrokerEvent.id > self._last_id)
+            .order_by(BrokerEvent.id)
+        ).all()
+
+        if rows:
+            self._last_id = rows[-1].id
+
+        return [
+            OrderEvent(type=row.type, store_id=row.store_id, data=json.loads(row.data))
+            for row in rows
+            if row.origin != self.origin
+        ]
+
+    async def _run(self):
+        """Exchange events on every poll interval until cancelled"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.run_once)
+            except Exception:
+                logger.exception("Event broker round trip failed")
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def start(self):
+        """Start polling on the running loop"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop polling and flush events published since the last round trip"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        if self._pending:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.run_once)
+            except Exception:
+                logger.exception("Event broker flush failed")
+
+
+def create_event_broker(name: Optional[str] = None) -> EventBroker:
+    """
+    Create the broker selected by EVENT_BROKER.
+
+    Args:
+        name: "memory" (single process) or "database" (multiple workers on SQLite)
+
+    Returns:
+        EventBroker instance
+
+    Raises:
+        ValueError: If the broker is unknown or can't run on DATABASE_URL
+    """
+    name = name or settings.EVENT_BROKER
+
+    if name == "memory":
+        return InMemoryEventBroker()
+    if name == "database":
+        if not settings.DATABASE_URL.startswith("sqlite"):
+            raise ValueError("EVENT_BROKER=database requires a SQLite DATABASE_URL")
+        return DatabaseEventBroker()
+
+    raise ValueError(f"Unknown EVENT_BROKER: {name}")
@@ -0,0 +1,182 @@
+"""Order event bus and its pluggable brokers"""
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, NamedTuple, Optional
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class OrderEventType:
+    """Order event type names (also used as WebSocket message types)"""
+    NEW_ORDER = "new_order"
+    ORDER_UPDATE = "order_update"
+    SESSION_ENDED = "session_ended"
+    MENU_CHANGED = "menu_changed"  # Menu cache invalidation, not sent to clients
+
+
+class OrderEvent(NamedTuple):
+    """An order lifecycle event for one store"""
+    type: str
+    store_id: int
+    data: dict
+
+    def to_message(self) -> dict:
+        """Convert to a WebSocket message dictionary"""
+        return {"type": self.type, "data": self.data}
+
+
+OrderEventHandler = Callable[[OrderEvent], None]
+
+
+class EventBroker(ABC):
+    """
+    Carries published events to the event bus of every process.
+
+    The bus hands each published event to its broker, and the broker calls
+    the `deliver` callback it was attached with in every process that should
+    see the event (including the publishing one). Subclasses implement
+    `publish`; `start` and `stop` are optional hooks.
+    """
+
+    # Whether events reach other processes, whose subscribers this one can't see
+    shared = False
+
+    def __init__(self):
+        self._deliver: Optional[OrderEventHandler] = None
+
+    def attach(self, deliver: OrderEventHandler):
+        """
+        Set the callback receiving events.
+
+        Args:
+            deliver: Callable dispatching an event to local subscribers
+        """
+        self._deliver = deliver
+
+    @abstractmethod
+    def publish(self, event: OrderEvent):
+        """
+        Send an event to every process.
+
+        Args:
+            event: Event to send
+        """
+
+    async def start(self):
+        """Start background work (called on application startup)"""
+
+    async def stop(self):
+        """Stop background work (called on application shutdown)"""
+
+
+class InMemoryEventBroker(EventBroker):
+    """Delivers events within the current process only, on the publishing thread"""
+
+    def publish(self, event: OrderEvent):
+        self._deliver(event)
+
+
+class OrderEventBus:
+    """
+    Publishes order events to per-store subscribers.
+
+    Services publish after their transaction commits. The broker decides
+    which processes receive the event; each one dispatches it to its own
+    subscribers. Handlers may be called on any thread (a threadpool worker
+    or the broker's), so they must hand work off to their own event loop
+    instead of blocking.
+    """
+
+    def __init__(self, broker: Optional[EventBroker] = None):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, List[OrderEventHandler]] = {}
+        self._global_subscribers: List[OrderEventHandler] = []
+        self.use_broker(broker or InMemoryEventBroker())
+
+    def use_broker(self, broker: EventBroker):
+        """
+        Replace the broker carrying published events.
+
+        Args:
+            broker: Broker to publish through
+        """
+        broker.attach(self.dispatch)
+        self.broker = broker
+
+    def subscribe(self, store_id: int, handler: OrderEventHandler):
+        """
+        Register a handler for a store's events.
+
+        Args:
+            store_id: Store ID
+            handler: Callable receiving OrderEvent
+        """
+        with self._lock:
+            self._subscribers.setdefault(store_id, []).append(handler)
+
+    def subscribe_all(self, handler: OrderEventHandler):
+        """
+        Register a handler for every store's events.
+
+        Args:
+            handler: Callable receiving OrderEvent
+        """
+        with self._lock:
+            self._global_subscribers.append(handler)
+
+    def unsubscribe(self, store_id: int, handler: OrderEventHandler):
+        """
+        Remove a previously registered handler.
+
+        Args:
+            store_id: Store ID
+            handler: Handler passed to subscribe
+        """
+        with self._lock:
+            handlers = self._subscribers.get(store_id)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
+            if not handlers:
+                self._subscribers.pop(store_id, None)
+
+    def has_subscribers(self, store_id: int) -> bool:
+        """Check whether any handler may listen to a store (always true with a shared broker)"""
+        if self.broker.shared:
+            return True
+
+        with self._lock:
+            return bool(self._subscribers.get(store_id))
+
+    def publish(self, event: OrderEvent):
+        """
+        Publish an event through the broker.
+
+        Args:
+            event: Event to publish
+        """
+        self.broker.publish(event)
+
+    def dispatch(self, event: OrderEvent):
+        """
+        Deliver an event to this process's handlers for the store and for
+        all stores.
+
+        A failing handler is logged and does not affect the others or the
+        publisher, since the triggering transaction has already committed.
+
+        Args:
+            event: Event to deliver
+        """
+        with self._lock:
+            handlers = self._subscribers.get(event.store_id, []) + self._global_subscribers
+
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Order event handler failed for store %s", event.store_id)
+
+
+# Global order event bus instance
+order_events = OrderEventBus()
@@ -0,0 +1,58 @@
+"""Incremental CSV and NDJSON encoders for streaming exports"""
+from typing import AsyncIterator, Dict, List
+from datetime import date, datetime
+from enum import Enum
+import csv
+import io
+import json
+
+
+def export_value(value):
+    """Convert a column value to its CSV/JSON representation"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def stream_csv(columns: List[str], batches: AsyncIterator[List[Dict]]) -> AsyncIterator[str]:
+    """
+    Encode row batches as CSV, one chunk per batch.
+
+    Args:
+        columns: Header and column order
+        batches: Async iterator of row dict batches
+
+    Yields:
+        CSV text chunks, starting with the header row
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    async for rows in batches:
+        writer.writerows([export_value(row[column]) for column in columns] for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def stream_ndjson(batches: AsyncIterator[List[Dict]]) -> AsyncIterator[str]:
+    """
+    Encode row batches as newline-delimited JSON, one chunk per batch.
+
+    Args:
+        batches: Async iterator of row dict batches
+
+    Yields:
+        NDJSON text chunks
+    """
+    async for rows in batches:
+        yield "".join(
+            json.dumps({key: export_value(value) for key, value in row.items()}, ensure_ascii=False) + "\n"
+            for row in rows
+        )
@@ -0,0 +1,197 @@
+"""Process pool producing resized menu image variants"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+import asyncio
+import base64
+import io
+import multiprocessing
+import os
+import secrets
+import threading
+from PIL import Image, ImageOps, UnidentifiedImageError
+from ..config import settings
+from .errors import ImageProcessingBusyError, InvalidImageError
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """Composite transparency onto white for formats without alpha"""
+    if image.mode != "RGBA":
+        return image
+
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def _save_atomic(image: Image.Image, path: str, temp_dir: str, format: str, **options):
+    """Write an image to a temporary file, then rename it into place"""
+    temp_path = os.path.join(temp_dir, f"{secrets.token_hex(16)}.part")
+    try:
+        image.save(temp_path, format, **options)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def render_variants(
+    source_path: str,
+    output_dir: str,
+    name: str,
+    sizes: Dict[str, int],
+    placeholder_size: int,
+    webp_quality: int,
+    jpeg_quality: int,
+    max_pixels: int,
+    temp_dir: Optional[str] = None
+) -> dict:
+    """
+    Decode an image once and write its resized WebP and JPEG variants.
+
+    Runs in a worker process. Variants are produced largest first, each
+    resized from the previous one, and never upscaled. Each file is renamed
+    into output_dir once complete, so no partial file is ever served.
+
+    Args:
+        source_path: Uploaded image
+        output_dir: Directory for the variant files
+        name: File name prefix of the variants
+        sizes: Variant name to longest edge in pixels
+        placeholder_size: Longest edge of the inline placeholder
+        webp_quality: WebP quality (0-100)
+        jpeg_quality: JPEG quality (0-100)
+        max_pixels: Reject images with more pixels than this
+        temp_dir: Directory for files being written (same filesystem as output_dir)
+
+    Returns:
+        Dict with "variants" (variant name to width, height and the webp
+        and jpeg file names) and "placeholder" (JPEG data URI)
+
+    Raises:
+        InvalidImageError: If the file is not a decodable image or too large
+    """
+    try:
+        with Image.open(source_path) as source:
+            if source.width * source.height > max_pixels:
+                raise InvalidImageError("Image dimensions are too large")
+
+            # Let the JPEG decoder downscale by up to 8x instead of decoding every pixel
+            largest = max(sizes.values())
+            source.draft("RGB", (largest, largest))
+            image = ImageOps.exif_transpose(source)
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+        raise InvalidImageError("Invalid image file")
+
+    temp_dir = temp_dir or output_dir
+    variants = {}
+
+    for variant, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        image.thumbnail((size, size), Image.LANCZOS)
+        webp_name = f"{name}-{variant}.webp"
+        jpeg_name = f"{name}-{variant}.jpg"
+
+        _save_atomic(image, os.path.join(output_dir, webp_name), temp_dir, "WEBP", quality=webp_quality, method=4)
+        _save_atomic(
+            _flatten(image), os.path.join(output_dir, jpeg_name), temp_dir, "JPEG",
+            quality=jpeg_quality, optimize=True, progressive=True
+        )
+
+        variants[variant] = {"width": image.width, "height": image.height, "webp": webp_name, "jpeg": jpeg_name}
+
+    image.thumbnail((placeholder_size, placeholder_size), Image.LANCZOS)
+    buffer = io.BytesIO()
+    _flatten(image).save(buffer, "JPEG", quality=50)
+    placeholder = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+    return {"variants": variants, "placeholder": placeholder}
+
+
+class ImageProcessor:
+    """
+    Runs image decoding and resizing on a small dedicated process pool.
+
+    Resizing a phone photo takes hundreds of milliseconds of CPU while
+    holding the GIL, so it runs in separate processes and neither the event
+    loop nor the request threadpool waits on it. Jobs beyond `max_pending`
+    are rejected up front instead of queueing behind an upload burst.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = max_workers or settings.IMAGE_PROCESS_WORKERS
+        self.max_pending = max_pending or settings.IMAGE_PROCESS_MAX_PENDING
+        self.rejected_count = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of queued and running image jobs"""
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers don't inherit the server's threads and open connections
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    async def process(self, source_path: str, output_dir: str, name: str, temp_dir: Optional[str] = None) -> dict:
+        """
+        Produce the configured variants of an image on the pool.
+
+        Args:
+            source_path: Uploaded image
+            output_dir: Directory for the variant files
+            name: File name prefix of the variants
+            temp_dir: Directory for files being written (defaults to output_dir)
+
+        Returns:
+            Result of render_variants
+
+        Raises:
+            ImageProcessingBusyError: If max_pending jobs are already in flight
+            InvalidImageError: If the file is not a decodable image
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected_count += 1
+                raise ImageProcessingBusyError("Too many images being processed, try again shortly")
+            self._pending += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(),
+                render_variants,
+                source_path,
+                output_dir,
+                name,
+                settings.IMAGE_VARIANTS,
+                settings.IMAGE_PLACEHOLDER_SIZE,
+                settings.IMAGE_WEBP_QUALITY,
+                settings.IMAGE_JPEG_QUALITY,
+                settings.IMAGE_MAX_PIXELS,
+                temp_dir
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global image processor instance
+image_processor = ImageProcessor()
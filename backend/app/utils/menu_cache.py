@@ -0,0 +1,234 @@
+"""Menu snapshot cache for the customer menu endpoint"""
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+import asyncio
+import hashlib
+import threading
+from .compression import precompress
+from .events import OrderEvent, OrderEventBus, OrderEventType, order_events
+
+
+class MenuSnapshot(NamedTuple):
+    """Pre-serialized menu response for one menu version"""
+    version: int
+    body: bytes
+    etag: str
+    encodings: Dict[str, bytes] = {}  # Precompressed bodies by content coding
+
+
+class MenuCache:
+    """
+    Caches serialized menu responses per store.
+
+    Each store has a menu version that admin write routes bump through
+    `invalidate`. A snapshot is rebuilt only when the version it was built
+    for is no longer current, so repeat reads skip the database and Pydantic.
+    Compressed encodings are produced with the snapshot, once per version.
+    A store_id of None stands for the unscoped (all stores) menu.
+
+    With an event bus, invalidations are published as `menu_changed` events
+    so every worker process sharing the broker drops its snapshot, not just
+    the one that handled the admin's write.
+    """
+
+    def __init__(self, event_bus: Optional[OrderEventBus] = None):
+        self.event_bus = event_bus
+        self._lock = threading.Lock()
+        self._versions: Dict[Optional[int], int] = {}
+        self._snapshots: Dict[Optional[int], MenuSnapshot] = {}
+        self._builds: Dict[Tuple[Optional[int], int], asyncio.Future] = {}
+
+    def version(self, store_id: Optional[int]) -> int:
+        """
+        Get the current menu version for a store.
+
+        Args:
+            store_id: Store ID (None for all stores)
+
+        Returns:
+            Current version number
+        """
+        with self._lock:
+            return self._versions.get(store_id, 0)
+
+    def invalidate(self, store_id: Optional[int] = None):
+        """
+        Invalidate a store's menu after a menu or category change.
+
+        Goes through the event bus when there is one (and the store is
+        known), which expires the snapshot in every process.
+
+        Args:
+            store_id: Store whose menu changed (None if unknown)
+        """
+        if self.event_bus is not None and store_id is not None:
+            self.event_bus.publish(OrderEvent(type=OrderEventType.MENU_CHANGED, store_id=store_id, data={}))
+        else:
+            self.expire(store_id)
+
+    def handle_event(self, event: OrderEvent):
+        """
+        Expire the snapshot of a store whose menu changed in any process.
+
+        Args:
+            event: Event from the bus (other types are ignored)
+        """
+        if event.type == OrderEventType.MENU_CHANGED:
+            self.expire(event.store_id)
+
+    def expire(self, store_id: Optional[int] = None):
+        """
+        Bump the menu version in this process.
+
+        The unscoped menu contains every store, so it is always invalidated.
+
+        Args:
+            store_id: Store whose menu changed (None if unknown)
+        """
+        with self._lock:
+            for key in {store_id, None}:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._snapshots.pop(key, None)
+
+    def lookup(self, store_id: Optional[int]) -> Tuple[Optional[MenuSnapshot], int]:
+        """
+        Get the cached snapshot if it is current.
+
+        Args:
+            store_id: Store ID (None for all stores)
+
+        Returns:
+            Tuple of (current snapshot or None, current version). Pass the
+            version to `store` after building a new snapshot.
+        """
+        with self._lock:
+            version = self._versions.get(store_id, 0)
+            snapshot = self._snapshots.get(store_id)
+
+        if snapshot is not None and snapshot.version == version:
+            return snapshot, version
+
+        return None, version
+
+    def store(self, store_id: Optional[int], version: int, body: bytes) -> MenuSnapshot:
+        """
+        Cache a freshly built snapshot along with its compressed encodings.
+
+        Compression is CPU-bound; call this off the event loop.
+
+        The version must be the one returned by `lookup` before building, so
+        a concurrent invalidate makes this snapshot stale rather than
+        wrongly current.
+
+        Args:
+            store_id: Store ID (None for all stores)
+            version: Version the body was built for
+            body: Serialized menu body
+
+        Returns:
+            MenuSnapshot for the body
+        """
+        snapshot = MenuSnapshot(
+            version=version,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            encodings=precompress(body)
+        )
+
+        with self._lock:
+            if self._versions.get(store_id, 0) == version:
+                self._snapshots[store_id] = snapshot
+
+        return snapshot
+
+    def get(self, store_id: Optional[int], build: Callable[[], bytes]) -> MenuSnapshot:
+        """
+        Get the current menu snapshot, building it if stale.
+
+        Args:
+            store_id: Store ID (None for all stores)
+            build: Callable returning the serialized menu body
+
+        Returns:
+            MenuSnapshot for the current version
+        """
+        snapshot, version = self.lookup(store_id)
+
+        if snapshot is None:
+            snapshot = self.store(store_id, version, build())
+
+        return snapshot
+
+    async def get_async(self, store_id: Optional[int], build: Callable[[], Awaitable[bytes]]) -> MenuSnapshot:
+        """
+        Get the current menu snapshot, building it at most once per version.
+
+        Concurrent misses for the same store and version share one build,
+        which runs as its own task so a disconnecting client doesn't cancel
+        it for the others. Compressing the body runs on the default executor.
+
+        Args:
+            store_id: Store ID (None for all stores)
+            build: Coroutine function returning the serialized menu body
+
+        Returns:
+            MenuSnapshot for the current version
+        """
+        snapshot, version = self.lookup(store_id)
+
+        if snapshot is not None:
+            return snapshot
+
+        key = (store_id, version)
+        task = self._builds.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._build(store_id, version, build))
+            self._builds[key] = task
+            task.add_done_callback(lambda _: self._builds.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _build(
+        self,
+        store_id: Optional[int],
+        version: int,
+        build: Callable[[], Awaitable[bytes]]
+    ) -> MenuSnapshot:
+        """Build, compress and cache one snapshot"""
+        body = await build()
+        return await asyncio.get_running_loop().run_in_executor(None, self.store, store_id, version, body)
+
+    def clear(self):
+        """Drop all snapshots and versions"""
+        with self._lock:
+            self._versions.clear()
+            self._snapshots.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag (quoted)
+
+    Returns:
+        True if the client already has this representation
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+
+    return False
+
+
+# Global menu cache instance, invalidated through the order event bus
+menu_cache = MenuCache(order_events)
+order_events.subscribe_all(menu_cache.handle_event)
@@ -0,0 +1,79 @@
+"""Background task that periodically archives old orders"""
+from typing import Callable, Optional
+import asyncio
+import logging
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import SessionLocal
+from ..services.order_archive_service import OrderArchiveService
+
+logger = logging.getLogger(__name__)
+
+
+class OrderArchiver:
+    """
+    Runs OrderArchiveService every `interval_seconds`.
+
+    Each run uses its own session on a worker thread, so batches never block
+    the event loop. A failed run (for example a batch that another worker
+    process already archived) is logged and retried on the next interval.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.interval_seconds = (
+            settings.ORDER_ARCHIVE_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        )
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self) -> int:
+        """
+        Archive all orders past the retention window.
+
+        Returns:
+            Number of orders archived
+        """
+        db = self.session_factory()
+        try:
+            return OrderArchiveService(db).archive_orders()
+        finally:
+            db.close()
+
+    async def _run(self):
+        """Archive on every interval until cancelled"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                archived = await loop.run_in_executor(None, self.run_once)
+                if archived:
+                    logger.info("Archived %s orders", archived)
+            except Exception:
+                logger.exception("Order archival failed")
+
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        """Start the background task on the running loop (no-op if disabled)"""
+        if self.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Cancel the background task"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+# Global order archiver instance
+order_archiver = OrderArchiver()
@@ -0,0 +1,105 @@
+"""Bounded worker pool for bcrypt password hashing"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import asyncio
+import threading
+from ..config import settings
+from ..services.auth_service import AuthService
+from .errors import PasswordHashingBusyError
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool.
+
+    bcrypt releases the GIL, so hashing happens in parallel with request
+    handling. It never occupies the shared Starlette threadpool or the event
+    loop. Jobs beyond `max_pending` are rejected up front instead of queueing
+    behind a login burst.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        auth_service: Optional[AuthService] = None
+    ):
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS
+        self.max_pending = max_pending or settings.PASSWORD_HASH_MAX_PENDING
+        self.auth_service = auth_service or AuthService()
+        self.rejected_count = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of queued and running hash jobs"""
+        return self._pending
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    async def _run(self, func, *args):
+        """
+        Run a hashing function on the pool.
+
+        Raises:
+            PasswordHashingBusyError: If max_pending jobs are already in flight
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected_count += 1
+                raise PasswordHashingBusyError("Too many login attempts in progress, try again shortly")
+            self._pending += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash_password(self, password: str) -> str:
+        """
+        Hash a password on the pool.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Bcrypt hashed password
+        """
+        return await self._run(self.auth_service.hash_password, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash on the pool.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        return await self._run(self.auth_service.verify_password, plain_password, hashed_password)
+
+    def shutdown(self):
+        """Stop the worker threads"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher()
@@ -0,0 +1,98 @@
+"""Per-username login rate limiting"""
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+import math
+import threading
+import time
+from ..config import settings
+from .errors import LoginRateLimitedError
+
+# Sweep expired entries once this many usernames are tracked
+MAX_TRACKED_USERNAMES = 10000
+
+
+class LoginRateLimiter:
+    """
+    Sliding-window limit on failed logins per username.
+
+    Once a username has `max_attempts` failures inside the window, further
+    attempts are refused before any bcrypt work is done. A successful login
+    clears the username's history.
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_attempts = max_attempts or settings.LOGIN_MAX_FAILED_ATTEMPTS
+        self.window_seconds = window_seconds or settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: Dict[str, Deque[float]] = {}
+
+    def _prune(self, username: str, now: float) -> Deque[float]:
+        """Drop failures older than the window; caller holds the lock"""
+        failures = self._failures.get(username)
+        if failures is None:
+            return deque()
+
+        while failures and failures[0] <= now - self.window_seconds:
+            failures.popleft()
+
+        if not failures:
+            del self._failures[username]
+
+        return failures
+
+    def check(self, username: str):
+        """
+        Refuse a login attempt if the username is over its limit.
+
+        Args:
+            username: Login username
+
+        Raises:
+            LoginRateLimitedError: If too many recent attempts failed
+        """
+        now = self._clock()
+
+        with self._lock:
+            failures = self._prune(username, now)
+            if len(failures) < self.max_attempts:
+                return
+            retry_after = math.ceil(failures[0] + self.window_seconds - now)
+
+        raise LoginRateLimitedError("Too many failed login attempts", retry_after=max(retry_after, 1))
+
+    def record_failure(self, username: str):
+        """
+        Record a failed login.
+
+        Args:
+            username: Login username
+        """
+        now = self._clock()
+
+        with self._lock:
+            if len(self._failures) >= MAX_TRACKED_USERNAMES:
+                for key in list(self._failures):
+                    self._prune(key, now)
+            else:
+                self._prune(username, now)
+            self._failures.setdefault(username, deque()).append(now)
+
+    def reset(self, username: str):
+        """
+        Clear a username's failures after a successful login.
+
+        Args:
+            username: Login username
+        """
+        with self._lock:
+            self._failures.pop(username, None)
+
+
+# Global login rate limiter instance
+login_rate_limiter = LoginRateLimiter()
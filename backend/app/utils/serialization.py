@@ -0,0 +1,58 @@
+"""Precompiled response serializers"""
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class JSONSerializer(Generic[T]):
+    """
+    Validates and serializes one response type with a prebuilt TypeAdapter.
+
+    `response` reads ORM objects (or dicts holding them) in a single
+    validation pass and encodes the result straight to JSON bytes in
+    pydantic-core. The returned Response bypasses FastAPI's second
+    validation against `response_model`, which then only documents the
+    route.
+    """
+
+    def __init__(self, type_: Type[T]):
+        self.adapter = TypeAdapter(type_)
+
+    def load(self, value: Any) -> T:
+        """
+        Validate a value, reading attributes of ORM objects.
+
+        Args:
+            value: ORM object(s), dicts or models matching the type
+
+        Returns:
+            Validated value
+        """
+        return self.adapter.validate_python(value, from_attributes=True)
+
+    def dump(self, value: Any) -> bytes:
+        """
+        Validate and encode a value as JSON.
+
+        Args:
+            value: ORM object(s), dicts or models matching the type
+
+        Returns:
+            JSON bytes
+        """
+        return self.adapter.dump_json(self.load(value))
+
+    def response(self, value: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        Build a JSON response for a value.
+
+        Args:
+            value: ORM object(s), dicts or models matching the type
+            headers: Extra response headers
+
+        Returns:
+            Response with the encoded body
+        """
+        return Response(content=self.dump(value), media_type="application/json", headers=headers)
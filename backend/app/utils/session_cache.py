@@ -0,0 +1,40 @@
+"""Session token cache for customer requests"""
+from typing import Callable, NamedTuple, Optional
+import time
+from ..config import settings
+from .ttl_cache import TTLCache
+
+
+class SessionInfo(NamedTuple):
+    """What customer routes need to know about a session token"""
+    session_id: int
+    table_id: int
+    store_id: int
+    active: bool
+
+
+class SessionTokenCache(TTLCache):
+    """
+    LRU cache of session token -> SessionInfo with a TTL.
+
+    TableSessionService invalidates a token when its session ends, so this
+    process never serves a stale active flag. Entries also expire after the
+    TTL, which bounds staleness when another worker process ends a session.
+    Unknown tokens are not cached.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__(
+            max_size=max_size or settings.SESSION_CACHE_MAX_SIZE,
+            ttl_seconds=ttl_seconds or settings.SESSION_CACHE_TTL_SECONDS,
+            clock=clock
+        )
+
+
+# Global session token cache instance
+session_token_cache = SessionTokenCache()
@@ -0,0 +1,187 @@
+"""Static file serving for uploads with immutable caching and ranges"""
+from email.utils import formatdate
+from mimetypes import guess_type
+from typing import Optional, Tuple
+import hashlib
+import os
+import re
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+from ..config import settings
+from .compression import encoded_etag, is_compressible, negotiate_encoding
+from .menu_cache import etag_matches
+
+# File names starting with a content hash (originals and their variants)
+HASHED_NAME = re.compile(r"^(?P<digest>[0-9a-f]{16,64})(-[a-z]+)?\.[a-z0-9]+$")
+
+# Precompressed sidecars, in order of preference
+SIDECAR_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single byte range.
+
+    Args:
+        header: Range header value
+        size: File size
+
+    Returns:
+        Inclusive (start, end), (size, size) if the range can't be satisfied,
+        or None to serve the whole file (malformed or multiple ranges)
+    """
+    match = RANGE_HEADER.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    start, end = match.group(1), match.group(2)
+
+    if start == "":
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            return size, size
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+
+    if start >= size or start > end:
+        return size, size
+
+    return start, end
+
+
+class FileRangeResponse(FileResponse):
+    """FileResponse sending one byte range of the file (206)"""
+
+    def __init__(self, path: str, start: int, end: int, size: int, **kwargs):
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["content-range"] = f"bytes {start}-{end}/{size}"
+        headers["content-length"] = str(end - start + 1)
+        super().__init__(path, status_code=206, headers=headers, **kwargs)
+        self.start = start
+        self.end = end
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        remaining = 0 if self.send_header_only else self.end - self.start + 1
+        if remaining:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(self.start)
+                while remaining:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break  # File shrank while sending
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+
+        if self.send_header_only or remaining:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    Serves UPLOAD_DIR with caching suited to content-addressed files.
+
+    Files named after their content hash never change, so they are sent with
+    `Cache-Control: immutable` and a long max-age, and the hash is their
+    strong ETag; tablets fetch each image version once. Other files are
+    revalidated on every use. Single byte ranges (with If-Range) are
+    supported, and a precompressed `.br`/`.gz` sidecar next to a file is
+    sent instead when the client accepts that encoding.
+    """
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        name = os.path.basename(full_path)
+        hashed = HASHED_NAME.match(name)
+
+        if hashed:
+            etag = f'"{hashed.group("digest")}"'
+            cache_control = f"public, max-age={settings.UPLOAD_CACHE_MAX_AGE}, immutable"
+        else:
+            etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+            etag = f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+            cache_control = "no-cache"
+
+        headers = {
+            "etag": etag,
+            "cache-control": cache_control,
+            "accept-ranges": "bytes",
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True)
+        }
+        media_type = guess_type(name)[0] or "application/octet-stream"
+        path, encoding = str(full_path), None
+
+        if settings.UPLOAD_PRECOMPRESSED and is_compressible(media_type):
+            path, encoding = self._find_sidecar(full_path, request_headers)
+
+            if encoding:
+                stat_result = os.stat(path)
+                headers["content-encoding"] = encoding
+                headers["etag"] = encoded_etag(etag, encoding)
+                headers.pop("accept-ranges")
+            # Sidecars make the response depend on Accept-Encoding either way
+            headers["vary"] = "Accept-Encoding"
+
+        if status_code == 200 and etag_matches(request_headers.get("if-none-match"), headers["etag"]):
+            return NotModifiedResponse(Headers(headers))
+
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+
+        if status_code == 200 and range_header and not encoding and (if_range is None or if_range == etag):
+            byte_range = parse_range(range_header, stat_result.st_size)
+
+            if byte_range == (stat_result.st_size, stat_result.st_size):
+                return Response(
+                    status_code=416,
+                    headers={**headers, "content-range": f"bytes */{stat_result.st_size}"}
+                )
+
+            if byte_range is not None:
+                return FileRangeResponse(
+                    path, *byte_range, stat_result.st_size,
+                    headers=headers, media_type=media_type,
+                    stat_result=stat_result, method=scope["method"]
+                )
+
+        return FileResponse(
+            path, status_code=status_code, headers=headers, media_type=media_type,
+            stat_result=stat_result, method=scope["method"]
+        )
+
+    def _find_sidecar(self, full_path, request_headers: Headers) -> Tuple[str, Optional[str]]:
+        """
+        Pick a precompressed sidecar the client accepts (honouring q-values).
+
+        Returns:
+            Tuple of (path to send, content encoding or None)
+        """
+        sidecars = {
+            encoding: f"{full_path}{suffix}"
+            for encoding, suffix in SIDECAR_ENCODINGS
+            if os.path.isfile(f"{full_path}{suffix}")
+        }
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"), sidecars)
+
+        if encoding:
+            return sidecars[encoding], encoding
+
+        return str(full_path), None
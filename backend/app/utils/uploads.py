@@ -0,0 +1,124 @@
+"""Streaming, size-limited, content-addressed storage of uploaded images"""
+from typing import AsyncIterator, NamedTuple, Optional
+import hashlib
+import os
+import secrets
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile
+from ..config import settings
+from .errors import FileTooLargeError, InvalidImageError
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Leading bytes of the accepted image formats, mapped to their extension
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+]
+
+
+class StoredUpload(NamedTuple):
+    """An upload saved under its content hash"""
+    path: str
+    digest: str  # SHA-256 hex of the content
+    extension: str
+    size: int
+    duplicate: bool  # Identical content was already stored
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """
+    Detect the image type from the first bytes of a file.
+
+    Args:
+        head: At least the first 12 bytes (fewer only if the file is shorter)
+
+    Returns:
+        File extension ("jpg", "png" or "webp"), or None if not a known image
+    """
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+
+    for signature, extension in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return extension
+
+    return None
+
+
+async def iter_upload_file(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an UploadFile in chunks"""
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def original_path(digest: str, extension: str) -> str:
+    """Get the stored path of an original image"""
+    return os.path.join(settings.UPLOAD_DIR, "originals", f"{digest}.{extension}")
+
+
+async def store_image_upload(chunks: AsyncIterator[bytes], max_size: Optional[int] = None) -> StoredUpload:
+    """
+    Stream an uploaded image to disk under its content hash.
+
+    Chunks are written to a temporary file in UPLOAD_TMP_DIR while the size
+    is checked and the SHA-256 computed, so at most one chunk is held in
+    memory and an oversized upload stops as soon as it crosses the limit.
+    The type comes from the file's magic bytes, not its name. The finished
+    file is atomically renamed to `originals/{sha256}.{ext}`, so a partial
+    file is never visible under UPLOAD_DIR; identical content is stored once.
+
+    Args:
+        chunks: Async iterator of upload bytes
+        max_size: Size limit in bytes (defaults to MAX_FILE_SIZE)
+
+    Returns:
+        StoredUpload
+
+    Raises:
+        FileTooLargeError: If the upload exceeds max_size
+        InvalidImageError: If the content is not a supported image type
+    """
+    max_size = max_size or settings.MAX_FILE_SIZE
+    await aiofiles.os.makedirs(settings.UPLOAD_TMP_DIR, exist_ok=True)
+    await aiofiles.os.makedirs(os.path.join(settings.UPLOAD_DIR, "originals"), exist_ok=True)
+
+    temp_path = os.path.join(settings.UPLOAD_TMP_DIR, f"{secrets.token_hex(16)}.part")
+    digest = hashlib.sha256()
+    head = b""
+    size = 0
+
+    try:
+        async with aiofiles.open(temp_path, "xb") as temp:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise FileTooLargeError(f"File too large. Maximum size: {max_size} bytes")
+
+                if len(head) < 12:
+                    head += chunk[:12 - len(head)]
+
+                digest.update(chunk)
+                await temp.write(chunk)
+
+        extension = sniff_image_type(head)
+        if extension is None or extension not in settings.ALLOWED_EXTENSIONS:
+            raise InvalidImageError(f"File type not allowed. Allowed: {settings.ALLOWED_EXTENSIONS}")
+
+        path = original_path(digest.hexdigest(), extension)
+        duplicate = await aiofiles.os.path.exists(path)
+
+        if duplicate:
+            await aiofiles.os.remove(temp_path)
+        else:
+            await aiofiles.os.replace(temp_path, path)
+    except BaseException:
+        if await aiofiles.os.path.exists(temp_path):
+            await aiofiles.os.remove(temp_path)
+        raise
+
+    return StoredUpload(path=path, digest=digest.hexdigest(), extension=extension, size=size, duplicate=duplicate)
@@ -1,30 +1,213 @@
 """WebSocket Connection Manager for real-time order updates"""
 from fastapi import WebSocket
-from typing import Dict, List
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import asyncio
 import json
+import logging
+import secrets
+import threading
+import time
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to consumers that fall too far behind (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class ReplayBuffer:
+    """
+    Per-store sequence numbers and a ring buffer of recent messages.
+    
+    Every recorded message gets the next `seq` for its store and is kept,
+    serialized, in a bounded deque so a reconnecting client can be sent just
+    what it missed. `stream_id` changes on every process start, since
+    sequence numbers are not shared across restarts or worker processes.
+    Callers that must record and broadcast atomically hold `lock`.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size or settings.WS_REPLAY_BUFFER_SIZE
+        self.stream_id = secrets.token_hex(8)
+        self.lock = threading.RLock()
+        self._last_seq: Dict[int, int] = {}
+        self._buffers: Dict[int, Deque[Tuple[int, str]]] = {}
+    
+    def record(self, store_id: int, message: dict) -> str:
+        """
+        Assign the next sequence number to a message and buffer it.
+        
+        Args:
+            store_id: Store ID
+            message: Message dictionary
+        
+        Returns:
+            Serialized message including its `seq`
+        """
+        with self.lock:
+            seq = self._last_seq.get(store_id, 0) + 1
+            self._last_seq[store_id] = seq
+            text = json.dumps({**message, "seq": seq})
+            
+            if store_id not in self._buffers:
+                self._buffers[store_id] = deque(maxlen=self.max_size)
+            self._buffers[store_id].append((seq, text))
+            
+            return text
+    
+    def last_seq(self, store_id: int) -> int:
+        """Get the store's latest sequence number (0 before any message)"""
+        with self.lock:
+            return self._last_seq.get(store_id, 0)
+    
+    def since(self, store_id: int, last_seq: int) -> Optional[List[str]]:
+        """
+        Get the buffered messages after a sequence number.
+        
+        Args:
+            store_id: Store ID
+            last_seq: Last sequence number the client received
+        
+        Returns:
+            Serialized messages in order, or None if some of them have
+            already left the buffer (or last_seq is from another stream)
+        """
+        with self.lock:
+            current = self._last_seq.get(store_id, 0)
+            if last_seq > current:
+                return None
+            
+            missed = [text for seq, text in self._buffers.get(store_id, ()) if seq > last_seq]
+            if len(missed) < current - last_seq:
+                return None
+            
+            return missed
+
+
+class ClientConnection:
+    """
+    A registered WebSocket with its own bounded send queue.
+    
+    A dedicated writer task drains the queue, so a slow client only delays
+    its own messages and never the broadcaster or other clients.
+    `store_id` is the group the connection is registered under; `tenant_id`
+    is the store it belongs to (the same, except for tablets grouped by
+    table session).
+    """
+    
+    def __init__(self, websocket: WebSocket, store_id: int, max_queue_size: int, tenant_id: Optional[int] = None):
+        self.websocket = websocket
+        self.store_id = store_id
+        self.tenant_id = store_id if tenant_id is None else tenant_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.writer: Optional[asyncio.Task] = None
+        self.connected_at = time.time()
+        self.sent_count = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+    
+    def enqueue(self, text: str) -> bool:
+        """
+        Queue a serialized message without waiting.
+        
+        Args:
+            text: Serialized message
+        
+        Returns:
+            False if the queue is full
+        """
+        try:
+            self.queue.put_nowait((time.monotonic(), text))
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    async def run_writer(self, on_error):
+        """
+        Send queued messages until cancelled or the socket fails.
+        
+        Args:
+            on_error: Callback invoked with this connection when a send fails
+        """
+        while True:
+            enqueued_at, text = await self.queue.get()
+            try:
+                await self.websocket.send_text(text)
+            except Exception:
+                on_error(self)
+                return
+            
+            self.sent_count += 1
+            self.last_lag = time.monotonic() - enqueued_at
+            self.max_lag = max(self.max_lag, self.last_lag)
+    
+    def metrics(self) -> dict:
+        """Get lag and throughput metrics for this connection"""
+        return {
+            "store_id": self.store_id,
+            "client": f"{self.websocket.client.host}:{self.websocket.client.port}" if self.websocket.client else None,
+            "connected_at": self.connected_at,
+            "queue_depth": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "sent_count": self.sent_count,
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+        }
 
 
 class ConnectionManager:
     """Manages WebSocket connections for admin clients"""
     
-    def __init__(self):
+    def __init__(self, max_queue_size: Optional[int] = None):
         # Store active connections by store_id
-        self.active_connections: Dict[int, List[WebSocket]] = {}
+        self.active_connections: Dict[int, Dict[WebSocket, ClientConnection]] = {}
+        self.max_queue_size = max_queue_size or settings.WS_SEND_QUEUE_SIZE
+        self.slow_consumer_disconnects = 0
+        self._slow_consumer_disconnects_by_tenant: Dict[int, int] = {}
     
-    async def connect(self, websocket: WebSocket, store_id: int):
+    async def connect(self, websocket: WebSocket, store_id: int, tenant_id: Optional[int] = None):
         """
         Accept and register a new WebSocket connection.
         
         Args:
             websocket: WebSocket connection
             store_id: Store ID for grouping connections
+            tenant_id: Store the connection belongs to (default: store_id)
         """
         await websocket.accept()
+        self.register(websocket, store_id, tenant_id=tenant_id)
+    
+    def register(
+        self,
+        websocket: WebSocket,
+        store_id: int,
+        initial_messages: Optional[List[str]] = None,
+        tenant_id: Optional[int] = None
+    ):
+        """
+        Register an accepted WebSocket connection.
+        
+        Does not await, so a caller can queue the initial messages and start
+        receiving broadcasts without another broadcast slipping in between.
+        
+        Args:
+            websocket: Accepted WebSocket connection
+            store_id: Store ID for grouping connections
+            initial_messages: Serialized messages to send before any broadcast
+            tenant_id: Store the connection belongs to (default: store_id)
+        """
+        client = ClientConnection(websocket, store_id, self.max_queue_size, tenant_id)
+        
+        for text in initial_messages or []:
+            client.queue.put_nowait((time.monotonic(), text))
+        
+        client.writer = asyncio.create_task(client.run_writer(self._on_send_error))
         
         if store_id not in self.active_connections:
-            self.active_connections[store_id] = []
+            self.active_connections[store_id] = {}
         
-        self.active_connections[store_id].append(websocket)
+        self.active_connections[store_id][websocket] = client
     
     def disconnect(self, websocket: WebSocket, store_id: int):
         """
@@ -35,36 +218,123 @@ class ConnectionManager:
             store_id: Store ID
         """
         if store_id in self.active_connections:
-            if websocket in self.active_connections[store_id]:
-                self.active_connections[store_id].remove(websocket)
+            client = self.active_connections[store_id].pop(websocket, None)
             
-            # Clean up empty lists
+            if client and client.writer and client.writer is not asyncio.current_task():
+                client.writer.cancel()
+            
+            # Clean up empty stores
             if not self.active_connections[store_id]:
                 del self.active_connections[store_id]
     
+    def _on_send_error(self, client: ClientConnection):
+        """Drop a connection whose writer failed to send"""
+        self.disconnect(client.websocket, client.store_id)
+    
+    async def _drop_slow_consumer(self, client: ClientConnection):
+        """
+        Disconnect a client whose send queue overflowed.
+        
+        Args:
+            client: Lagging connection
+        """
+        logger.warning(
+            "Disconnecting slow WebSocket consumer for store %s (queue full at %s)",
+            client.store_id, client.queue.maxsize
+        )
+        self.slow_consumer_disconnects += 1
+        self._slow_consumer_disconnects_by_tenant[client.tenant_id] = (
+            self._slow_consumer_disconnects_by_tenant.get(client.tenant_id, 0) + 1
+        )
+        self.disconnect(client.websocket, client.store_id)
+        
+        try:
+            await client.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
+    
     async def broadcast_to_store(self, store_id: int, message: dict):
         """
         Broadcast message to all connections for a specific store.
         
+        The message is serialized once and queued for each connection;
+        this never waits on a client's network send.
+        
         Args:
             store_id: Store ID
             message: Message dictionary to broadcast
         """
+        await self.broadcast_text(store_id, json.dumps(message))
+    
+    async def broadcast_text(self, store_id: int, text: str):
+        """
+        Broadcast an already serialized message to a store's connections.
+        
+        Args:
+            store_id: Store ID
+            text: Serialized message
+        """
         if store_id not in self.active_connections:
             return
         
-        # Remove disconnected clients
-        disconnected = []
+        overflowed = []
         
-        for connection in self.active_connections[store_id]:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        for client in list(self.active_connections[store_id].values()):
+            if not client.enqueue(text):
+                overflowed.append(client)
+        
+        # Disconnect clients that cannot keep up
+        for client in overflowed:
+            await self._drop_slow_consumer(client)
+    
+    async def send_personal(self, websocket: WebSocket, store_id: int, message: dict):
+        """
+        Queue a message for a single connection.
+        
+        Goes through the connection's writer so it never races a broadcast.
+        
+        Args:
+            websocket: Target WebSocket connection
+            store_id: Store ID
+            message: Message dictionary to send
+        """
+        client = self.active_connections.get(store_id, {}).get(websocket)
         
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection, store_id)
+        if client and not client.enqueue(json.dumps(message)):
+            await self._drop_slow_consumer(client)
+    
+    def get_metrics(self, store_id: Optional[int] = None) -> List[dict]:
+        """
+        Get per-connection lag metrics.
+        
+        Args:
+            store_id: Limit to one store (default: all stores)
+        
+        Returns:
+            List of connection metric dictionaries
+        """
+        if store_id is not None:
+            stores = [store_id] if store_id in self.active_connections else []
+        else:
+            stores = list(self.active_connections)
+        
+        return [
+            client.metrics()
+            for sid in stores
+            for client in self.active_connections[sid].values()
+        ]
+    
+    def connection_count(self, tenant_id: int) -> int:
+        """Count the open connections belonging to a store"""
+        return sum(
+            client.tenant_id == tenant_id
+            for clients in self.active_connections.values()
+            for client in clients.values()
+        )
+    
+    def slow_consumer_count(self, tenant_id: int) -> int:
+        """Count a store's connections dropped for falling behind"""
+        return self._slow_consumer_disconnects_by_tenant.get(tenant_id, 0)
     
     async def send_order_update(self, store_id: int, order_data: dict):
         """
@@ -99,3 +369,9 @@ class ConnectionManager:
 
 # Global connection manager instance
 manager = ConnectionManager()
+
+# Sequence numbers and recent events of the admin streams
+replay_buffer = ReplayBuffer()
+
+# Customer tablet connections, grouped by table session ID instead of store ID
+customer_manager = ConnectionManager()
@@ -0,0 +1,148 @@
+"""
+Benchmark the menu and order list endpoints on a throwaway database.
+
+Run with --baseline to time the serialization path the list routes used
+before JSONSerializer (response_model validation and JSONResponse), for a
+before/after comparison in one tree.
+"""
+import argparse
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Never touch the real database or uploads
+WORK_DIR = tempfile.mkdtemp(prefix="table-order-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{WORK_DIR}/benchmark.db"
+os.environ["UPLOAD_DIR"] = f"{WORK_DIR}/uploads"
+os.environ["UPLOAD_TMP_DIR"] = f"{WORK_DIR}/uploads_tmp"
+os.environ["ORDER_ARCHIVE_INTERVAL_SECONDS"] = "0"
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import SessionLocal
+from app.models import Store, Table, TableSession, Category, Menu, Order, OrderItem, Admin
+from app.services.auth_service import AuthService
+from app.utils.menu_cache import menu_cache
+from app.utils.serialization import JSONSerializer
+
+MENUS = 200
+ORDERS = 200
+ITEMS_PER_ORDER = 4
+ITERATIONS = 200
+
+
+def seed():
+    """Create one store with MENUS menus and one session with ORDERS orders"""
+    db = SessionLocal()
+    db.add(Store(id=1, name="Benchmark Store"))
+    db.add(Table(id=1, store_id=1, table_number="T1", qr_code="BENCH"))
+    db.add(TableSession(id=1, table_id=1, session_token="bench-session", started_at=datetime.utcnow()))
+    db.add(Admin(id=1, store_id=1, username="bench", password_hash=AuthService().hash_password("bench")))
+    db.add_all([Category(id=i, store_id=1, name=f"Category {i}", display_order=i) for i in range(1, 11)])
+    db.add_all([
+        Menu(
+            id=i, category_id=i % 10 + 1, name=f"Menu {i}", description="A fairly typical menu description",
+            price=1000 * i, allergens="milk,egg", is_available=True
+        )
+        for i in range(1, MENUS + 1)
+    ])
+    db.commit()
+
+    start = datetime.utcnow() - timedelta(hours=1)
+    for i in range(ORDERS):
+        order = Order(
+            store_id=1, session_id=1, order_number=f"#{i + 1:03d}",
+            subtotal_amount=40000, tip_rate=0, tip_amount=0, total_amount=40000,
+            status="pending", created_at=start + timedelta(seconds=i)
+        )
+        order.items = [
+            OrderItem(menu_id=j + 1, menu_name=f"Menu {j + 1}", menu_price=10000, quantity=1, subtotal=10000)
+            for j in range(ITEMS_PER_ORDER)
+        ]
+        db.add(order)
+    db.commit()
+    db.close()
+
+
+def use_baseline_serialization():
+    """
+    Make JSONSerializer responses take the pre-JSONSerializer path.
+
+    The routes used to return ORM rows (or models) for FastAPI to validate
+    against response_model, serialize to JSON-compatible Python objects and
+    encode with the stdlib json module in JSONResponse, the default response
+    class then. The menu snapshot was already encoded by pydantic-core, so
+    only `response` is replaced.
+    """
+    def response(self, value, headers=None):
+        content = self.adapter.dump_python(self.load(value), mode="json")
+        return JSONResponse(content=content, headers=headers)
+
+    JSONSerializer.response = response
+
+
+def measure(client: TestClient, path: str, before=None) -> float:
+    """
+    Time a GET endpoint.
+
+    Returns:
+        Mean milliseconds per request
+    """
+    client.get(path).raise_for_status()  # Warm up
+
+    elapsed = 0.0
+    for _ in range(ITERATIONS):
+        if before:
+            before()
+        started = time.perf_counter()
+        response = client.get(path)
+        elapsed += time.perf_counter() - started
+        response.raise_for_status()
+
+    return elapsed / ITERATIONS * 1000
+
+
+def run_benchmark(baseline: bool = False):
+    """
+    Print the mean latency of each list endpoint.
+
+    Args:
+        baseline: Time the pre-JSONSerializer response path instead
+    """
+    if baseline:
+        use_baseline_serialization()
+    seed()
+
+    with TestClient(app) as client:
+        token = client.post(
+            "/api/admin/auth/login", json={"username": "bench", "password": "bench"}
+        ).json()["access_token"]
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        cases = [
+            ("customer menu list (snapshot rebuilt)", "/api/customer/menu/list?store_id=1", menu_cache.clear),
+            ("customer menu list (snapshot cached)", "/api/customer/menu/list?store_id=1", None),
+            ("admin menu list", "/api/admin/menu/list", None),
+            ("admin order list (limit=200)", "/api/admin/order/list?limit=200", None),
+            ("customer order list", "/api/customer/order/list?session_token=bench-session", None),
+        ]
+
+        mode = "baseline (response_model + JSONResponse)" if baseline else "JSONSerializer"
+        print(f"{mode}: {MENUS} menus, {ORDERS} orders x {ITEMS_PER_ORDER} items, {ITERATIONS} requests each\n")
+        for name, path, before in cases:
+            print(f"{name:<40} {measure(client, path, before):8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--baseline", action="store_true",
+        help="time the pre-JSONSerializer response path (response_model + JSONResponse)"
+    )
+    run_benchmark(parser.parse_args().baseline)
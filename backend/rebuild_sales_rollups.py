@@ -0,0 +1,55 @@
+"""Rebuild the daily sales rollups from live and archived orders"""
+import sys
+import os
+from datetime import timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, select
+from app.database import SessionLocal
+from app.models import Store, Order, ArchivedOrder
+from app.services.sales_rollup_service import SalesRollupService
+from app.utils.business_day import get_business_date
+
+def rebuild_sales_rollups():
+    """Recompute every business day that has orders"""
+    db = SessionLocal()
+
+    try:
+        service = SalesRollupService(db)
+
+        for store in db.query(Store).all():
+            bounds = [
+                db.execute(
+                    select(func.min(model.created_at), func.max(model.created_at)).where(model.store_id == store.id)
+                ).one()
+                for model in (Order, ArchivedOrder)
+            ]
+            firsts = [first for first, _ in bounds if first is not None]
+            lasts = [last for _, last in bounds if last is not None]
+
+            if not firsts:
+                continue
+
+            day = get_business_date(min(firsts))
+            last_day = get_business_date(max(lasts))
+            days = 0
+
+            while day <= last_day:
+                service.rebuild_day(store.id, day)
+                day += timedelta(days=1)
+                days += 1
+
+            print(f"✓ {store.name}: rebuilt {days} business days")
+
+        print("\n✅ Sales rollups rebuilt!")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild_sales_rollups()
@@ -0,0 +1,97 @@
+"""Tests for AdminTokenService and get_current_admin"""
+import asyncio
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, create_async_db_engine
+from app.services.auth_service import AuthService
+from app.services.admin_token_service import AdminTokenService
+from app.models import Store, Admin
+from app.utils.admin_token_cache import AdminPrincipal, admin_token_cache
+from app.utils.dependencies import get_current_admin
+
+
+class TestAdminTokenService:
+    """Test suite for stateless admin authentication"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup a file database on the async engine"""
+        self.engine = create_async_db_engine(f"sqlite:///{tmp_path / 'admin.db'}")
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.statements = []
+        admin_token_cache.clear()
+
+        async def seed():
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with self.SessionLocal() as db:
+                db.add(Store(id=1, name="Test Store"))
+                db.add(Admin(id=1, store_id=1, username="admin", password_hash="x"))
+                await db.commit()
+
+        asyncio.run(seed())
+
+        event.listen(
+            self.engine.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.statements.append(statement)
+        )
+
+        yield
+
+        admin_token_cache.clear()
+        asyncio.run(self.engine.dispose())
+
+    def _authenticate(self, token: str):
+        async def scenario():
+            async with self.SessionLocal() as db:
+                return await get_current_admin(authorization=f"Bearer {token}", db=db)
+
+        return asyncio.run(scenario())
+
+    def _token(self, token_version: int = 0) -> str:
+        return AuthService().create_jwt_token({
+            "admin_id": 1,
+            "username": "admin",
+            "store_id": 1,
+            "token_version": token_version
+        })
+
+    def test_principal_from_claims_without_repeat_queries(self):
+        """Repeat requests are authenticated from claims and the cache"""
+        token = self._token()
+
+        first = self._authenticate(token)
+        second = self._authenticate(token)
+
+        assert first == AdminPrincipal(admin_id=1, username="admin", store_id=1, token_version=0)
+        assert second == first
+        assert len(self.statements) == 1
+
+    def test_revoked_tokens_are_rejected(self):
+        """Revoking bumps the version so older tokens fail"""
+        old_token = self._token()
+        self._authenticate(old_token)
+
+        async def revoke():
+            async with self.SessionLocal() as db:
+                return await AdminTokenService(db).revoke_tokens(1)
+
+        assert asyncio.run(revoke()) == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            self._authenticate(old_token)
+
+        assert exc_info.value.status_code == 401
+        assert self._authenticate(self._token(token_version=1)).token_version == 1
+
+    def test_unknown_admin_is_rejected(self):
+        """Tokens for deleted admins are refused"""
+        token = AuthService().create_jwt_token({"admin_id": 99, "username": "ghost", "store_id": 1})
+
+        with pytest.raises(HTTPException) as exc_info:
+            self._authenticate(token)
+
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,114 @@
+"""Tests for the async database stack"""
+import asyncio
+import pytest
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, create_async_db_engine, get_async_database_url
+from app.services.order_service import OrderItemData
+from app.services.async_order_service import AsyncOrderService
+from app.services.async_order_query_service import AsyncOrderQueryService
+from app.services.async_table_session_service import AsyncTableSessionService
+from app.models import Store, Table, TableSession, Category, Menu
+from app.utils.errors import SessionNotActiveError
+
+
+def test_async_database_url():
+    """Sync driver URLs map to their async drivers"""
+    assert get_async_database_url("sqlite:///./table_order.db") == "sqlite+aiosqlite:///./table_order.db"
+    assert get_async_database_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert get_async_database_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+
+class TestAsyncServices:
+    """Test suite for the AsyncSession service facades"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup a file database on the async engine"""
+        self.engine = create_async_db_engine(f"sqlite:///{tmp_path / 'async.db'}")
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        async def seed():
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with self.SessionLocal() as db:
+                db.add(Store(id=1, name="Test Store"))
+                db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+                db.add(TableSession(id=1, table_id=1, session_token="token1", started_at=datetime.utcnow()))
+                db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+                db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+                await db.commit()
+
+        asyncio.run(seed())
+
+        yield
+
+        asyncio.run(self.engine.dispose())
+
+    def test_pragmas_applied_on_async_connect(self):
+        """The async engine shares the SQLite connection profile"""
+        async def scenario():
+            async with self.engine.connect() as conn:
+                return (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+
+        assert asyncio.run(scenario()) == "wal"
+
+    def test_create_update_and_list_orders(self):
+        """Orders round-trip through the async facades with items loaded"""
+        async def scenario():
+            async with self.SessionLocal() as db:
+                service = AsyncOrderService(db)
+                order = await service.create_order(
+                    session_id=1,
+                    items=[OrderItemData(menu_id=1, quantity=2)],
+                    tip_rate=0
+                )
+                await service.update_order_status(order.id, "preparing")
+
+            async with self.SessionLocal() as db:
+                orders = await AsyncOrderQueryService(db).list_orders(session_id=1)
+                page = await AsyncOrderQueryService(db).paginate_orders(limit=10, include_total=True)
+
+            return order, orders, page
+
+        order, orders, page = asyncio.run(scenario())
+
+        assert [o.id for o in orders] == [order.id]
+        assert orders[0].status == "preparing"
+        assert orders[0].items[0].quantity == 2
+        assert page.total == 1
+
+    def test_concurrent_orders_on_one_loop(self):
+        """Concurrent requests on one event loop get distinct order numbers"""
+        async def place():
+            async with self.SessionLocal() as db:
+                order = await AsyncOrderService(db).create_order(
+                    session_id=1,
+                    items=[OrderItemData(menu_id=1, quantity=1)],
+                    tip_rate=0
+                )
+                return order.order_number
+
+        async def scenario():
+            return await asyncio.gather(*(place() for _ in range(20)))
+
+        numbers = asyncio.run(scenario())
+
+        assert len(set(numbers)) == 20
+
+    def test_end_session(self):
+        """Ended sessions reject new orders"""
+        async def scenario():
+            async with self.SessionLocal() as db:
+                await AsyncTableSessionService(db).end_session(1)
+
+                with pytest.raises(SessionNotActiveError):
+                    await AsyncOrderService(db).create_order(
+                        session_id=1,
+                        items=[OrderItemData(menu_id=1, quantity=1)],
+                        tip_rate=0
+                    )
+
+        asyncio.run(scenario())
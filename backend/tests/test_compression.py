@@ -0,0 +1,123 @@
+"""Tests for response compression"""
+import gzip
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.utils import compression
+from app.utils.compression import CompressionMiddleware, encoded_etag, negotiate_encoding, precompress
+
+
+BODY = b'{"menus": [' + b'{"name": "Menu", "price": 1000},' * 100 + b"]}"
+
+
+class TestCompressionMiddleware:
+    """Test suite for CompressionMiddleware"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """Serve large, small, streamed and already encoded responses"""
+        monkeypatch.setattr(settings, "COMPRESSION_ENCODINGS", ["gzip"])
+
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        @app.get("/large")
+        def large():
+            return Response(BODY, media_type="application/json", headers={"ETag": '"abc"'})
+
+        @app.get("/small")
+        def small():
+            return Response(b'{"ok": true}', media_type="application/json")
+
+        @app.get("/stream")
+        def stream():
+            return StreamingResponse(iter([BODY, BODY]), media_type="text/csv")
+
+        @app.get("/encoded")
+        def encoded():
+            return Response(gzip.compress(BODY), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+        @app.get("/image")
+        def image():
+            return Response(b"\x00" * 2000, media_type="image/webp")
+
+        self.client = TestClient(app)
+
+    def _get(self, path: str, accept_encoding: str = "gzip"):
+        return self.client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    def test_large_body_is_compressed(self):
+        """Bodies above the threshold are compressed and their ETag weakened"""
+        response = self._get("/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(BODY)
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.content == BODY
+
+    def test_small_body_is_not_compressed(self):
+        """Bodies below the threshold are sent as is"""
+        response = self._get("/small")
+
+        assert "content-encoding" not in response.headers
+        assert response.content == b'{"ok": true}'
+
+    def test_streamed_body_is_compressed(self):
+        """Streamed bodies are compressed chunk by chunk"""
+        response = self._get("/stream")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.content == BODY * 2
+
+    def test_large_bodies_are_compressed_in_threadpool(self, monkeypatch):
+        """Bodies above COMPRESSION_THREADPOOL_SIZE leave the event loop"""
+        offloaded = []
+
+        async def fake_run_in_threadpool(func, *args):
+            offloaded.append(len(args[0]))
+            return func(*args)
+
+        monkeypatch.setattr(compression, "run_in_threadpool", fake_run_in_threadpool)
+        monkeypatch.setattr(settings, "COMPRESSION_THREADPOOL_SIZE", 2000)
+
+        assert self._get("/large").content == BODY
+        assert self._get("/stream").content == BODY * 2
+        assert offloaded == [len(BODY)] * 3
+
+    def test_passthrough(self):
+        """Encoded, incompressible and unaccepted responses are left alone"""
+        assert self._get("/encoded").content == BODY
+        assert "content-encoding" not in self._get("/image").headers
+
+        identity = self._get("/large", accept_encoding="identity")
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["vary"] == "Accept-Encoding"
+        assert identity.headers["etag"] == '"abc"'
+
+
+class TestNegotiation:
+    """Test suite for encoding negotiation helpers"""
+
+    def test_negotiate_encoding(self):
+        """Server preference wins; q=0 excludes and * covers unlisted encodings"""
+        assert negotiate_encoding("gzip, br", ["br", "gzip"]) == "br"
+        assert negotiate_encoding("br;q=0, gzip;q=0.5", ["br", "gzip"]) == "gzip"
+        assert negotiate_encoding("*", ["zstd"]) == "zstd"
+        assert negotiate_encoding("gzip;q=0, *", ["gzip"]) is None
+        assert negotiate_encoding(None, ["gzip"]) is None
+
+    def test_precompress(self, monkeypatch):
+        """Cached bodies are compressed once per encoding, above the threshold"""
+        monkeypatch.setattr(settings, "COMPRESSION_ENCODINGS", ["gzip"])
+
+        assert gzip.decompress(precompress(BODY)["gzip"]) == BODY
+        assert precompress(b"{}") == {}
+
+    def test_encoded_etag(self):
+        """Each encoding is a distinct representation with its own ETag"""
+        assert encoded_etag('"abc"', "br") == '"abc-br"'
+        assert encoded_etag('"abc"', None) == '"abc"'
@@ -0,0 +1,86 @@
+"""Tests for the database engine profile"""
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, create_db_engine
+from app.services.order_service import OrderService, OrderItemData
+from app.services.order_query_service import OrderQueryService
+from app.models import Store, Table, TableSession, Category, Menu
+
+
+class TestSQLiteProfile:
+    """Test suite for the SQLite connection profile"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup a file database using the application engine profile"""
+        self.engine = create_db_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+        Base.metadata.create_all(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+        yield
+
+        self.engine.dispose()
+
+    def test_pragmas_applied_on_connect(self):
+        """Every pooled connection gets the configured pragmas"""
+        with self.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+    def test_concurrent_order_writes_and_reads(self):
+        """Writers and readers run in parallel without 'database is locked'"""
+        db = self.SessionLocal()
+        db.add(Store(id=1, name="Test Store"))
+        db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001"))
+        db.add(TableSession(id=1, table_id=1, session_token="token1", started_at=datetime.utcnow()))
+        db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+        db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        db.commit()
+        db.close()
+
+        writers_done = threading.Event()
+        read_count = 0
+
+        def write(_):
+            session = self.SessionLocal()
+            try:
+                return OrderService(session).create_order(
+                    session_id=1,
+                    items=[OrderItemData(menu_id=1, quantity=1)],
+                    tip_rate=0
+                ).order_number
+            finally:
+                session.close()
+
+        def read():
+            nonlocal read_count
+            while not writers_done.is_set():
+                session = self.SessionLocal()
+                try:
+                    # Hold a read transaction open across concurrent commits
+                    session.connection().exec_driver_sql("BEGIN")
+                    OrderQueryService(session).list_orders()
+                    time.sleep(0.001)
+                    session.rollback()
+                    read_count += 1
+                finally:
+                    session.close()
+
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            readers = [pool.submit(read) for _ in range(4)]
+            try:
+                numbers = list(pool.map(write, range(150)))
+            finally:
+                writers_done.set()
+            for reader in readers:
+                reader.result()
+
+        assert len(set(numbers)) == 150
+        assert read_count > 0
@@ -0,0 +1,81 @@
+"""Tests for menu image variant generation"""
+import asyncio
+import pytest
+from PIL import Image
+from app.utils.image_processor import ImageProcessor, render_variants
+from app.utils.errors import ImageProcessingBusyError, InvalidImageError
+
+
+SIZES = {"thumb": 50, "card": 120, "detail": 300}
+
+
+def _render(tmp_path, source):
+    return render_variants(str(source), str(tmp_path), "7", SIZES, 8, 80, 82, 10_000_000)
+
+
+class TestRenderVariants:
+    """Test suite for render_variants"""
+
+    def test_variants_keep_aspect_ratio(self, tmp_path):
+        """Each variant fits its size and exists as WebP and JPEG"""
+        source = tmp_path / "upload.jpg"
+        Image.new("RGB", (800, 400), (200, 40, 40)).save(source)
+
+        result = _render(tmp_path, source)
+
+        assert {name: (v["width"], v["height"]) for name, v in result["variants"].items()} == {
+            "detail": (300, 150), "card": (120, 60), "thumb": (50, 25)
+        }
+        with Image.open(tmp_path / result["variants"]["card"]["webp"]) as card:
+            assert card.format == "WEBP"
+            assert card.size == (120, 60)
+        with Image.open(tmp_path / "7-thumb.jpg") as thumb:
+            assert thumb.format == "JPEG"
+        assert result["placeholder"].startswith("data:image/jpeg;base64,")
+
+    def test_small_images_are_not_upscaled(self, tmp_path):
+        """Variants larger than the original keep the original size"""
+        source = tmp_path / "upload.png"
+        Image.new("RGBA", (100, 80), (0, 0, 255, 128)).save(source)
+
+        result = _render(tmp_path, source)
+
+        assert (result["variants"]["detail"]["width"], result["variants"]["detail"]["height"]) == (100, 80)
+        assert result["variants"]["thumb"]["width"] == 50
+
+    def test_invalid_file_is_rejected(self, tmp_path):
+        """Non-image data raises InvalidImageError"""
+        source = tmp_path / "upload.jpg"
+        source.write_bytes(b"not an image")
+
+        with pytest.raises(InvalidImageError):
+            _render(tmp_path, source)
+
+
+class TestImageProcessor:
+    """Test suite for the image process pool"""
+
+    def test_process_runs_on_pool(self, tmp_path):
+        """Variants are produced by a worker process"""
+        source = tmp_path / "upload.jpg"
+        Image.new("RGB", (2000, 1000)).save(source)
+        processor = ImageProcessor(max_workers=1, max_pending=2)
+
+        try:
+            result = asyncio.run(processor.process(str(source), str(tmp_path), "1"))
+        finally:
+            processor.shutdown()
+
+        assert result["variants"]["detail"]["webp"] == "1-detail.webp"
+        assert (tmp_path / "1-detail.webp").exists()
+        assert processor.pending == 0
+
+    def test_rejects_when_saturated(self, tmp_path):
+        """Jobs beyond max_pending are rejected without queueing"""
+        processor = ImageProcessor(max_workers=1, max_pending=1)
+        processor._pending = 1
+
+        with pytest.raises(ImageProcessingBusyError):
+            asyncio.run(processor.process(str(tmp_path / "upload.jpg"), str(tmp_path), "1"))
+
+        assert processor.rejected_count == 1
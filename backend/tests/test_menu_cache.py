@@ -0,0 +1,109 @@
+"""Tests for MenuCache"""
+import asyncio
+import gzip
+import pytest
+from app.utils.menu_cache import MenuCache, etag_matches
+
+
+class TestMenuCache:
+    """Test suite for MenuCache"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.cache = MenuCache()
+        self.builds = 0
+
+    def _build(self, body: bytes = b'{"categories":[],"menus":[]}'):
+        def build():
+            self.builds += 1
+            return body
+        return build
+
+    def test_get_builds_once_per_version(self):
+        """Repeat reads reuse the snapshot"""
+        first = self.cache.get(1, self._build())
+        second = self.cache.get(1, self._build())
+
+        assert first is second
+        assert self.builds == 1
+
+    def test_invalidate_rebuilds_snapshot(self):
+        """Bumping the version forces a rebuild with a new ETag"""
+        first = self.cache.get(1, self._build(b"old"))
+
+        self.cache.invalidate(1)
+        second = self.cache.get(1, self._build(b"new"))
+
+        assert self.builds == 2
+        assert second.version == first.version + 1
+        assert second.etag != first.etag
+
+    def test_invalidate_store_also_invalidates_unscoped_menu(self):
+        """The all-stores snapshot includes every store's menu"""
+        self.cache.get(None, self._build())
+        self.cache.get(2, self._build())
+
+        self.cache.invalidate(1)
+        self.cache.get(None, self._build())
+        self.cache.get(2, self._build())
+
+        assert self.builds == 3
+
+    def test_invalidate_during_build_keeps_snapshot_stale(self):
+        """A snapshot built across an invalidate is not cached as current"""
+        def racing_build():
+            self.cache.invalidate(1)
+            return b"stale"
+
+        self.cache.get(1, racing_build)
+        fresh = self.cache.get(1, self._build(b"fresh"))
+
+        assert fresh.body == b"fresh"
+
+    def test_snapshot_stores_compressed_encodings(self):
+        """Large snapshots are compressed once, when built"""
+        body = b'{"menus": [' + b'{"name": "Menu"},' * 200 + b"]}"
+        snapshot = self.cache.get(1, self._build(body))
+
+        assert gzip.decompress(snapshot.encodings["gzip"]) == body
+        assert self.cache.get(1, self._build()).encodings is snapshot.encodings
+        assert self.cache.get(2, self._build()).encodings == {}
+
+    def test_concurrent_misses_share_one_build(self):
+        """Requests missing the same version wait for a single build"""
+        async def build():
+            self.builds += 1
+            await asyncio.sleep(0.01)
+            return b"menu"
+
+        async def scenario():
+            return await asyncio.gather(*[self.cache.get_async(1, build) for _ in range(5)])
+
+        snapshots = asyncio.run(scenario())
+
+        assert self.builds == 1
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert self.cache.lookup(1)[0] is snapshots[0]
+
+    def test_failed_build_caches_nothing(self):
+        """A build that raises (e.g. an unknown store) leaves no cache entry behind"""
+        async def build():
+            raise LookupError("no such store")
+
+        with pytest.raises(LookupError):
+            asyncio.run(self.cache.get_async(999, build))
+
+        assert self.cache._snapshots == {}
+        assert self.cache._versions == {}
+        assert self.cache._builds == {}
+
+    def test_etag_matches(self):
+        """Test If-None-Match parsing"""
+        etag = '"abc"'
+
+        assert etag_matches('"abc"', etag)
+        assert etag_matches('W/"abc"', etag)
+        assert etag_matches('"xyz", "abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"xyz"', etag)
+        assert not etag_matches(None, etag)
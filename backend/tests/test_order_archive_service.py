@@ -0,0 +1,115 @@
+"""Tests for OrderArchiveService and archive read-through"""
+import pytest
+from datetime import datetime, timedelta
+from app.services.order_archive_service import OrderArchiveService
+from app.services.order_query_service import OrderQueryService
+from app.schemas.order import OrderResponse
+from app.models import (
+    Store, Table, TableSession, Category, Menu, Order, OrderItem, OrderHistory,
+    ArchivedOrder, ArchivedOrderItem, ArchivedOrderHistory
+)
+
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+class TestOrderArchiveService:
+    """Test suite for OrderArchiveService"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Setup an old ended session, a recent ended session and an active one"""
+        self.db = db_session
+
+        self.db.add(Store(id=1, name="Test Store"))
+        self.db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+        self.db.add(TableSession(
+            id=1, table_id=1, session_token="old",
+            started_at=NOW - timedelta(days=40), ended_at=NOW - timedelta(days=40)
+        ))
+        self.db.add(TableSession(
+            id=2, table_id=1, session_token="recent",
+            started_at=NOW - timedelta(days=2), ended_at=NOW - timedelta(days=2)
+        ))
+        self.db.add(TableSession(id=3, table_id=1, session_token="active", started_at=NOW))
+        self.db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+        self.db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        self.db.commit()
+
+    def _add_orders(self, count: int, session_id: int):
+        """Insert `count` orders with one item and one status change each"""
+        for i in range(count):
+            order = Order(
+                store_id=1,
+                session_id=session_id,
+                order_number=f"#{i + 1:03d}",
+                subtotal_amount=10000,
+                tip_rate=10,
+                tip_amount=1000,
+                total_amount=11000,
+                status="served",
+                created_at=NOW - timedelta(days=40)
+            )
+            order.items = [
+                OrderItem(menu_id=1, menu_name="Burger", menu_price=10000, quantity=1, subtotal=10000)
+            ]
+            order.history = [OrderHistory(old_status="pending", new_status="served")]
+            self.db.add(order)
+        self.db.commit()
+        self.db.expunge_all()
+
+    def test_archives_only_sessions_past_retention(self):
+        """Orders of long-ended sessions move; recent and active ones stay"""
+        self._add_orders(3, session_id=1)
+        self._add_orders(2, session_id=2)
+        self._add_orders(1, session_id=3)
+
+        archived = OrderArchiveService(self.db, retention_days=30).archive_orders(now=NOW)
+
+        assert archived == 3
+        assert self.db.query(Order).filter_by(session_id=1).count() == 0
+        assert self.db.query(Order).count() == 3
+        assert self.db.query(ArchivedOrder).count() == 3
+        assert self.db.query(ArchivedOrderItem).count() == 3
+        assert self.db.query(ArchivedOrderHistory).count() == 3
+        assert self.db.query(OrderItem).count() == 3
+        assert self.db.query(OrderHistory).count() == 3
+
+    def test_moves_in_batches(self):
+        """Each batch is capped at batch_size and max_batches stops early"""
+        self._add_orders(5, session_id=1)
+        service = OrderArchiveService(self.db, retention_days=30, batch_size=2)
+
+        assert service.archive_orders(now=NOW, max_batches=1) == 2
+        assert self.db.query(Order).count() == 3
+
+        assert service.archive_orders(now=NOW) == 3
+        assert self.db.query(Order).count() == 0
+        assert service.archive_orders(now=NOW) == 0
+
+    def test_archived_orders_are_read_through(self):
+        """Historical lookups fall back to the archive with the same IDs"""
+        self._add_orders(2, session_id=1)
+        order_id = self.db.query(Order.id).order_by(Order.id).first()[0]
+
+        OrderArchiveService(self.db, retention_days=30).archive_orders(now=NOW)
+        self.db.expunge_all()
+        query_service = OrderQueryService(self.db)
+
+        assert query_service.get_order(order_id, store_id=1) is None
+
+        order = query_service.get_order(order_id, store_id=1, include_history=True, include_archived=True)
+        response = OrderResponse.from_orm(order)
+
+        assert response.id == order_id
+        assert response.status == "served"
+        assert response.total_amount == 11000
+        assert [item.menu_name for item in response.items] == ["Burger"]
+        assert [h.new_status for h in order.history] == ["served"]
+        assert query_service.get_order(order_id, store_id=2, include_archived=True) is None
+
+        page = query_service.paginate_orders(limit=1, store_id=1, archived=True, include_total=True)
+
+        assert page.total == 2
+        assert len(page.orders) == 1
+        assert page.next_cursor is not None
@@ -0,0 +1,191 @@
+"""Tests for order event publishing"""
+import pytest
+from datetime import datetime
+from app.services.order_service import OrderService, OrderItemData
+from app.services.table_session_service import TableSessionService
+from app.models import Store, Table, TableSession, Category, Menu, BrokerEvent
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, create_db_engine
+from app.utils.events import EventBroker, OrderEventBus, OrderEvent, OrderEventType
+from app.config import settings
+from app.utils.event_broker import DatabaseEventBroker, create_event_broker
+from app.utils.menu_cache import MenuCache
+from app.utils.errors import MenuNotAvailableError
+
+
+class TestOrderEventBus:
+    """Test suite for OrderEventBus"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.bus = OrderEventBus()
+
+    def test_publish_reaches_only_store_subscribers(self):
+        """Events are delivered per store"""
+        received = []
+        self.bus.subscribe(1, received.append)
+
+        self.bus.publish(OrderEvent(type=OrderEventType.NEW_ORDER, store_id=1, data={}))
+        self.bus.publish(OrderEvent(type=OrderEventType.NEW_ORDER, store_id=2, data={}))
+
+        assert [e.store_id for e in received] == [1]
+
+    def test_unsubscribe(self):
+        """Unsubscribed handlers stop receiving events"""
+        received = []
+        self.bus.subscribe(1, received.append)
+        self.bus.unsubscribe(1, received.append)
+
+        self.bus.publish(OrderEvent(type=OrderEventType.NEW_ORDER, store_id=1, data={}))
+
+        assert received == []
+        assert not self.bus.has_subscribers(1)
+
+    def test_failing_handler_does_not_block_others(self):
+        """A handler error is isolated from other handlers and the publisher"""
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        self.bus.subscribe(1, broken)
+        self.bus.subscribe(1, received.append)
+
+        self.bus.publish(OrderEvent(type=OrderEventType.NEW_ORDER, store_id=1, data={}))
+
+        assert len(received) == 1
+
+    def test_broker_must_implement_publish(self):
+        """EventBroker is abstract; a subclass without publish can't be created"""
+        class IncompleteBroker(EventBroker):
+            pass
+
+        with pytest.raises(TypeError):
+            EventBroker()
+        with pytest.raises(TypeError):
+            IncompleteBroker()
+
+
+class TestDatabaseEventBroker:
+    """Test suite for relaying events between processes through the database"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup two buses standing in for two worker processes on one database"""
+        self.engine = create_db_engine(f"sqlite:///{tmp_path / 'broker.db'}")
+        Base.metadata.create_all(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+        self.brokers = [DatabaseEventBroker(session_factory=self.SessionLocal) for _ in range(2)]
+        self.buses = [OrderEventBus(broker) for broker in self.brokers]
+        self.received = [[], []]
+        for bus, received in zip(self.buses, self.received):
+            bus.subscribe(1, received.append)
+            bus.broker.run_once()  # Start from the current end of the table
+
+        yield
+
+        self.engine.dispose()
+
+    def test_events_reach_other_process(self):
+        """Local subscribers get events at once, remote ones on the next round trip"""
+        event = OrderEvent(type=OrderEventType.NEW_ORDER, store_id=1, data={"id": 5})
+        self.buses[0].publish(event)
+
+        assert self.received == [[event], []]
+
+        assert self.brokers[0].run_once() == 0  # Writes, skips its own event
+        assert self.brokers[1].run_once() == 1
+        assert self.received == [[event], [event]]
+        assert self.brokers[1].run_once() == 0
+
+    def test_menu_invalidation_reaches_other_process(self):
+        """A menu change in one worker expires the other worker's snapshot"""
+        caches = [MenuCache(bus) for bus in self.buses]
+        for bus, cache in zip(self.buses, caches):
+            bus.subscribe_all(cache.handle_event)
+        snapshots = [cache.get(1, lambda: b"old") for cache in caches]
+
+        caches[0].invalidate(1)
+
+        assert caches[0].lookup(1)[0] is None
+        assert caches[1].lookup(1)[0] is snapshots[1]
+
+        self.brokers[0].run_once()
+        self.brokers[1].run_once()
+
+        assert caches[1].lookup(1)[0] is None
+
+    def test_shared_broker_reports_subscribers(self):
+        """Services publish even when only another process has subscribers"""
+        assert self.buses[0].has_subscribers(99)
+        assert not OrderEventBus().has_subscribers(99)
+
+    def test_database_broker_requires_sqlite(self, monkeypatch):
+        """Out-of-order commits on other databases would lose events"""
+        monkeypatch.setattr(settings, "DATABASE_URL", "postgresql://localhost/table_order")
+
+        with pytest.raises(ValueError):
+            create_event_broker("database")
+
+    def test_old_events_are_pruned(self):
+        """Relayed rows are deleted after the retention period"""
+        broker = DatabaseEventBroker(session_factory=self.SessionLocal, retention_seconds=1)
+        OrderEventBus(broker).publish(OrderEvent(type=OrderEventType.NEW_ORDER, store_id=1, data={}))
+        broker.run_once()
+
+        db = self.SessionLocal()
+        db.query(BrokerEvent).update({BrokerEvent.created_at: datetime(2000, 1, 1)})
+        db.commit()
+        broker._last_prune = 0
+        broker.run_once()
+
+        assert db.query(BrokerEvent).count() == 0
+        db.close()
+
+
+class TestServiceEvents:
+    """Test suite for events published by services"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Setup test fixtures"""
+        self.db = db_session
+        self.bus = OrderEventBus()
+        self.events = []
+        self.bus.subscribe(7, self.events.append)
+
+        self.db.add(Store(id=7, name="Test Store"))
+        self.db.add(Table(id=1, store_id=7, table_number="T1", qr_code="QR001", is_active=True))
+        self.db.add(TableSession(id=1, table_id=1, session_token="token123", started_at=datetime.utcnow()))
+        self.db.add(Category(id=1, store_id=7, name="Main", display_order=0))
+        self.db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        self.db.commit()
+
+    def test_create_and_update_order_publish_events(self):
+        """New orders and status changes are published with order data"""
+        service = OrderService(self.db, event_bus=self.bus)
+
+        order = service.create_order(session_id=1, items=[OrderItemData(menu_id=1, quantity=2)], tip_rate=0)
+        service.update_order_status(order_id=order.id, new_status="preparing")
+
+        assert [e.type for e in self.events] == [OrderEventType.NEW_ORDER, OrderEventType.ORDER_UPDATE]
+        assert self.events[0].data["order_number"] == order.order_number
+        assert self.events[0].data["items"][0]["quantity"] == 2
+        assert self.events[1].data["status"] == "preparing"
+
+    def test_failed_order_publishes_nothing(self):
+        """Events are only published for committed changes"""
+        service = OrderService(self.db, event_bus=self.bus)
+
+        with pytest.raises(MenuNotAvailableError):
+            service.create_order(session_id=1, items=[OrderItemData(menu_id=999, quantity=1)], tip_rate=0)
+
+        assert self.events == []
+
+    def test_end_session_publishes_event(self):
+        """Ending a session notifies the store"""
+        TableSessionService(self.db, event_bus=self.bus).end_session(session_id=1)
+
+        assert self.events[0].type == OrderEventType.SESSION_ENDED
+        assert self.events[0].data == {"session_id": 1, "table_id": 1}
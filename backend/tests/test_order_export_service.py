@@ -0,0 +1,139 @@
+"""Tests for OrderExportService and the streaming encoders"""
+import asyncio
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, create_async_db_engine
+from app.services.order_export_service import OrderExportService, ORDER_EXPORT_COLUMNS, ITEM_EXPORT_COLUMNS
+from app.utils.export import stream_csv, stream_ndjson
+from app.models import (
+    Store, Table, TableSession, Category, Menu, Order, OrderItem, ArchivedOrder, ArchivedOrderItem
+)
+
+
+START = datetime(2026, 10, 1, 12, 0)
+
+
+class TestOrderExportService:
+    """Test suite for streaming order exports"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup live and archived orders for two stores"""
+        self.engine = create_async_db_engine(f"sqlite:///{tmp_path / 'export.db'}")
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        async def seed():
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with self.SessionLocal() as db:
+                db.add(Store(id=1, name="Test Store"))
+                db.add(Store(id=2, name="Other Store"))
+                db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+                db.add(Table(id=2, store_id=2, table_number="X1", qr_code="QR002", is_active=True))
+                db.add(TableSession(id=1, table_id=1, session_token="token1", started_at=START))
+                db.add(TableSession(id=2, table_id=2, session_token="token2", started_at=START))
+                db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+                db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+                await db.commit()
+
+                for i in range(5):
+                    order = Order(
+                        store_id=1, session_id=1, order_number=f"#{i + 1:03d}",
+                        subtotal_amount=20000, tip_rate=0, tip_amount=0, total_amount=20000,
+                        status="cancelled" if i == 4 else "served",
+                        created_at=START + timedelta(days=i + 1)
+                    )
+                    order.items = [
+                        OrderItem(menu_id=1, menu_name="Burger", menu_price=10000, quantity=2, subtotal=20000)
+                    ]
+                    db.add(order)
+                db.add(Order(
+                    store_id=2, session_id=2, order_number="#001",
+                    subtotal_amount=1, tip_rate=0, tip_amount=0, total_amount=1,
+                    status="served", created_at=START
+                ))
+                archived = ArchivedOrder(
+                    id=100, store_id=1, session_id=1, order_number="#099",
+                    subtotal_amount=10000, tip_rate=10, tip_amount=1000, total_amount=11000,
+                    status="served", created_at=START, updated_at=START, archived_at=START
+                )
+                archived.items = [
+                    ArchivedOrderItem(menu_id=1, menu_name="Old Burger", menu_price=10000,
+                                      quantity=1, subtotal=10000, created_at=START)
+                ]
+                db.add(archived)
+                await db.commit()
+
+        asyncio.run(seed())
+
+        yield
+
+        asyncio.run(self.engine.dispose())
+
+    def _export(self, method: str, encoder=None, batch_size: int = 2, **filters):
+        """Run an export and collect its batches, or its encoded chunks"""
+        async def scenario():
+            async with self.SessionLocal() as db:
+                batches = getattr(OrderExportService(db, batch_size=batch_size), method)(store_id=1, **filters)
+                source = encoder(batches) if encoder else batches
+                return [chunk async for chunk in source]
+
+        return asyncio.run(scenario())
+
+    def test_orders_stream_in_batches(self):
+        """Live orders come oldest first in batches, then archived ones"""
+        batches = self._export("iter_orders")
+        rows = [row for batch in batches for row in batch]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1, 1]
+        assert [row["order_number"] for row in rows] == ["#001", "#002", "#003", "#004", "#005", "#099"]
+        assert [row["archived"] for row in rows] == [False] * 5 + [True]
+        assert rows[0]["table_number"] == "T1"
+
+    def test_filters(self):
+        """Status and date filters apply to live and archived orders"""
+        rows = [
+            row for batch in self._export(
+                "iter_orders",
+                status="served",
+                created_from=START + timedelta(days=2),
+                created_to=START + timedelta(days=4)
+            )
+            for row in batch
+        ]
+
+        assert [row["order_number"] for row in rows] == ["#002", "#003"]
+        assert [
+            row["order_number"] for batch in self._export("iter_orders", include_archived=False) for row in batch
+        ][-1] == "#005"
+
+    def test_items_csv_is_flattened(self):
+        """Item export has one CSV row per order line with order metadata"""
+        text = "".join(self._export(
+            "iter_items",
+            encoder=lambda batches: stream_csv(ITEM_EXPORT_COLUMNS, batches),
+            status="served"
+        ))
+        rows = list(csv.DictReader(io.StringIO(text)))
+
+        assert len(rows) == 5
+        assert rows[0]["order_number"] == "#001"
+        assert rows[0]["status"] == "served"
+        assert rows[0]["created_at"] == (START + timedelta(days=1)).isoformat()
+        assert rows[-1]["menu_name"] == "Old Burger"
+        assert rows[-1]["archived"] == "True"
+
+    def test_orders_ndjson(self):
+        """NDJSON has one JSON object per order"""
+        text = "".join(self._export("iter_orders", encoder=stream_ndjson))
+        rows = [json.loads(line) for line in text.splitlines()]
+
+        assert len(rows) == 6
+        assert set(rows[0]) == set(ORDER_EXPORT_COLUMNS)
+        assert rows[4]["status"] == "cancelled"
+        assert rows[5]["total_amount"] == 11000
@@ -0,0 +1,209 @@
+"""Tests for OrderQueryService"""
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from app.services.order_query_service import OrderQueryService
+from app.services.order_service import OrderService, OrderItemData
+from app.utils.errors import InvalidCursorError
+from app.schemas.order import OrderResponse
+from app.models import Store, Table, TableSession, Category, Menu, Order, OrderItem
+
+
+class TestOrderQueryService:
+    """Test suite for OrderQueryService"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Setup test fixtures"""
+        self.db = db_session
+        self.service = OrderQueryService(self.db)
+
+        self.db.add(Store(id=1, name="Test Store"))
+        self.db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+        self.db.add(TableSession(id=1, table_id=1, session_token="token1", started_at=datetime.utcnow()))
+        self.db.add(TableSession(id=2, table_id=1, session_token="token2", started_at=datetime.utcnow()))
+        self.db.add(Store(id=2, name="Other Store"))
+        self.db.add(Table(id=2, store_id=2, table_number="T1", qr_code="QR002", is_active=True))
+        self.db.add(TableSession(id=3, table_id=2, session_token="token3", started_at=datetime.utcnow()))
+        self.db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+        self.db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        self.db.commit()
+
+    def _add_orders(
+        self,
+        count: int,
+        session_id: int = 1,
+        created_at: datetime = None,
+        status: str = "pending",
+        store_id: int = 1
+    ):
+        """Insert `count` orders with two items each"""
+        for i in range(count):
+            order = Order(
+                store_id=store_id,
+                session_id=session_id,
+                order_number=f"#{i + 1:03d}",
+                subtotal_amount=20000,
+                tip_rate=0,
+                tip_amount=0,
+                total_amount=20000,
+                status=status,
+                created_at=created_at or datetime.utcnow()
+            )
+            order.items = [
+                OrderItem(menu_id=1, menu_name="Burger", menu_price=10000, quantity=1, subtotal=10000),
+                OrderItem(menu_id=1, menu_name="Burger", menu_price=10000, quantity=1, subtotal=10000),
+            ]
+            self.db.add(order)
+        self.db.commit()
+        self.db.expunge_all()
+
+    def _count_statements(self, func) -> int:
+        """Run func and return the number of SQL statements it executed"""
+        statements = []
+        engine = self.db.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            func()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        return len(statements)
+
+    def _serialize_all(self, **filters):
+        orders = self.service.list_orders(**filters)
+        return [OrderResponse.from_orm(o) for o in orders]
+
+    def test_list_orders_statement_count_is_constant(self):
+        """Serializing orders must not issue one lazy load per order"""
+        self._add_orders(5)
+        small = self._count_statements(self._serialize_all)
+
+        self._add_orders(50)
+        large = self._count_statements(self._serialize_all)
+
+        assert small == large == 2
+
+    def test_list_orders_with_history_statement_count(self):
+        """History eager loading adds a single extra statement"""
+        self._add_orders(10)
+
+        count = self._count_statements(
+            lambda: [o.history for o in self.service.list_orders(include_history=True)]
+        )
+
+        assert count == 3
+
+    def test_list_orders_filters_by_session(self):
+        """Test session filter only returns that session's orders"""
+        self._add_orders(3, session_id=1)
+        self._add_orders(2, session_id=2)
+
+        orders = self.service.list_orders(session_id=2)
+
+        assert len(orders) == 2
+        assert all(o.session_id == 2 for o in orders)
+
+    def test_get_order_scoped_to_session(self):
+        """Test order lookup respects session scope"""
+        self._add_orders(1, session_id=1)
+        order_id = self.service.list_orders()[0].id
+
+        assert self.service.get_order(order_id, session_id=1) is not None
+        assert self.service.get_order(order_id, session_id=2) is None
+
+    def test_paginate_orders_walks_all_pages(self):
+        """Cursor pages cover every order exactly once, newest first"""
+        now = datetime.utcnow()
+        # Several orders share a timestamp so the id tie-breaker matters
+        self._add_orders(3, created_at=now - timedelta(minutes=2))
+        self._add_orders(4, created_at=now - timedelta(minutes=1))
+
+        seen = []
+        cursor = None
+        while True:
+            page = self.service.paginate_orders(limit=3, cursor=cursor, include_total=True)
+            assert page.total == 7
+            seen.extend((o.created_at, o.id) for o in page.orders)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert len(set(seen)) == 7
+        assert seen == sorted(seen, reverse=True)
+
+    def test_paginate_orders_filters(self):
+        """Status, session and date filters narrow the page and the total"""
+        now = datetime.utcnow()
+        self._add_orders(2, session_id=1, created_at=now - timedelta(days=1))
+        self._add_orders(3, session_id=1, created_at=now, status="preparing")
+        self._add_orders(1, session_id=2, created_at=now)
+
+        page = self.service.paginate_orders(limit=10, status="preparing", include_total=True)
+        assert page.total == 3
+
+        page = self.service.paginate_orders(limit=10, session_id=2, include_total=True)
+        assert page.total == 1
+
+        page = self.service.paginate_orders(limit=10, table_id=1, created_from=now - timedelta(hours=1), include_total=True)
+        assert page.total == 4
+        assert page.next_cursor is None
+
+        assert self.service.paginate_orders(limit=10).total is None
+
+    def test_orders_scoped_to_store(self):
+        """Store filters hide other stores' orders from lists, pages and lookups"""
+        self._add_orders(2, session_id=1, store_id=1)
+        self._add_orders(3, session_id=3, store_id=2)
+
+        assert len(self.service.list_orders(store_id=1)) == 2
+        assert self.service.paginate_orders(limit=10, store_id=2, include_total=True).total == 3
+
+        other_order_id = self.service.list_orders(store_id=2)[0].id
+        assert self.service.get_order(other_order_id, store_id=1) is None
+        assert self.service.get_order(other_order_id, store_id=2) is not None
+
+    def test_paginate_orders_invalid_cursor(self):
+        """Test malformed cursor is rejected"""
+        with pytest.raises(InvalidCursorError):
+            self.service.paginate_orders(limit=10, cursor="not-a-cursor")
+
+    def test_changes_since_cursor(self):
+        """Only orders created or updated after the cursor are returned, latest change last"""
+        order_service = OrderService(self.db)
+        first = order_service.create_order(1, [OrderItemData(menu_id=1, quantity=1)], 0)
+        cursor = self.service.latest_change_cursor(store_id=1)
+
+        second = order_service.create_order(1, [OrderItemData(menu_id=1, quantity=2)], 0)
+        order_service.update_order_status(first.id, "preparing")
+
+        page = self.service.get_changes(store_id=1, since=cursor)
+
+        assert [o.id for o in page.orders] == [second.id, first.id]
+        assert page.has_more is False
+        assert self.service.get_changes(store_id=1, since=page.cursor).orders == []
+        assert self.service.get_changes(store_id=2, since=cursor).orders == []
+
+    def test_changes_are_paged_by_limit(self):
+        """has_more is set until every change has been consumed"""
+        order_service = OrderService(self.db)
+        cursor = self.service.get_changes(store_id=1).cursor
+        order_ids = [
+            order_service.create_order(1, [OrderItemData(menu_id=1, quantity=1)], 0).id
+            for _ in range(3)
+        ]
+
+        first_page = self.service.get_changes(store_id=1, since=cursor, limit=2)
+        second_page = self.service.get_changes(store_id=1, since=first_page.cursor, limit=2)
+
+        assert first_page.has_more is True
+        assert second_page.has_more is False
+        assert [o.id for o in first_page.orders + second_page.orders] == order_ids
+
+        with pytest.raises(InvalidCursorError):
+            self.service.get_changes(store_id=1, since="bogus")
@@ -0,0 +1,80 @@
+"""Tests for per-store daily order number sequences"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.config import settings
+from app.services.order_service import OrderService, OrderItemData
+from app.models import Store, Table, TableSession, Category, Menu
+
+
+class TestOrderSequence:
+    """Test suite for order number allocation"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup a file database shared by several connections"""
+        self.engine = create_engine(
+            f"sqlite:///{tmp_path / 'orders.db'}",
+            connect_args={"check_same_thread": False, "timeout": 30}
+        )
+        Base.metadata.create_all(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+        db = self.SessionLocal()
+        for store_id in (1, 2):
+            db.add(Store(id=store_id, name=f"Store {store_id}"))
+            db.add(Table(id=store_id, store_id=store_id, table_number="T1", qr_code=f"QR{store_id}"))
+            db.add(TableSession(id=store_id, table_id=store_id, session_token=f"token{store_id}"))
+        db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+        db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        db.commit()
+        db.close()
+
+        yield
+
+        Base.metadata.drop_all(self.engine)
+        self.engine.dispose()
+
+    def _create_order(self, session_id: int) -> str:
+        db = self.SessionLocal()
+        try:
+            order = OrderService(db).create_order(
+                session_id=session_id,
+                items=[OrderItemData(menu_id=1, quantity=1)],
+                tip_rate=0
+            )
+            return order.order_number
+        finally:
+            db.close()
+
+    def test_concurrent_orders_get_unique_gapless_numbers(self):
+        """Parallel create_order calls never share or skip a number"""
+        count = 200
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            numbers = list(pool.map(lambda _: self._create_order(1), range(count)))
+
+        assert sorted(numbers) == [f"#{n:03d}" for n in range(1, count + 1)]
+
+    def test_sequences_are_per_store(self):
+        """Each store numbers its orders independently"""
+        assert self._create_order(1) == "#001"
+        assert self._create_order(2) == "#001"
+        assert self._create_order(1) == "#002"
+
+    def test_business_date_respects_cutoff(self, monkeypatch):
+        """Orders before the cutoff hour belong to the previous business day"""
+        monkeypatch.setattr(settings, "STORE_TIMEZONE", "Asia/Seoul")
+        monkeypatch.setattr(settings, "BUSINESS_DAY_CUTOFF_HOUR", 4)
+        db = self.SessionLocal()
+        service = OrderService(db)
+
+        # 2026-03-01 18:30 UTC is 2026-03-02 03:30 in Seoul, before the 04:00 cutoff
+        assert service.get_business_date(datetime(2026, 3, 1, 18, 30)) == date(2026, 3, 1)
+        # 2026-03-01 19:30 UTC is 2026-03-02 04:30 in Seoul
+        assert service.get_business_date(datetime(2026, 3, 1, 19, 30)) == date(2026, 3, 2)
+
+        db.close()
@@ -2,7 +2,7 @@
 import pytest
 from datetime import date, datetime
 from app.services.order_service import OrderService, OrderItemData
-from app.models import Store, Table, TableSession, Category, Menu, Order
+from app.models import Store, Table, TableSession, Category, Menu, Order, OrderSequence
 from app.utils.errors import (
     InvalidTipRateError, SessionNotActiveError, 
     MenuNotAvailableError, InvalidQuantityError,
@@ -50,24 +50,14 @@ class TestOrderService:
         """Test generating sequential order numbers"""
         self.setup_method(db_session)
         
-        # Create first order
-        order1 = Order(
-            session_id=1,
-            order_number="#001",
-            subtotal_amount=10000,
-            tip_rate=0,
-            tip_amount=0,
-            total_amount=10000,
-            status="pending",
-            created_at=datetime.utcnow()
-        )
-        self.db.add(order1)
-        self.db.commit()
+        # Allocate first number
+        order_number1 = self.service.generate_order_number(store_id=1, order_date=date.today())
         
         # Generate next number
-        order_number = self.service.generate_order_number(store_id=1, order_date=date.today())
+        order_number2 = self.service.generate_order_number(store_id=1, order_date=date.today())
         
-        assert order_number == "#002"
+        assert order_number1 == "#001"
+        assert order_number2 == "#002"
 
     # TC-backend-019: 다른 날짜 리셋
     def test_generate_order_number_different_date(self, db_session):
@@ -77,18 +67,8 @@ class TestOrderService:
         from datetime import timedelta
         yesterday = date.today() - timedelta(days=1)
         
-        # Create order from yesterday
-        order1 = Order(
-            session_id=1,
-            order_number="#005",
-            subtotal_amount=10000,
-            tip_rate=0,
-            tip_amount=0,
-            total_amount=10000,
-            status="pending",
-            created_at=datetime(yesterday.year, yesterday.month, yesterday.day)
-        )
-        self.db.add(order1)
+        # Yesterday's sequence already reached #005
+        self.db.add(OrderSequence(store_id=1, business_date=yesterday, last_value=5))
         self.db.commit()
         
         # Today's order should start from #001
@@ -221,3 +201,102 @@ class TestOrderService:
         
         with pytest.raises(InvalidStatusError):
             self.service.update_order_status(order_id=order.id, new_status="invalid_status")
+
+
+class TestOrderServiceBatchItems:
+    """Test suite for batched line item handling in create_order"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Setup test fixtures"""
+        self.db = db_session
+        self.service = OrderService(self.db)
+        
+        self.db.add(Store(id=1, name="Test Store"))
+        self.db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+        self.db.add(TableSession(id=1, table_id=1, session_token="token123", started_at=datetime.utcnow()))
+        self.db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+        for menu_id in range(1, 21):
+            self.db.add(Menu(id=menu_id, category_id=1, name=f"Menu {menu_id}", price=1000 * menu_id, is_available=True))
+        self.db.commit()
+
+    def test_create_order_merges_duplicate_menus(self):
+        """Duplicate menu lines become one item with summed quantity"""
+        items = [
+            OrderItemData(menu_id=2, quantity=1),
+            OrderItemData(menu_id=1, quantity=2),
+            OrderItemData(menu_id=2, quantity=3),
+        ]
+        
+        order = self.service.create_order(session_id=1, items=items, tip_rate=0)
+        
+        lines = sorted((i.menu_id, i.quantity, i.subtotal) for i in order.items)
+        assert lines == [(1, 2, 2000), (2, 4, 8000)]
+        assert order.subtotal_amount == 10000
+
+    def test_create_order_resolves_menus_in_one_query(self):
+        """Menu lookups do not scale with the number of lines"""
+        from sqlalchemy import event
+        
+        menu_queries = []
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "FROM menus" in statement:
+                menu_queries.append(statement)
+        
+        engine = self.db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            items = [OrderItemData(menu_id=menu_id, quantity=1) for menu_id in range(1, 21)]
+            order = self.service.create_order(session_id=1, items=items, tip_rate=0)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        
+        assert len(menu_queries) == 1
+        assert len(order.items) == 20
+
+    def test_create_order_unavailable_menu_inserts_nothing(self):
+        """One unavailable line rejects the whole order"""
+        menu = self.db.query(Menu).filter_by(id=5).first()
+        menu.is_available = False
+        self.db.commit()
+        
+        items = [OrderItemData(menu_id=menu_id, quantity=1) for menu_id in (1, 5, 999)]
+        
+        with pytest.raises(MenuNotAvailableError, match="Menu 5"):
+            self.service.create_order(session_id=1, items=items, tip_rate=0)
+        
+        assert self.db.query(Order).count() == 0
+
+
+class TestOrderServiceStoreScope:
+    """Test suite for store scoping in OrderService"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Setup test fixtures"""
+        self.db = db_session
+        self.service = OrderService(self.db)
+        
+        self.db.add(Store(id=1, name="Test Store"))
+        self.db.add(Store(id=2, name="Other Store"))
+        self.db.add(Table(id=1, store_id=2, table_number="T1", qr_code="QR001", is_active=True))
+        self.db.add(TableSession(id=1, table_id=1, session_token="token123", started_at=datetime.utcnow()))
+        self.db.add(Category(id=1, store_id=2, name="Main", display_order=0))
+        self.db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        self.db.commit()
+
+    def test_create_order_records_table_store(self):
+        """Orders carry the store of the session's table"""
+        order = self.service.create_order(session_id=1, items=[OrderItemData(menu_id=1, quantity=1)], tip_rate=0)
+        
+        assert order.store_id == 2
+
+    def test_update_order_status_rejects_other_store(self):
+        """Admins of another store cannot change the order"""
+        order = self.service.create_order(session_id=1, items=[OrderItemData(menu_id=1, quantity=1)], tip_rate=0)
+        
+        with pytest.raises(OrderNotFoundError):
+            self.service.update_order_status(order.id, "preparing", store_id=1)
+        
+        assert self.service.update_order_status(order.id, "preparing", store_id=2).status.value == "preparing"
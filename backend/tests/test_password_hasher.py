@@ -0,0 +1,127 @@
+"""Tests for PasswordHasher and LoginRateLimiter"""
+import asyncio
+import threading
+import pytest
+from app.config import settings
+from app.services.auth_service import AuthService
+from app.utils.password_hasher import PasswordHasher
+from app.utils.rate_limit import LoginRateLimiter
+from app.utils.errors import PasswordHashingBusyError, LoginRateLimitedError
+
+
+class BlockingAuthService(AuthService):
+    """AuthService whose verify blocks until released"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        self.started.set()
+        self.release.wait(5)
+        return True
+
+
+class TestPasswordHasher:
+    """Test suite for PasswordHasher"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """Use a cheap cost factor"""
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+    def test_hash_and_verify_on_pool(self):
+        """Hashing round-trips through the worker pool"""
+        hasher = PasswordHasher(max_workers=2, max_pending=4)
+
+        async def scenario():
+            hashed = await hasher.hash_password("secret")
+            return (
+                hashed,
+                await hasher.verify_password("secret", hashed),
+                await hasher.verify_password("wrong", hashed)
+            )
+
+        try:
+            hashed, ok, wrong = asyncio.run(scenario())
+        finally:
+            hasher.shutdown()
+
+        assert hashed.startswith("$2b$04$")
+        assert ok is True
+        assert wrong is False
+        assert hasher.pending == 0
+
+    def test_rejects_jobs_over_max_pending(self):
+        """Jobs beyond the pending limit fail fast instead of queueing"""
+        auth_service = BlockingAuthService()
+        hasher = PasswordHasher(max_workers=1, max_pending=1, auth_service=auth_service)
+
+        async def scenario():
+            first = asyncio.ensure_future(hasher.verify_password("pw", "hash"))
+            await asyncio.get_running_loop().run_in_executor(None, auth_service.started.wait, 5)
+
+            with pytest.raises(PasswordHashingBusyError):
+                await hasher.verify_password("pw", "hash")
+
+            auth_service.release.set()
+            return await first
+
+        try:
+            assert asyncio.run(scenario()) is True
+        finally:
+            auth_service.release.set()
+            hasher.shutdown()
+
+        assert hasher.rejected_count == 1
+
+    def test_needs_rehash_when_cost_changes(self, monkeypatch):
+        """Hashes made at another cost factor are flagged for rehash"""
+        auth_service = AuthService()
+        hashed = auth_service.hash_password("secret")
+
+        assert auth_service.needs_rehash(hashed) is False
+
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+        assert auth_service.needs_rehash(hashed) is True
+        assert auth_service.needs_rehash(auth_service.hash_password("secret")) is False
+
+
+class TestLoginRateLimiter:
+    """Test suite for LoginRateLimiter"""
+
+    def setup_method(self):
+        """Setup a limiter on a fake clock"""
+        self.now = 1000.0
+        self.limiter = LoginRateLimiter(max_attempts=3, window_seconds=60, clock=lambda: self.now)
+
+    def test_blocks_after_max_failures(self):
+        """Further attempts are refused once the limit is reached"""
+        for _ in range(3):
+            self.limiter.check("admin")
+            self.limiter.record_failure("admin")
+
+        with pytest.raises(LoginRateLimitedError) as exc_info:
+            self.limiter.check("admin")
+
+        assert exc_info.value.retry_after == 60
+        self.limiter.check("other")  # Other usernames are unaffected
+
+    def test_failures_expire_after_window(self):
+        """Old failures fall out of the sliding window"""
+        for _ in range(3):
+            self.limiter.record_failure("admin")
+
+        self.now += 61
+
+        self.limiter.check("admin")
+
+    def test_reset_clears_failures(self):
+        """A successful login clears the username's history"""
+        for _ in range(3):
+            self.limiter.record_failure("admin")
+
+        self.limiter.reset("admin")
+
+        self.limiter.check("admin")
@@ -0,0 +1,164 @@
+"""Tests for SalesRollupService and AnalyticsService"""
+import asyncio
+import pytest
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, create_async_db_engine
+from app.services.order_service import OrderService, OrderItemData
+from app.services.sales_rollup_service import SalesRollupService
+from app.services.analytics_service import AnalyticsService
+from app.models import Store, Table, TableSession, Category, Menu, DailySales, DailyMenuSales
+
+
+class TestSalesRollupService:
+    """Test suite for incremental sales rollups"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Setup a store with an active session and two menus"""
+        self.db = db_session
+        self.service = OrderService(self.db)
+
+        self.db.add(Store(id=1, name="Test Store"))
+        self.db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+        self.db.add(TableSession(id=1, table_id=1, session_token="token1", started_at=datetime.utcnow()))
+        self.db.add(Category(id=1, store_id=1, name="Main", display_order=0))
+        self.db.add(Menu(id=1, category_id=1, name="Burger", price=10000, is_available=True))
+        self.db.add(Menu(id=2, category_id=1, name="Fries", price=3000, is_available=True))
+        self.db.commit()
+
+    def _rollups(self):
+        """Snapshot the rollup tables"""
+        sales = [
+            (row.business_date, row.order_count, row.subtotal_amount, row.tip_amount, row.total_amount)
+            for row in self.db.query(DailySales).order_by(DailySales.business_date)
+        ]
+        menus = [
+            (row.menu_id, row.menu_name, row.quantity, row.subtotal_amount, row.order_count)
+            for row in self.db.query(DailyMenuSales).order_by(DailyMenuSales.menu_id)
+        ]
+        return sales, menus
+
+    def test_create_order_updates_rollups(self):
+        """Each order adds to its day's totals and menu lines"""
+        self.service.create_order(1, [OrderItemData(menu_id=1, quantity=2), OrderItemData(menu_id=2, quantity=1)], 10)
+        order = self.service.create_order(1, [OrderItemData(menu_id=1, quantity=1)], 0)
+
+        sales, menus = self._rollups()
+        today = self.service.get_business_date(order.created_at)
+
+        assert sales == [(today, 2, 33000, 2300, 35300)]
+        assert menus == [(1, "Burger", 3, 30000, 2), (2, "Fries", 1, 3000, 1)]
+
+    def test_cancel_and_restore_adjust_rollups(self):
+        """Cancelling subtracts the order; moving it back out of cancelled re-adds it"""
+        self.service.create_order(1, [OrderItemData(menu_id=1, quantity=1)], 0)
+        order = self.service.create_order(1, [OrderItemData(menu_id=2, quantity=2)], 0)
+        before = self._rollups()
+
+        self.service.update_order_status(order.id, "cancelled")
+        sales, menus = self._rollups()
+
+        assert sales[0][1:] == (1, 10000, 0, 10000)
+        assert menus == [(1, "Burger", 1, 10000, 1), (2, "Fries", 0, 0, 0)]
+
+        self.service.update_order_status(order.id, "cancelled")  # No double subtraction
+        assert self._rollups() == (sales, menus)
+
+        self.service.update_order_status(order.id, "pending")
+        assert self._rollups() == before
+
+    def test_rebuild_day_matches_incremental(self):
+        """Recomputing a day from orders gives the same rollups"""
+        self.service.create_order(1, [OrderItemData(menu_id=1, quantity=2), OrderItemData(menu_id=2, quantity=1)], 5)
+        order = self.service.create_order(1, [OrderItemData(menu_id=2, quantity=3)], 0)
+        self.service.update_order_status(order.id, "cancelled")
+        self.service.create_order(1, [OrderItemData(menu_id=1, quantity=1)], 20)
+        incremental = self._rollups()
+
+        SalesRollupService(self.db).rebuild_day(1, self.service.get_business_date(order.created_at))
+        sales, menus = self._rollups()
+
+        assert sales == incremental[0]
+        # Rebuilt rows omit menus whose orders were all cancelled
+        assert menus == [row for row in incremental[1] if row[2] != 0]
+
+
+class TestAnalyticsService:
+    """Test suite for rollup-only analytics queries"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup rollup rows on the async engine"""
+        self.engine = create_async_db_engine(f"sqlite:///{tmp_path / 'analytics.db'}")
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.statements = []
+
+        async def seed():
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with self.SessionLocal() as db:
+                db.add(Store(id=1, name="Test Store"))
+                db.add(Store(id=2, name="Other Store"))
+                await db.commit()
+
+                for day, (burgers, fries) in enumerate([(3, 1), (1, 4), (2, 0)], start=1):
+                    date = datetime(2026, 10, day).date()
+                    db.add(DailySales(
+                        store_id=1, business_date=date, order_count=2,
+                        subtotal_amount=10000 * burgers + 3000 * fries, tip_amount=100, total_amount=0
+                    ))
+                    db.add(DailyMenuSales(
+                        store_id=1, business_date=date, menu_id=1, menu_name="Burger",
+                        quantity=burgers, subtotal_amount=10000 * burgers, order_count=1
+                    ))
+                    db.add(DailyMenuSales(
+                        store_id=1, business_date=date, menu_id=2, menu_name="Fries",
+                        quantity=fries, subtotal_amount=3000 * fries, order_count=1 if fries else 0
+                    ))
+                db.add(DailySales(
+                    store_id=2, business_date=datetime(2026, 10, 1).date(), order_count=9,
+                    subtotal_amount=1, tip_amount=1, total_amount=1
+                ))
+                await db.commit()
+
+        asyncio.run(seed())
+
+        event.listen(
+            self.engine.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.statements.append(statement)
+        )
+
+        yield
+
+        asyncio.run(self.engine.dispose())
+
+    def _run(self, call):
+        async def scenario():
+            async with self.SessionLocal() as db:
+                return await call(AnalyticsService(db))
+
+        return asyncio.run(scenario())
+
+    def test_daily_sales_in_range(self):
+        """Only the store's days inside the range are returned"""
+        days = self._run(lambda service: service.daily_sales(
+            1, datetime(2026, 10, 2).date(), datetime(2026, 10, 31).date()
+        ))
+
+        assert [(d.business_date.day, d.subtotal_amount) for d in days] == [(2, 22000), (3, 20000)]
+        assert len(self.statements) == 1
+
+    def test_top_menus_sum_across_days(self):
+        """Menus are ranked by total quantity over the range"""
+        menus = self._run(lambda service: service.top_menus(
+            1, datetime(2026, 10, 1).date(), datetime(2026, 10, 3).date(), limit=10
+        ))
+
+        assert [(m.menu_name, m.quantity, m.subtotal_amount, m.order_count) for m in menus] == [
+            ("Burger", 6, 60000, 3),
+            ("Fries", 5, 15000, 2),
+        ]
+        assert len(self.statements) == 1
@@ -0,0 +1,34 @@
+"""Tests for JSONSerializer"""
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from app.schemas.order import OrderListResponse, OrderResponse, order_list_serializer
+
+
+def _order(order_id: int):
+    item = SimpleNamespace(id=order_id, menu_id=1, menu_name="Menu", menu_price=1000, quantity=2, subtotal=2000)
+    return SimpleNamespace(
+        id=order_id, order_number=f"#{order_id:03d}", subtotal_amount=2000, tip_rate=0, tip_amount=0,
+        total_amount=2000, status="pending", items=[item], created_at=datetime(2026, 1, 1, 12, 0)
+    )
+
+
+class TestJSONSerializer:
+    """Test suite for JSONSerializer"""
+
+    def test_dump_matches_response_model(self):
+        """ORM-like objects encode to the same JSON as the response model"""
+        orders = [_order(1), _order(2)]
+        expected = OrderListResponse(orders=[OrderResponse.from_orm(o) for o in orders], total=2)
+
+        body = order_list_serializer.dump({"orders": orders, "total": 2})
+
+        assert json.loads(body) == json.loads(expected.model_dump_json())
+
+    def test_response(self):
+        """The response carries the encoded body as JSON"""
+        response = order_list_serializer.response({"orders": [], "total": 0}, headers={"ETag": '"x"'})
+
+        assert response.media_type == "application/json"
+        assert response.headers["etag"] == '"x"'
+        assert json.loads(response.body)["total"] == 0
@@ -0,0 +1,130 @@
+"""Tests for SessionTokenCache and SessionResolver"""
+import asyncio
+import pytest
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, create_async_db_engine
+from app.services.session_resolver import SessionResolver
+from app.services.table_session_service import TableSessionService
+from app.models import Store, Table, TableSession
+from app.utils.session_cache import SessionInfo, SessionTokenCache
+
+
+INFO = SessionInfo(session_id=1, table_id=1, store_id=1, active=True)
+
+
+class TestSessionTokenCache:
+    """Test suite for SessionTokenCache"""
+
+    def setup_method(self):
+        """Setup a cache on a fake clock"""
+        self.now = 0.0
+        self.cache = SessionTokenCache(max_size=2, ttl_seconds=30, clock=lambda: self.now)
+
+    def test_entries_expire_after_ttl(self):
+        """Entries are dropped once the TTL passes"""
+        self.cache.put("a", INFO)
+
+        assert self.cache.get("a") == INFO
+
+        self.now += 30
+
+        assert self.cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The cache stays within max_size"""
+        self.cache.put("a", INFO)
+        self.cache.put("b", INFO)
+        self.cache.get("a")
+        self.cache.put("c", INFO)
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == INFO
+        assert len(self.cache) == 2
+
+    def test_put_after_invalidation_is_skipped(self):
+        """A lookup that raced an invalidation is not cached"""
+        generation = self.cache.generation
+        self.cache.invalidate("other")
+        self.cache.put("a", INFO, generation)
+
+        assert self.cache.get("a") is None
+
+
+class TestSessionResolver:
+    """Test suite for SessionResolver"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup a file database on the async engine"""
+        self.engine = create_async_db_engine(f"sqlite:///{tmp_path / 'resolver.db'}")
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.cache = SessionTokenCache()
+        self.statements = []
+
+        async def seed():
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with self.SessionLocal() as db:
+                db.add(Store(id=1, name="Test Store"))
+                db.add(Table(id=1, store_id=1, table_number="T1", qr_code="QR001", is_active=True))
+                db.add(TableSession(id=1, table_id=1, session_token="token1", started_at=datetime.utcnow()))
+                await db.commit()
+
+        asyncio.run(seed())
+
+        event.listen(
+            self.engine.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.statements.append(statement)
+        )
+
+        yield
+
+        asyncio.run(self.engine.dispose())
+
+    def _resolve(self, token: str):
+        async def scenario():
+            async with self.SessionLocal() as db:
+                return await SessionResolver(db, self.cache).resolve(token)
+
+        return asyncio.run(scenario())
+
+    def _run_session_service(self, call):
+        async def scenario():
+            async with self.SessionLocal() as db:
+                await db.run_sync(lambda session: call(TableSessionService(session, token_cache=self.cache)))
+
+        asyncio.run(scenario())
+
+    def test_repeat_resolution_skips_database(self):
+        """Only the first lookup for a token queries the database"""
+        first = self._resolve("token1")
+        second = self._resolve("token1")
+
+        assert first == SessionInfo(session_id=1, table_id=1, store_id=1, active=True)
+        assert second == first
+        assert len(self.statements) == 1
+
+    def test_unknown_token_is_not_cached(self):
+        """Unknown tokens resolve to None and are looked up each time"""
+        assert self._resolve("missing") is None
+        assert self._resolve("missing") is None
+        assert len(self.statements) == 2
+
+    def test_end_session_invalidates_token(self):
+        """Ending a session is visible on the next resolution"""
+        self._resolve("token1")
+
+        self._run_session_service(lambda service: service.end_session(1))
+
+        assert self._resolve("token1").active is False
+
+    def test_create_session_invalidates_replaced_token(self):
+        """Auto-ending the previous session on login invalidates its token"""
+        self._resolve("token1")
+
+        self._run_session_service(lambda service: service.create_session(1))
+
+        assert self._resolve("token1").active is False
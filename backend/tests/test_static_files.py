@@ -0,0 +1,86 @@
+"""Tests for upload static file serving"""
+import gzip
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.utils.static_files import UploadStaticFiles, parse_range
+
+
+HASHED = "b792c34c1bd1b730-card.webp"
+
+
+class TestUploadStaticFiles:
+    """Test suite for UploadStaticFiles"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Serve a directory with a hashed variant, a legacy file and a JSON file with a sidecar"""
+        (tmp_path / HASHED).write_bytes(bytes(range(100)))
+        (tmp_path / "1.jpg").write_bytes(b"legacy")
+        (tmp_path / "menu.json").write_bytes(b'{"a": 1}' * 50)
+        (tmp_path / "menu.json.gz").write_bytes(gzip.compress(b'{"a": 1}' * 50))
+        (tmp_path / "menu.json.br").write_bytes(b"not really brotli")
+
+        app = FastAPI()
+        app.mount("/uploads", UploadStaticFiles(directory=str(tmp_path)), name="uploads")
+        self.client = TestClient(app)
+
+    def test_hashed_files_are_immutable(self):
+        """Content-hashed names get a long immutable max-age and the hash as ETag"""
+        response = self.client.get(f"/uploads/{HASHED}")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"b792c34c1bd1b730"'
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["content-type"] == "image/webp"
+
+        revalidated = self.client.get(f"/uploads/{HASHED}", headers={"If-None-Match": '"b792c34c1bd1b730"'})
+        assert revalidated.status_code == 304
+
+    def test_other_files_are_revalidated(self):
+        """Files without a hash in their name must be revalidated"""
+        response = self.client.get("/uploads/1.jpg")
+
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["etag"].startswith('"')
+
+    def test_range_requests(self):
+        """Single byte ranges return 206 with the requested bytes"""
+        response = self.client.get(f"/uploads/{HASHED}", headers={"Range": "bytes=10-19"})
+
+        assert response.status_code == 206
+        assert response.content == bytes(range(10, 20))
+        assert response.headers["content-range"] == "bytes 10-19/100"
+
+        assert self.client.get(f"/uploads/{HASHED}", headers={"Range": "bytes=-5"}).content == bytes(range(95, 100))
+        assert self.client.get(f"/uploads/{HASHED}", headers={"Range": "bytes=200-"}).status_code == 416
+
+        stale = self.client.get(f"/uploads/{HASHED}", headers={"Range": "bytes=0-1", "If-Range": '"other"'})
+        assert stale.status_code == 200
+        assert len(stale.content) == 100
+
+    def test_precompressed_sidecar(self):
+        """A .gz sidecar is sent to clients accepting gzip"""
+        compressed = self.client.get("/uploads/menu.json", headers={"Accept-Encoding": "gzip"})
+        plain = self.client.get("/uploads/menu.json", headers={"Accept-Encoding": "identity"})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.content == plain.content
+        assert compressed.headers["vary"] == plain.headers["vary"] == "Accept-Encoding"
+        assert compressed.headers["etag"] != plain.headers["etag"]
+        assert "content-encoding" not in plain.headers
+
+    def test_sidecar_negotiation_honours_q_values(self):
+        """The preferred sidecar is skipped when the client refuses it with q=0"""
+        no_brotli = self.client.get("/uploads/menu.json", headers={"Accept-Encoding": "br;q=0, gzip"})
+        no_gzip = self.client.get("/uploads/menu.json", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert no_brotli.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in no_gzip.headers
+
+    def test_parse_range(self):
+        """Malformed and multi-range headers fall back to the whole file"""
+        assert parse_range("bytes=0-", 10) == (0, 9)
+        assert parse_range("bytes=5-100", 10) == (5, 9)
+        assert parse_range("bytes=0-1,4-5", 10) is None
+        assert parse_range("items=0-1", 10) is None
@@ -0,0 +1,126 @@
+"""Tests for streaming image upload storage"""
+import asyncio
+import hashlib
+import os
+import pytest
+from app.config import settings
+from app.utils.errors import FileTooLargeError, InvalidImageError
+from app.routers import admin_menu
+from app.utils.uploads import sniff_image_type, store_image_upload
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+class TestStoreImageUpload:
+    """Test suite for store_image_upload"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Point the upload directories at a temporary location"""
+        self.upload_dir = tmp_path / "uploads"
+        self.tmp_dir = tmp_path / "uploads_tmp"
+        monkeypatch.setattr(settings, "UPLOAD_DIR", str(self.upload_dir))
+        monkeypatch.setattr(settings, "UPLOAD_TMP_DIR", str(self.tmp_dir))
+        monkeypatch.setattr(settings, "UPLOAD_MANIFEST_DIR", str(tmp_path / "manifests"))
+
+    def _store(self, data: bytes, max_size: int = 1000):
+        return asyncio.run(store_image_upload(_chunks(data), max_size=max_size))
+
+    def test_stored_under_content_hash(self):
+        """The type comes from magic bytes and the name from the SHA-256"""
+        upload = self._store(PNG)
+        digest = hashlib.sha256(PNG).hexdigest()
+
+        assert upload.path == os.path.join(str(self.upload_dir), "originals", f"{digest}.png")
+        assert open(upload.path, "rb").read() == PNG
+        assert (upload.extension, upload.size, upload.duplicate) == ("png", len(PNG), False)
+        assert os.listdir(self.tmp_dir) == []
+
+    def test_identical_upload_is_deduplicated(self):
+        """Uploading the same content again reuses the stored file"""
+        first = self._store(PNG)
+        second = self._store(PNG)
+
+        assert second.path == first.path
+        assert second.duplicate
+        assert len(os.listdir(self.upload_dir / "originals")) == 1
+        assert os.listdir(self.tmp_dir) == []
+
+    def test_oversized_upload_is_rejected_and_removed(self):
+        """The size limit applies while streaming and leaves no partial file"""
+        with pytest.raises(FileTooLargeError):
+            self._store(PNG, max_size=50)
+
+        assert os.listdir(self.tmp_dir) == []
+        assert os.listdir(self.upload_dir / "originals") == []
+
+    def test_non_image_is_rejected(self):
+        """A file whose bytes are not a supported image is rejected regardless of name"""
+        with pytest.raises(InvalidImageError):
+            self._store(b"<html>not an image</html>")
+
+        assert os.listdir(self.tmp_dir) == []
+
+    def test_sniff_image_type(self):
+        """JPEG, PNG and WebP signatures are recognized"""
+        assert sniff_image_type(b"\xff\xd8\xff\xe0" + b"\x00" * 8) == "jpg"
+        assert sniff_image_type(PNG[:12]) == "png"
+        assert sniff_image_type(b"RIFF\x00\x00\x00\x00WEBP") == "webp"
+        assert sniff_image_type(b"GIF89a") is None
+
+
+class TestRenderMenuImage:
+    """Test suite for render_menu_image manifests and cleanup"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Point the upload directories at a temporary location and stub rendering"""
+        self.tmp_path = tmp_path
+        self.upload_dir = tmp_path / "uploads"
+        monkeypatch.setattr(settings, "UPLOAD_DIR", str(self.upload_dir))
+        monkeypatch.setattr(settings, "UPLOAD_TMP_DIR", str(tmp_path / "uploads_tmp"))
+        monkeypatch.setattr(settings, "UPLOAD_MANIFEST_DIR", str(tmp_path / "manifests"))
+
+        self.renders = 0
+        self.fail = False
+
+        async def process(source_path, output_dir, name, temp_dir=None):
+            self.renders += 1
+            if self.fail:
+                raise InvalidImageError("Unreadable image")
+            return {"variants": {}, "placeholder": None}
+
+        monkeypatch.setattr(admin_menu.image_processor, "process", process)
+
+    def _render(self):
+        async def scenario():
+            upload = await store_image_upload(_chunks(PNG), max_size=1000)
+            return upload, await admin_menu.render_menu_image(upload)
+
+        return asyncio.run(scenario())
+
+    def test_manifest_is_kept_outside_served_directory(self):
+        """Duplicates reuse a manifest that /uploads does not serve"""
+        upload, _ = self._render()
+        self._render()
+
+        assert self.renders == 1
+        assert os.listdir(self.tmp_path / "manifests") == [f"{upload.digest}.json"]
+        assert not any(name.endswith(".json") for _, _, names in os.walk(self.upload_dir) for name in names)
+
+    def test_failed_duplicate_keeps_shared_original(self):
+        """Only the request that stored an original removes it on failure"""
+        upload, _ = self._render()
+        os.remove(self.tmp_path / "manifests" / f"{upload.digest}.json")
+        self.fail = True
+
+        with pytest.raises(InvalidImageError):
+            self._render()
+
+        assert os.path.exists(upload.path)
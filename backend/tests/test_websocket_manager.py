@@ -0,0 +1,361 @@
+"""Tests for ConnectionManager"""
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from fastapi import WebSocketDisconnect
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, create_async_db_engine
+from app.models import Store, Table, TableSession
+from app.routers import websocket as websocket_router
+from app.utils.events import OrderEvent, OrderEventBus, OrderEventType
+from app.utils.websocket import ConnectionManager, ReplayBuffer, SLOW_CONSUMER_CLOSE_CODE
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in recording sent text"""
+
+    def __init__(self, send_delay: float = 0.0, block: bool = False):
+        self.send_delay = send_delay
+        self.block = block
+        self.sent = []
+        self.closed_code = None
+        self.client = None
+        self._release = asyncio.Event()
+        self._hung_up = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.block:
+            await self._release.wait()
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+    async def receive_text(self) -> str:
+        await self._hung_up.wait()
+        raise WebSocketDisconnect()
+
+    def hang_up(self):
+        """Simulate the client closing the connection"""
+        self._hung_up.set()
+
+
+async def _drain():
+    """Let writer tasks run"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManager:
+    """Test suite for ConnectionManager"""
+
+    def test_broadcast_serializes_once_and_delivers_to_all(self):
+        """Every connection receives the same serialized message"""
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=10)
+            sockets = [FakeWebSocket() for _ in range(3)]
+            for ws in sockets:
+                await manager.connect(ws, 1)
+
+            await manager.broadcast_to_store(1, {"type": "new_order", "data": {"id": 1}})
+            await _drain()
+
+            return sockets
+
+        sockets = asyncio.run(scenario())
+
+        assert all(len(ws.sent) == 1 for ws in sockets)
+        assert json.loads(sockets[0].sent[0]) == {"type": "new_order", "data": {"id": 1}}
+        assert sockets[0].sent[0] is sockets[1].sent[0]
+
+    def test_slow_client_does_not_delay_others(self):
+        """Broadcast returns without waiting for a slow client's send"""
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=10)
+            slow = FakeWebSocket(send_delay=5)
+            fast = FakeWebSocket()
+            await manager.connect(slow, 1)
+            await manager.connect(fast, 1)
+
+            await asyncio.wait_for(manager.broadcast_to_store(1, {"type": "ping"}), timeout=0.5)
+            await _drain()
+
+            return manager, slow, fast
+
+        manager, slow, fast = asyncio.run(scenario())
+
+        assert len(fast.sent) == 1
+        assert slow.sent == []
+
+    def test_overflowing_client_is_disconnected(self):
+        """A client whose queue fills up is closed and unregistered"""
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=2)
+            stuck = FakeWebSocket(block=True)
+            healthy = FakeWebSocket()
+            await manager.connect(stuck, 1)
+            await manager.connect(healthy, 1)
+
+            for i in range(5):
+                await manager.broadcast_to_store(1, {"seq": i})
+                await _drain()
+
+            return manager, stuck, healthy
+
+        manager, stuck, healthy = asyncio.run(scenario())
+
+        assert stuck.closed_code == SLOW_CONSUMER_CLOSE_CODE
+        assert len(healthy.sent) == 5
+        assert manager.slow_consumer_disconnects == 1
+        assert [m["queue_capacity"] for m in manager.get_metrics(1)] == [2]
+
+    def test_metrics_report_queue_depth_and_sent_count(self):
+        """Per-connection metrics reflect delivered messages"""
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=10)
+            ws = FakeWebSocket()
+            await manager.connect(ws, 3)
+
+            await manager.broadcast_to_store(3, {"type": "ping"})
+            await _drain()
+
+            return manager.get_metrics(3)
+
+        metrics = asyncio.run(scenario())
+
+        assert len(metrics) == 1
+        assert metrics[0]["sent_count"] == 1
+        assert metrics[0]["queue_depth"] == 0
+        assert metrics[0]["last_lag_ms"] >= 0
+
+    def test_counts_are_per_store(self):
+        """Connections grouped by session are counted under their store only"""
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=1)
+            stuck = FakeWebSocket(block=True)
+            await manager.connect(stuck, 10, tenant_id=1)
+            await manager.connect(FakeWebSocket(), 11, tenant_id=1)
+            await manager.connect(FakeWebSocket(), 20, tenant_id=2)
+
+            for i in range(3):
+                await manager.broadcast_to_store(10, {"seq": i})
+                await _drain()
+
+            return manager
+
+        manager = asyncio.run(scenario())
+
+        assert manager.connection_count(1) == 1
+        assert manager.connection_count(2) == 1
+        assert manager.slow_consumer_count(1) == 1
+        assert manager.slow_consumer_count(2) == 0
+
+    def test_register_sends_initial_messages_first(self):
+        """Initial messages are queued ahead of later broadcasts"""
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=10)
+            ws = FakeWebSocket()
+            manager.register(ws, 1, ['{"type": "hello"}'])
+
+            await manager.broadcast_to_store(1, {"type": "ping"})
+            await _drain()
+
+            return ws
+
+        ws = asyncio.run(scenario())
+
+        assert [json.loads(text)["type"] for text in ws.sent] == ["hello", "ping"]
+
+
+class TestReplayBuffer:
+    """Test suite for sequence numbering and resume"""
+
+    def test_record_numbers_messages_per_store(self):
+        """Each store has its own sequence"""
+        buffer = ReplayBuffer(max_size=10)
+
+        first = json.loads(buffer.record(1, {"type": "new_order"}))
+        buffer.record(1, {"type": "order_update"})
+        other = json.loads(buffer.record(2, {"type": "new_order"}))
+
+        assert first == {"type": "new_order", "seq": 1}
+        assert other["seq"] == 1
+        assert buffer.last_seq(1) == 2
+        assert buffer.last_seq(3) == 0
+
+    def test_since_returns_missed_messages_or_none(self):
+        """Only gaps still inside the buffer can be replayed"""
+        buffer = ReplayBuffer(max_size=3)
+        for i in range(5):
+            buffer.record(1, {"type": "order_update", "data": {"id": i}})
+
+        assert [json.loads(text)["seq"] for text in buffer.since(1, 3)] == [4, 5]
+        assert buffer.since(1, 5) == []
+        assert buffer.since(1, 2) is not None
+        assert buffer.since(1, 1) is None  # seq 2 was evicted
+        assert buffer.since(1, 9) is None  # From before a restart
+
+    def test_resume_messages(self, monkeypatch):
+        """Reconnecting clients get a hello and their missed events, or a resync"""
+        buffer = ReplayBuffer(max_size=2)
+        monkeypatch.setattr(websocket_router, "replay_buffer", buffer)
+        for i in range(3):
+            buffer.record(1, {"type": "order_update", "data": {"id": i}})
+
+        def resume(stream, last_seq):
+            return [json.loads(text) for text in websocket_router.resume_messages(1, stream, last_seq)]
+
+        fresh = resume(None, None)
+        assert fresh == [{"type": "hello", "stream": buffer.stream_id, "seq": 3, "resync": False}]
+
+        resumed = resume(buffer.stream_id, 2)
+        assert resumed[0]["resync"] is False
+        assert [m["seq"] for m in resumed[1:]] == [3]
+
+        assert resume(buffer.stream_id, 0)[0]["resync"] is True
+        assert resume("other-stream", 2) == [{**fresh[0], "resync": True}]
+
+    def test_resume_after_more_missed_events_than_the_send_queue(self, monkeypatch):
+        """A gap larger than the send queue resyncs instead of overflowing it"""
+        buffer = ReplayBuffer(max_size=500)
+        monkeypatch.setattr(websocket_router, "replay_buffer", buffer)
+        for i in range(150):
+            buffer.record(1, {"type": "order_update", "data": {"id": i}})
+
+        async def scenario():
+            manager = ConnectionManager(max_queue_size=100)
+            ws = FakeWebSocket()
+            messages = websocket_router.resume_messages(1, buffer.stream_id, 10, max_replay=manager.max_queue_size - 1)
+            manager.register(ws, 1, messages)
+            await _drain()
+            return ws
+
+        ws = asyncio.run(scenario())
+
+        assert [json.loads(text) for text in ws.sent] == [
+            {"type": "hello", "stream": buffer.stream_id, "seq": 150, "resync": True}
+        ]
+
+        replayed = websocket_router.resume_messages(1, buffer.stream_id, 60, max_replay=99)
+        assert len(replayed) == 91
+
+
+class TestCustomerWebSocket:
+    """Test suite for the customer (tablet) WebSocket endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Setup sessions in two stores, one of them ended"""
+        self.engine = create_async_db_engine(f"sqlite:///{tmp_path / 'ws.db'}")
+        SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        async def seed():
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with SessionLocal() as db:
+                db.add(Store(id=1, name="Store 1"))
+                db.add(Store(id=2, name="Store 2"))
+                db.add(Table(id=1, store_id=1, table_number="T1", qr_code="WS-QR1", is_active=True))
+                db.add(Table(id=2, store_id=1, table_number="T2", qr_code="WS-QR2", is_active=True))
+                db.add(Table(id=3, store_id=2, table_number="T1", qr_code="WS-QR3", is_active=True))
+                db.add(TableSession(id=1, table_id=1, session_token="ws-token-1", started_at=datetime.utcnow()))
+                db.add(TableSession(id=2, table_id=2, session_token="ws-token-2", started_at=datetime.utcnow()))
+                db.add(TableSession(id=3, table_id=3, session_token="ws-token-3", started_at=datetime.utcnow()))
+                db.add(TableSession(
+                    id=4, table_id=1, session_token="ws-token-ended",
+                    started_at=datetime.utcnow(), ended_at=datetime.utcnow()
+                ))
+                await db.commit()
+
+        asyncio.run(seed())
+
+        self.bus = OrderEventBus()
+        self.manager = ConnectionManager()
+        monkeypatch.setattr(websocket_router, "AsyncSessionLocal", SessionLocal)
+        monkeypatch.setattr(websocket_router, "order_events", self.bus)
+        monkeypatch.setattr(websocket_router, "customer_manager", self.manager)
+        monkeypatch.setattr(websocket_router, "session_handlers", {})
+
+        yield
+
+        asyncio.run(self.engine.dispose())
+
+    async def _open(self, session_token: str):
+        """Connect a fake tablet and let the endpoint subscribe it"""
+        ws = FakeWebSocket()
+        task = asyncio.create_task(websocket_router.customer_websocket_endpoint(ws, session_token))
+        # The session lookup runs on the database driver's thread
+        while not task.done() and not any(ws in sockets for sockets in self.manager.active_connections.values()):
+            await asyncio.sleep(0.01)
+        return ws, task
+
+    def test_unknown_or_ended_session_is_rejected(self):
+        """Tokens that don't resolve to an active session are closed with 1008"""
+        async def scenario():
+            results = []
+            for token in ("no-such-token", "ws-token-ended"):
+                ws = FakeWebSocket()
+                await websocket_router.customer_websocket_endpoint(ws, token)
+                results.append(ws.closed_code)
+            return results
+
+        assert asyncio.run(scenario()) == [1008, 1008]
+        assert websocket_router.session_handlers == {}
+        assert not self.bus.has_subscribers(1)
+
+    def test_session_receives_only_its_own_events(self):
+        """Events for other sessions and other stores are not forwarded"""
+        async def scenario():
+            ws, task = await self._open("ws-token-1")
+
+            self.bus.publish(OrderEvent(OrderEventType.NEW_ORDER, 1, {"id": 10, "session_id": 1}))
+            self.bus.publish(OrderEvent(OrderEventType.NEW_ORDER, 1, {"id": 11, "session_id": 2}))
+            self.bus.publish(OrderEvent(OrderEventType.NEW_ORDER, 2, {"id": 12, "session_id": 3}))
+            # A forged event naming this session but published for another store
+            self.bus.publish(OrderEvent(OrderEventType.ORDER_UPDATE, 2, {"id": 13, "session_id": 1}))
+            self.bus.publish(OrderEvent(OrderEventType.ORDER_UPDATE, 1, {"id": 10, "session_id": 1}))
+            await _drain()
+
+            ws.hang_up()
+            await task
+            return ws
+
+        ws = asyncio.run(scenario())
+
+        assert [(m["type"], m["data"]["id"]) for m in map(json.loads, ws.sent)] == [
+            ("new_order", 10),
+            ("order_update", 10)
+        ]
+
+    def test_subscription_removed_after_last_tablet_disconnects(self):
+        """The bus handler stays while any tablet of the session is connected"""
+        async def scenario():
+            first, first_task = await self._open("ws-token-1")
+            second, second_task = await self._open("ws-token-1")
+            assert list(websocket_router.session_handlers) == [1]
+
+            first.hang_up()
+            await first_task
+            still_subscribed = self.bus.has_subscribers(1)
+
+            self.bus.publish(OrderEvent(OrderEventType.NEW_ORDER, 1, {"id": 10, "session_id": 1}))
+            await _drain()
+
+            second.hang_up()
+            await second_task
+            return still_subscribed, second
+
+        still_subscribed, second = asyncio.run(scenario())
+
+        assert still_subscribed
+        assert len(second.sent) == 1
+        assert websocket_router.session_handlers == {}
+        assert not self.bus.has_subscribers(1)
+        assert self.manager.active_connections == {}